@@ -1,5 +1,6 @@
 """OParl HTTP client module."""
 
-from src.client.oparl_client import OParlClient
+from src.client.oparl_client import ListCursor, OParlClient
+from src.client.validator_store import ValidatorStore
 
-__all__ = ["OParlClient"]
+__all__ = ["ListCursor", "OParlClient", "ValidatorStore"]
@@ -0,0 +1,107 @@
+"""
+Incremental decoding of OParl list pages.
+
+Decodes the items of a list page ("data" array) while the response body is
+still arriving, so a page never has to be held in memory as a whole.
+The small "links" and "pagination" objects are kept for traversal.
+
+Usage:
+    decoder = ListPageDecoder()
+    async for chunk in response.aiter_bytes():
+        for item in decoder.feed(chunk):
+            ...
+    decoder.close()
+    next_url = decoder.links.get("next")
+"""
+
+from typing import Any
+
+try:
+    import ijson
+    from ijson.common import ObjectBuilder
+
+    JSON_STREAMING_AVAILABLE = True
+except ImportError:
+    JSON_STREAMING_AVAILABLE = False
+
+# Prefixes of the values collected from a list page
+_ITEM_PREFIX = "data.item"
+_COLLECTED_PREFIXES = (_ITEM_PREFIX, "links", "pagination")
+
+_CONTAINER_START = ("start_map", "start_array")
+_CONTAINER_END = ("end_map", "end_array")
+
+
+class ListPageDecoder:
+    """
+    Push decoder for a single OParl list page.
+
+    Bytes are fed as they arrive; completed items of the "data" array are
+    returned by feed(). Raises ijson.JSONError on malformed input.
+    """
+
+    def __init__(self) -> None:
+        if not JSON_STREAMING_AVAILABLE:
+            raise RuntimeError("ijson is not installed, streaming decoding unavailable")
+
+        self._events = ijson.sendable_list()
+        self._parser = ijson.parse_coro(self._events, use_float=True)
+
+        self._builder: ObjectBuilder | None = None
+        self._builder_prefix = ""
+        self._depth = 0
+        self._items: list[Any] = []
+
+        self.links: dict[str, Any] = {}
+        self.pagination: dict[str, Any] = {}
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Decode a chunk of the response body and return the completed items."""
+        self._parser.send(chunk)
+        return self._drain()
+
+    def close(self) -> list[Any]:
+        """Finish decoding and return the remaining items (raises on truncated input)."""
+        self._parser.close()
+        return self._drain()
+
+    def _drain(self) -> list[Any]:
+        for prefix, event, value in self._events:
+            self._handle(prefix, event, value)
+        del self._events[:]
+
+        items, self._items = self._items, []
+        return items
+
+    def _handle(self, prefix: str, event: str, value: Any) -> None:
+        if self._builder is not None:
+            # Inside a collected value - feed until its container is closed
+            self._builder.event(event, value)
+            if event in _CONTAINER_START:
+                self._depth += 1
+            elif event in _CONTAINER_END:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._collect(self._builder_prefix, self._builder.value)
+                    self._builder = None
+            return
+
+        if prefix not in _COLLECTED_PREFIXES or event == "map_key":
+            return
+
+        if event in _CONTAINER_START:
+            self._builder = ObjectBuilder()
+            self._builder.event(event, value)
+            self._builder_prefix = prefix
+            self._depth = 1
+        elif event not in _CONTAINER_END:
+            # Scalar value (e.g. an item given as URL string)
+            self._collect(prefix, value)
+
+    def _collect(self, prefix: str, value: Any) -> None:
+        if prefix == _ITEM_PREFIX:
+            self._items.append(value)
+        elif prefix == "links" and isinstance(value, dict):
+            self.links = value
+        elif prefix == "pagination" and isinstance(value, dict):
+            self.pagination = value
@@ -4,9 +4,12 @@ OParl HTTP Client - High-Performance Async Client
 Features:
 - Async HTTP with connection pooling
 - Concurrent request handling with semaphore
-- ETag and If-Modified-Since caching
+- Parallel page fetching for page-numbered lists
+- Streaming decoding of list pages (bounded memory)
+- ETag and If-Modified-Since caching (optionally persisted between runs)
+- Server-side modified_since filtering (with capability probe)
 - Exponential backoff retry
-- Rate limiting
+- Adaptive per-host concurrency and rate limiting (AIMD)
 - Circuit breaker for resilience
 - Prometheus metrics
 """
@@ -14,17 +17,25 @@ Features:
 import asyncio
 import hashlib
 import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import aclosing, nullcontext
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Any, AsyncIterator
-from urllib.parse import urlparse
+from datetime import UTC, datetime
+from functools import partial
+from itertools import islice
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
 import httpx
 from rich.console import Console
 
 from src.circuit_breaker import CircuitBreaker, CircuitBreakerConfig, CircuitOpenError
+from src.client.json_stream import JSON_STREAMING_AVAILABLE, ListPageDecoder
+from src.client.validator_store import ValidatorStore
 from src.config import settings
 from src.metrics import metrics
+from src.rate_limiter import HostLimiter, HostLimiterConfig
 
 console = Console()
 
@@ -39,6 +50,41 @@ class FetchResult:
     from_cache: bool = False
     error: str | None = None
     fetch_time: float = 0.0
+    response: httpx.Response | None = None  # Unread response body (stream mode)
+
+
+@dataclass
+class ListCursor:
+    """
+    Position of a list traversal, updated by fetch_list before each yield.
+
+    resume_url is the first URL that is not yet completely yielded: once the
+    yielded items are stored, a traversal started there repeats nothing.
+
+    finished_urls collects the pages whose items have all been yielded. The
+    caller takes them with the next yielded items and passes them to
+    OParlClient.commit_validators once those items are stored.
+    """
+
+    resume_url: str | None = None
+    complete: bool = False  # The list was traversed to its end without errors
+    finished_urls: list[str] = field(default_factory=list)
+
+    def take_finished(self) -> list[str]:
+        """Return and reset the pages finished since the last call."""
+        urls, self.finished_urls = self.finished_urls, []
+        return urls
+
+
+@dataclass
+class StreamedPage:
+    """Metadata of a list page decoded incrementally (filled while streaming)."""
+
+    url: str
+    from_cache: bool = False
+    error: str | None = None
+    links: dict[str, Any] = field(default_factory=dict)
+    pagination: dict[str, Any] = field(default_factory=dict)
 
 
 @dataclass
@@ -77,7 +123,7 @@ class OParlClient:
     - ETag caching for bandwidth efficiency
     - If-Modified-Since header support
     - Exponential backoff retry logic
-    - Rate limiting between requests
+    - Adaptive per-host concurrency and request rate
     - Circuit breaker for resilience
     - Prometheus metrics collection
     """
@@ -88,6 +134,7 @@ class OParlClient:
         timeout: int | None = None,
         wait_time: float | None = None,
         source_name: str | None = None,
+        validator_store: ValidatorStore | None = None,
     ) -> None:
         self.max_concurrent = max_concurrent
         self.timeout = timeout or settings.oparl_request_timeout
@@ -96,9 +143,18 @@ class OParlClient:
         self.retry_backoff = settings.oparl_retry_backoff
         self.source_name = source_name or "unknown"
 
-        # Caching
-        self.etag_cache: dict[str, str] = {}
-        self.modified_cache: dict[str, str] = {}
+        # Caching - with a validator store the dicts are shared with it and
+        # survive between runs, otherwise they only live for this client.
+        # next_link_cache maps a page to its links.next ("" for the last page).
+        self.validator_store = validator_store
+        if validator_store:
+            self.etag_cache: dict[str, str] = validator_store.etags
+            self.modified_cache: dict[str, str] = validator_store.last_modified
+            self.next_link_cache: dict[str, str] = validator_store.next_urls
+        else:
+            self.etag_cache = {}
+            self.modified_cache = {}
+            self.next_link_cache = {}
 
         # Concurrency control
         self._semaphore: asyncio.Semaphore | None = None
@@ -112,6 +168,20 @@ class OParlClient:
             success_threshold=settings.circuit_breaker_success_threshold,
         )
 
+        # Adaptive limits per source host (within the global semaphore)
+        self._host_limiters: dict[str, HostLimiter] = {}
+        self._host_limiter_config = HostLimiterConfig(
+            initial_concurrency=min(settings.oparl_host_initial_concurrency, max_concurrent),
+            max_concurrency=max_concurrent,
+            initial_rate=(
+                min(1 / self.wait_time, settings.oparl_host_max_rate)
+                if self.wait_time > 0
+                else settings.oparl_host_max_rate
+            ),
+            max_rate=settings.oparl_host_max_rate,
+            latency_threshold=settings.oparl_host_latency_threshold,
+        )
+
         # Statistics
         self.stats = SyncStats()
 
@@ -132,6 +202,7 @@ class OParlClient:
         )
         self.stats = SyncStats()
         self._circuit_breakers = {}
+        self._host_limiters = {}
         return self
 
     def _get_circuit_breaker(self, url: str) -> CircuitBreaker:
@@ -151,8 +222,27 @@ class OParlClient:
             )
         return self._circuit_breakers[host]
 
+    def _get_host_limiter(self, url: str) -> HostLimiter | None:
+        """Get or create the adaptive limiter for URL's host (None if disabled)."""
+        if not settings.oparl_adaptive_limits_enabled:
+            return None
+
+        host = urlparse(url).netloc
+        if host not in self._host_limiters:
+            self._host_limiters[host] = HostLimiter(
+                name=host,
+                config=self._host_limiter_config,
+            )
+        return self._host_limiters[host]
+
+    def get_host_limits(self) -> list[dict[str, Any]]:
+        """Get the current adaptive limits of all hosts."""
+        return [limiter.get_status() for limiter in self._host_limiters.values()]
+
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Async context manager exit."""
+        if self.validator_store:
+            await self.validator_store.flush()
         if self._client:
             await self._client.aclose()
             self._client = None
@@ -177,18 +267,23 @@ class OParlClient:
         if not self._client or not self._semaphore:
             raise RuntimeError("Client not initialized. Use 'async with' context manager.")
 
-        async with self._semaphore:
-            return await self._fetch_with_retry(url, use_cache, skip_wait)
+        # Take the host slot first so a slow host doesn't hold global slots
+        limiter = self._get_host_limiter(url)
+        async with limiter.slot() if limiter else nullcontext():
+            async with self._semaphore:
+                return await self._fetch_with_retry(url, use_cache, skip_wait)
 
     async def _fetch_with_retry(
         self,
         url: str,
         use_cache: bool,
         skip_wait: bool,
+        stream: bool = False,
     ) -> FetchResult:
         """Fetch with exponential backoff retry and circuit breaker."""
         last_error: str | None = None
         circuit_breaker = self._get_circuit_breaker(url)
+        do_fetch = partial(self._do_fetch, stream=True) if stream else self._do_fetch
 
         # Check if circuit is open
         try:
@@ -196,7 +291,7 @@ class OParlClient:
             for attempt in range(self.max_retries):
                 try:
                     result = await circuit_breaker.call(
-                        self._do_fetch, url, use_cache, skip_wait
+                        do_fetch, url, use_cache, skip_wait
                     )
                     return result
 
@@ -214,7 +309,7 @@ class OParlClient:
                 except httpx.HTTPStatusError as e:
                     if e.response.status_code == 404:
                         return FetchResult(url=url, data=None, status_code=404, error="Not found")
-                    if e.response.status_code >= 500:
+                    if e.response.status_code >= 500 or e.response.status_code == 429:
                         last_error = f"HTTP {e.response.status_code}"
                         metrics.record_http_error(self.source_name, f"http_{e.response.status_code}")
                     else:
@@ -252,27 +347,51 @@ class OParlClient:
         url: str,
         use_cache: bool,
         skip_wait: bool,
+        stream: bool = False,
     ) -> FetchResult:
-        """Perform the actual HTTP fetch with metrics."""
+        """
+        Perform the actual HTTP fetch with metrics.
+
+        With stream, the body is not read: the open response is returned in
+        FetchResult.response and the caller must close it. Validators are
+        then recorded by the caller once the body has been decoded.
+        """
         assert self._client is not None
 
         headers: dict[str, str] = {}
 
         # Add caching headers
         if use_cache:
+            if self.validator_store:
+                await self.validator_store.ensure_loaded(url)
             if settings.oparl_etag_cache_enabled and url in self.etag_cache:
                 headers["If-None-Match"] = self.etag_cache[url]
             if settings.oparl_modified_since_enabled and url in self.modified_cache:
                 headers["If-Modified-Since"] = self.modified_cache[url]
 
-        # Rate limiting
-        if not skip_wait and self.wait_time > 0:
-            await asyncio.sleep(self.wait_time)
+        # Rate limiting - adaptive per host, or a fixed wait between requests
+        limiter = self._get_host_limiter(url)
+        if not skip_wait:
+            if limiter:
+                await limiter.wait_for_token()
+            elif self.wait_time > 0:
+                await asyncio.sleep(self.wait_time)
 
         start = time.time()
-        response = await self._client.get(url, headers=headers)
+        request = self._client.build_request("GET", url, headers=headers)
+        try:
+            response = await self._client.send(request, stream=stream)
+        except httpx.TimeoutException:
+            if limiter:
+                limiter.record_timeout()
+            raise
         fetch_time = time.time() - start
 
+        if limiter:
+            limiter.record_response(
+                response.status_code, fetch_time, response.headers.get("Retry-After")
+            )
+
         self.stats.http_requests += 1
         self.stats.http_time += fetch_time
 
@@ -288,6 +407,7 @@ class OParlClient:
         # Not modified - cache hit
         if response.status_code == 304:
             self.stats.cache_hits += 1
+            await response.aclose()
             return FetchResult(
                 url=url,
                 data=None,
@@ -296,74 +416,378 @@ class OParlClient:
                 fetch_time=fetch_time,
             )
 
+        if response.is_error:
+            await response.aclose()
         response.raise_for_status()
 
+        if stream:
+            return FetchResult(
+                url=url,
+                data=None,
+                status_code=response.status_code,
+                fetch_time=fetch_time,
+                response=response,
+            )
+
+        data = response.json()
+
         # Update cache
-        if "ETag" in response.headers:
-            self.etag_cache[url] = response.headers["ETag"]
-        if "Last-Modified" in response.headers:
-            self.modified_cache[url] = response.headers["Last-Modified"]
+        links = data.get("links") if isinstance(data, dict) else None
+        await self._remember_validators(url, response, links)
 
         return FetchResult(
             url=url,
-            data=response.json(),
+            data=data,
             status_code=response.status_code,
             fetch_time=fetch_time,
         )
 
+    async def _remember_validators(
+        self,
+        url: str,
+        response: httpx.Response,
+        links: dict[str, Any] | None,
+    ) -> None:
+        """
+        Cache ETag/Last-Modified and links.next of a completely read response.
+
+        The values are only kept in memory here. They are written to the
+        validator store by commit_validators, once the caller has stored the
+        page - otherwise a page whose write failed would be answered with
+        304 on the next run and never be written.
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag:
+            self.etag_cache[url] = etag
+        if last_modified:
+            self.modified_cache[url] = last_modified
+        next_url = links.get("next") if isinstance(links, dict) else None
+        self.next_link_cache[url] = next_url or ""
+
+    async def commit_validators(self, urls: list[str]) -> None:
+        """Persist the validators of list pages whose items have been stored."""
+        if not self.validator_store:
+            return
+        for url in urls:
+            etag = self.etag_cache.get(url)
+            last_modified = self.modified_cache.get(url)
+            if etag or last_modified:
+                await self.validator_store.record(
+                    url, etag, last_modified, self.next_link_cache.get(url) or None
+                )
+
+    async def _stream_page(
+        self,
+        page: StreamedPage,
+        use_cache: bool = False,
+        chunk_size: int | None = None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """
+        Fetch a list page and yield its items while the body is decoded.
+
+        Items are yielded in lists of at most chunk_size; a page with fewer
+        items is yielded as one list, like the non-streaming path. Errors are
+        reported in page.error instead of being raised. The HTTP connection
+        stays reserved (semaphore) until the body is consumed.
+        """
+        if not self._client or not self._semaphore:
+            raise RuntimeError("Client not initialized. Use 'async with' context manager.")
+
+        chunk_size = max(chunk_size or settings.oparl_stream_chunk_size, 1)
+
+        limiter = self._get_host_limiter(page.url)
+        async with limiter.slot() if limiter else nullcontext(), self._semaphore:
+            result = await self._fetch_with_retry(page.url, use_cache, False, stream=True)
+            if result.error or result.response is None:
+                page.error = result.error
+                page.from_cache = result.from_cache
+                return
+
+            response = result.response
+            decoder = ListPageDecoder()
+            batch: list[dict[str, Any]] = []
+            try:
+                async for chunk in response.aiter_bytes():
+                    batch.extend(decoder.feed(chunk))
+                    while len(batch) >= chunk_size:
+                        items, batch = batch[:chunk_size], batch[chunk_size:]
+                        self.stats.objects_processed += len(items)
+                        yield items
+                batch.extend(decoder.close())
+            except (httpx.RequestError, httpx.TimeoutException) as e:
+                error_type = "timeout" if isinstance(e, httpx.TimeoutException) else "request_error"
+                metrics.record_http_error(self.source_name, error_type)
+                self.stats.errors += 1
+                page.error = f"Body read failed: {e}"
+                return
+            except Exception as e:
+                # Malformed or truncated JSON
+                metrics.record_http_error(self.source_name, "decode_error")
+                self.stats.errors += 1
+                page.error = f"Invalid JSON: {e}"
+                return
+            finally:
+                await response.aclose()
+
+            if batch:
+                self.stats.objects_processed += len(batch)
+                yield batch
+
+            page.links = decoder.links
+            page.pagination = decoder.pagination
+            await self._remember_validators(page.url, response, decoder.links)
+
     async def fetch_list(
         self,
         url: str,
         modified_since: datetime | None = None,
         max_pages: int | None = None,
+        use_cache: bool = False,
+        stream: bool | None = None,
+        cursor: ListCursor | None = None,
     ) -> AsyncIterator[list[dict[str, Any]]]:
         """
         Fetch a paginated OParl list.
 
-        Yields pages of items as they are fetched.
+        Yields pages of items in list order. If the first page announces
+        pagination.totalPages and links.next uses a ?page=N parameter, the
+        remaining pages are requested concurrently (bounded by max_concurrent).
+        Cursor-style lists are traversed sequentially via links.next.
+
+        With use_cache, pages are requested conditionally. Pages answered with
+        304 Not Modified are skipped; traversal continues with the next link
+        remembered from the previous fetch. If that link is unknown, the page
+        is requested again without validators.
+
+        With stream, items are decoded incrementally from the response body
+        and yielded in lists of at most settings.oparl_stream_chunk_size, so
+        memory stays bounded regardless of page size. Pages are then fetched
+        one after another (parallel fetching would have to buffer pages).
+
+        With modified_since, the OParl modified_since filter is added to the
+        first request; following pages are taken from links.next, which
+        carries the filter. Only pass it for servers that support the filter
+        (see probe_modified_since) - others silently return the full list.
 
         Args:
             url: The list URL
-            modified_since: Only fetch items modified after this date (used for filtering, not query param)
+            modified_since: Only fetch items modified after this date (query parameter)
             max_pages: Maximum number of pages to fetch (for incremental sync)
+            use_cache: Send ETag/If-Modified-Since and skip unchanged pages
+            stream: Decode pages incrementally (default: settings.oparl_streaming_enabled)
+            cursor: Updated with the resume position before each yield (checkpoints)
 
         Yields:
             Lists of items from each page
         """
-        current_url: str | None = url
+        current_url: str | None = (
+            self._with_modified_since(url, modified_since) if modified_since else url
+        )
         pages_fetched = 0
+        unconditional_url: str | None = None  # 304 page whose next link is unknown
 
-        # NOTE: We do NOT use modified_since as query parameter because:
-        # 1. Not all OParl servers support it
-        # 2. New items appear on page 1 and push old items to later pages
-        # Instead, we fetch the first N pages and check each item's modified date
+        if stream is None:
+            stream = settings.oparl_streaming_enabled and JSON_STREAMING_AVAILABLE
 
         while current_url:
-            result = await self.fetch(current_url, use_cache=False)
-
-            if result.error:
-                console.print(f"[red]Error fetching {current_url}: {result.error}[/red]")
+            conditional = use_cache and current_url != unconditional_url
+            if stream:
+                page = StreamedPage(url=current_url)
+                async with aclosing(self._stream_page(page, conditional)) as chunks:
+                    async for items in chunks:
+                        # The page's links are only known once it is decoded
+                        if cursor:
+                            cursor.resume_url = page.url
+                        yield items
+                error, from_cache = page.error, page.from_cache
+                data: dict[str, Any] | None = {"links": page.links, "pagination": page.pagination}
+                if cursor and not error and not from_cache:
+                    cursor.finished_urls.append(page.url)
+            else:
+                result = await self.fetch(current_url, use_cache=conditional)
+                error, from_cache, data = result.error, result.from_cache, result.data
+
+            if error:
+                console.print(f"[red]Error fetching {current_url}: {error}[/red]")
                 break
 
-            if result.data is None:
+            if from_cache:
+                if current_url not in self.next_link_cache:
+                    if current_url == unconditional_url:
+                        break
+                    # Next link unknown - request the page again without validators
+                    unconditional_url = current_url
+                    continue
+                # Page unchanged since the last run - nothing to yield
+                self.stats.pages_fetched += 1
+                pages_fetched += 1
+                if max_pages and pages_fetched >= max_pages:
+                    break
+                current_url = self.next_link_cache[current_url] or None
+                continue
+
+            if data is None:
                 break
 
             self.stats.pages_fetched += 1
             pages_fetched += 1
 
-            # Extract data - OParl uses "data" for list items
-            items = result.data.get("data", [])
-            if items:
-                self.stats.objects_processed += len(items)
-                yield items
+            if not stream:
+                # Extract data - OParl uses "data" for list items
+                items = data.get("data", [])
+                if cursor:
+                    cursor.finished_urls.append(current_url)
+                if items:
+                    self.stats.objects_processed += len(items)
+                    if cursor:
+                        cursor.resume_url = (data.get("links") or {}).get("next")
+                    yield items
 
             # Check if we've reached max pages (for incremental sync)
             if max_pages and pages_fetched >= max_pages:
                 break
 
+            # Page-numbered lists: fetch the rest concurrently
+            if pages_fetched == 1 and not stream and settings.oparl_parallel_pages_enabled:
+                page_urls = self._get_page_urls(data)
+                if page_urls:
+                    if max_pages:
+                        page_urls = page_urls[:max_pages - pages_fetched]
+                    async for items in self._fetch_pages_concurrently(
+                        page_urls, use_cache, cursor
+                    ):
+                        yield items
+                    break
+
             # Get next page URL
-            links = result.data.get("links", {})
+            links = data.get("links") or {}
             current_url = links.get("next")
+        else:
+            if cursor:
+                cursor.complete = True
+
+    @staticmethod
+    def _with_modified_since(url: str, modified_since: datetime) -> str:
+        """Add the OParl modified_since filter to a list URL."""
+        if modified_since.tzinfo is None:
+            modified_since = modified_since.replace(tzinfo=UTC)
+        parsed = urlparse(url)
+        query = [
+            (key, value)
+            for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+            if key != "modified_since"
+        ]
+        query.append(("modified_since", modified_since.isoformat(timespec="seconds")))
+        return urlunparse(parsed._replace(query=urlencode(query)))
+
+    async def probe_modified_since(self, list_url: str) -> bool | None:
+        """
+        Check whether a server applies the modified_since list filter.
+
+        Requests the list once unfiltered and once filtered to "now". A server
+        that supports the filter returns an empty list for the latter, one that
+        ignores it returns the same items again.
+
+        Returns:
+            True/False, or None if the probe was inconclusive (empty list, errors)
+        """
+        unfiltered = await self.fetch(list_url, use_cache=False)
+        if unfiltered.error or not unfiltered.data or not unfiltered.data.get("data"):
+            return None
+
+        filtered = await self.fetch(
+            self._with_modified_since(list_url, datetime.now(UTC)), use_cache=False
+        )
+        if filtered.status_code in (400, 422):
+            # Parameter rejected
+            return False
+        if filtered.error or filtered.data is None:
+            return None
+        return not filtered.data.get("data")
+
+    def _get_page_urls(self, data: dict[str, Any]) -> list[str] | None:
+        """
+        Build the URLs of all remaining pages of a page-numbered list.
+
+        Returns None if the list doesn't expose pagination.totalPages or if
+        links.next doesn't follow the ?page=N scheme (e.g. cursor pagination).
+        """
+        pagination = data.get("pagination") or {}
+        total_pages = pagination.get("totalPages")
+        current_page = pagination.get("currentPage")
+        next_url = (data.get("links") or {}).get("next")
+
+        if not isinstance(total_pages, int) or not isinstance(current_page, int) or not next_url:
+            return None
+
+        parsed = urlparse(next_url)
+        query = parse_qsl(parsed.query, keep_blank_values=True)
+        if ("page", str(current_page + 1)) not in query:
+            return None
+
+        return [
+            urlunparse(parsed._replace(query=urlencode([
+                (key, str(page) if key == "page" else value) for key, value in query
+            ])))
+            for page in range(current_page + 1, total_pages + 1)
+        ]
+
+    async def _fetch_pages_concurrently(
+        self,
+        urls: list[str],
+        use_cache: bool = False,
+        cursor: ListCursor | None = None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """
+        Fetch list pages concurrently and yield their items in order.
+
+        At most max_concurrent pages are in flight (or buffered) at a time;
+        each request still goes through the semaphore and circuit breaker.
+        Stops at the first failed page, like sequential traversal.
+        """
+        remaining = iter(urls)
+        pending: deque[asyncio.Task[FetchResult]] = deque(
+            asyncio.create_task(self.fetch(page_url, use_cache=use_cache))
+            for page_url in islice(remaining, self.max_concurrent)
+        )
+
+        position = 0
+        try:
+            while pending:
+                result = await pending.popleft()
+                position += 1
+
+                next_url = next(remaining, None)
+                if next_url:
+                    pending.append(asyncio.create_task(self.fetch(next_url, use_cache=use_cache)))
+
+                if result.error:
+                    console.print(f"[red]Error fetching {result.url}: {result.error}[/red]")
+                    break
+
+                self.stats.pages_fetched += 1
+                if result.from_cache:
+                    continue
+
+                if result.data is None:
+                    break
+
+                items = result.data.get("data", [])
+                if cursor:
+                    cursor.finished_urls.append(result.url)
+                if items:
+                    self.stats.objects_processed += len(items)
+                    if cursor:
+                        cursor.resume_url = urls[position] if position < len(urls) else None
+                    yield items
+            else:
+                if cursor:
+                    cursor.complete = True
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
 
     async def fetch_list_all(
         self,
@@ -376,7 +800,7 @@ class OParlClient:
 
         Args:
             url: The list URL
-            modified_since: Only fetch items modified after this date (for filtering)
+            modified_since: Only fetch items modified after this date (query parameter)
             max_pages: Maximum number of pages to fetch
 
         Returns:
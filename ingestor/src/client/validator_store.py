@@ -0,0 +1,131 @@
+"""
+Persistent HTTP Validator Store
+
+Keeps ETag / Last-Modified validators of OParl list pages across sync runs,
+so conditional requests can be answered with 304 Not Modified even after a
+restart of the daemon or a new scheduler tick.
+
+Validators are loaded lazily per host on first use and written back in
+batches of settings.oparl_validator_flush_size entries. A page's validators
+are only recorded once its items have been stored (commit_validators).
+
+Usage:
+    store = ValidatorStore(storage)
+    async with OParlClient(validator_store=store) as client:
+        cursor = ListCursor()
+        async for page in client.fetch_list(url, use_cache=True, cursor=cursor):
+            finished = cursor.take_finished()
+            ...  # store the page
+            await client.commit_validators(finished)
+"""
+
+import asyncio
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlparse
+
+from rich.console import Console
+
+from src.config import settings
+
+if TYPE_CHECKING:
+    from src.storage.database import DatabaseStorage
+
+console = Console()
+
+
+class ValidatorStore:
+    """
+    Write-behind cache of HTTP validators backed by PostgreSQL.
+
+    The dicts etags, last_modified and next_urls are shared with OParlClient
+    (they replace its per-session etag_cache / modified_cache).
+    """
+
+    def __init__(
+        self,
+        storage: "DatabaseStorage",
+        flush_size: int | None = None,
+        max_age_days: int | None = None,
+    ) -> None:
+        """
+        Initialize the validator store.
+
+        Args:
+            storage: Database storage used for loading and flushing
+            flush_size: Number of changed entries that triggers a flush
+            max_age_days: Ignore validators older than this (forces a refetch)
+        """
+        self.storage = storage
+        self.flush_size = flush_size or settings.oparl_validator_flush_size
+        self.max_age = timedelta(days=max_age_days or settings.oparl_validator_max_age_days)
+
+        self.etags: dict[str, str] = {}
+        self.last_modified: dict[str, str] = {}
+        self.next_urls: dict[str, str] = {}
+
+        self._loaded_hosts: set[str] = set()
+        self._dirty: dict[str, dict[str, Any]] = {}
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def _host_prefix(url: str) -> str:
+        parsed = urlparse(url)
+        return f"{parsed.scheme}://{parsed.netloc}/"
+
+    async def ensure_loaded(self, url: str) -> None:
+        """Load all stored validators of the URL's host (once per host)."""
+        prefix = self._host_prefix(url)
+        if prefix in self._loaded_hosts:
+            return
+
+        async with self._lock:
+            if prefix in self._loaded_hosts:
+                return
+            try:
+                rows = await self.storage.get_http_validators(prefix, self.max_age)
+            except Exception as e:
+                # Conditional requests are an optimization - never fail the fetch
+                console.print(f"[yellow]Could not load HTTP validators: {e}[/yellow]")
+                rows = []
+
+            for row in rows:
+                # Values set during this run take precedence
+                if row.etag:
+                    self.etags.setdefault(row.url, row.etag)
+                if row.last_modified:
+                    self.last_modified.setdefault(row.url, row.last_modified)
+                # "" marks the last page of a list (no links.next)
+                self.next_urls.setdefault(row.url, row.next_url or "")
+            self._loaded_hosts.add(prefix)
+
+    async def record(
+        self,
+        url: str,
+        etag: str | None,
+        last_modified: str | None,
+        next_url: str | None,
+    ) -> None:
+        """Remember the validators of a stored page and flush if the batch is full."""
+        self.next_urls[url] = next_url or ""
+
+        self._dirty[url] = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "next_url": next_url,
+        }
+        if len(self._dirty) >= self.flush_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write all changed validators to the database."""
+        if not self._dirty:
+            return
+
+        rows = list(self._dirty.values())
+        self._dirty.clear()
+        try:
+            await self.storage.upsert_http_validators(rows)
+        except Exception as e:
+            console.print(f"[yellow]Could not store HTTP validators: {e}[/yellow]")
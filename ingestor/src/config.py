@@ -52,10 +52,30 @@ class Settings(BaseSettings):
     oparl_wait_time: float = 0.05  # Seconds between requests (reduced from 0.2)
     oparl_etag_cache_enabled: bool = True
     oparl_modified_since_enabled: bool = True
+    # Use the modified_since list filter where the server supports it
+    oparl_modified_since_filter_enabled: bool = True
+    # Re-request changes this long before the last sync (clock skew)
+    oparl_modified_since_overlap_minutes: int = 10
+    oparl_validator_store_enabled: bool = True  # Persist ETag/Last-Modified between runs
+    oparl_validator_max_age_days: int = 7  # Refetch unchanged pages at least this often
+    oparl_validator_flush_size: int = 500  # Changed validators per database write
     oparl_max_concurrent: int = 20  # Concurrent HTTP requests
+    # Per-host AIMD concurrency/rate instead of the fixed wait_time
+    oparl_adaptive_limits_enabled: bool = True
+    oparl_host_initial_concurrency: int = 4  # Start value, grows up to max_concurrent per host
+    oparl_host_max_rate: float = 50.0  # Upper bound for requests per second per host
+    oparl_host_latency_threshold: float = 10.0  # Slower responses (seconds) reduce the limits
+    oparl_parallel_pages_enabled: bool = True  # Fetch ?page=N lists concurrently
+    # Decode list pages incrementally (needs ijson, pages are fetched sequentially)
+    oparl_streaming_enabled: bool = False
+    oparl_stream_chunk_size: int = 100  # Max items per yielded batch when streaming
 
     # Parallel Processing
     max_workers: int = 8  # Increased from 4
+    sync_pipeline_depth: int = 4  # Pages buffered between fetch, process and store stages
+    sync_task_budget: int = 16  # Entity-type tasks running at once over all bodies of a source
+    sync_skip_unchanged: bool = True  # Don't rewrite rows whose content hash is unchanged
+    resolver_cache_size: int = 200_000  # external_id -> UUID entries kept for references (LRU)
 
     # File Storage
     file_storage_path: str = "./data/files"
@@ -69,6 +89,9 @@ class Settings(BaseSettings):
     # Event Emission Settings
     events_enabled: bool = True  # Enable Redis event emission
     events_batch_size: int = 50  # Batch size for entity events
+    # "pubsub" (fire-and-forget) or "streams" (durable, consumer groups)
+    events_transport: str = "pubsub"
+    events_stream_maxlen: int = 100_000  # Approximate max entries kept per stream (XADD MAXLEN ~)
 
     # Metrics Settings
     metrics_enabled: bool = True  # Enable Prometheus metrics
@@ -1,9 +1,17 @@
 """
 Redis Event Emission Module
 
-Publishes sync events to Redis Pub/Sub channels for real-time notifications.
+Publishes sync events to Redis for real-time notifications.
 Django backend or other services can subscribe to these events.
 
+Transports (settings.events_transport):
+- pubsub - PUBLISH to channels, fire-and-forget: events are lost while no
+  subscriber is connected
+- streams - XADD to streams of the same names, trimmed with MAXLEN ~.
+  Readers use consumer groups (EventStreamReader; Django's index_events
+  --streams has a synchronous counterpart), so they catch up after restarts
+  and can share the work across several workers
+
 Event Types:
 - sync:started - Sync operation started
 - sync:completed - Sync operation completed
@@ -11,10 +19,15 @@ Event Types:
 - entity:created - New entity synced
 - entity:updated - Existing entity updated
 - entity:batch - Batch of entities synced (aggregated)
+
+Batch events carry at most ENTITY_IDS_PER_EVENT IDs; larger batches are
+split into several events. entity_ids are OParl external IDs for batched
+entity:created events and internal UUIDs for emit_entities_changed().
 """
 
 import json
-from dataclasses import asdict, dataclass, field
+import socket
+from dataclasses import asdict, dataclass, field, fields
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Any
@@ -26,6 +39,12 @@ from src.config import settings
 
 console = Console()
 
+# Maximum number of IDs in one batch event
+ENTITY_IDS_PER_EVENT = 100
+
+# Field of a stream entry holding the JSON event
+STREAM_FIELD = "event"
+
 
 class EventType(str, Enum):
     """Event types for sync operations."""
@@ -72,10 +91,17 @@ class SyncEvent:
         data = {k: v for k, v in asdict(self).items() if v is not None}
         return json.dumps(data, default=str)
 
+    @classmethod
+    def from_json(cls, data: str) -> "SyncEvent":
+        """Create an event from its JSON string (unknown keys are ignored)."""
+        values = json.loads(data)
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in values.items() if k in known})
+
 
 class EventEmitter:
     """
-    Emits sync events to Redis Pub/Sub.
+    Emits sync events to Redis Pub/Sub or Redis Streams.
 
     Usage:
         async with EventEmitter() as emitter:
@@ -85,23 +111,32 @@ class EventEmitter:
             await emitter.emit_sync_completed(...)
     """
 
-    # Redis channel names
+    # Redis channel names (also the stream keys of the streams transport)
     CHANNEL_SYNC = "mandari:sync"
     CHANNEL_ENTITIES = "mandari:entities"
 
-    def __init__(self, redis_url: str | None = None, enabled: bool = True) -> None:
+    def __init__(
+        self,
+        redis_url: str | None = None,
+        enabled: bool = True,
+        transport: str | None = None,
+    ) -> None:
         """
         Initialize the event emitter.
 
         Args:
             redis_url: Redis connection URL (default from settings)
             enabled: Whether to emit events (can be disabled for testing)
+            transport: "pubsub" or "streams" (default from settings)
         """
         self.redis_url = redis_url or settings.redis_url
         self.enabled = enabled and settings.events_enabled
+        self.transport = transport or settings.events_transport
+        if self.transport not in ("pubsub", "streams"):
+            raise ValueError(f"Unknown event transport: {self.transport!r}")
         self._client: redis.Redis | None = None
         self._batch_buffer: list[SyncEvent] = []
-        self._batch_size = 50  # Emit batch event after N entities
+        self._batch_size = settings.events_batch_size  # Emit batch event after N entities
 
     async def __aenter__(self) -> "EventEmitter":
         """Async context manager entry."""
@@ -132,11 +167,26 @@ class EventEmitter:
 
     async def _publish(self, channel: str, event: SyncEvent) -> None:
         """Publish event to Redis channel."""
-        if not self.enabled or not self._client:
+        await self._publish_many(channel, [event])
+
+    async def _publish_many(self, channel: str, events: list[SyncEvent]) -> None:
+        """Publish events to a Redis channel/stream in one pipelined round-trip."""
+        if not self.enabled or not self._client or not events:
             return
 
         try:
-            await self._client.publish(channel, event.to_json())
+            async with self._client.pipeline(transaction=False) as pipe:
+                for event in events:
+                    if self.transport == "streams":
+                        pipe.xadd(
+                            channel,
+                            {STREAM_FIELD: event.to_json()},
+                            maxlen=settings.events_stream_maxlen,
+                            approximate=True,
+                        )
+                    else:
+                        pipe.publish(channel, event.to_json())
+                await pipe.execute()
         except Exception as e:
             # Don't fail sync because of event emission
             console.print(f"[yellow]Failed to emit event: {e}[/yellow]")
@@ -152,17 +202,31 @@ class EventEmitter:
             if event.entity_type and event.entity_external_id:
                 by_type.setdefault(event.entity_type, []).append(event.entity_external_id)
 
-        # Emit batch events per type
-        for entity_type, ids in by_type.items():
-            batch_event = SyncEvent(
+        # Emit batch events per type, all in one round-trip
+        self._batch_buffer.clear()
+        await self._publish_many(self.CHANNEL_ENTITIES, [
+            batch_event
+            for entity_type, ids in by_type.items()
+            for batch_event in self._id_batches(entity_type, ids)
+        ])
+
+    def _id_batches(
+        self,
+        entity_type: str,
+        ids: list[str],
+        body_name: str | None = None,
+    ) -> list[SyncEvent]:
+        """Split IDs into entity:batch events of at most ENTITY_IDS_PER_EVENT IDs."""
+        return [
+            SyncEvent(
                 event_type=EventType.ENTITY_BATCH,
                 entity_type=entity_type,
-                entity_count=len(ids),
-                entity_ids=ids[:100],  # Limit to 100 IDs in event
+                entity_count=len(ids[start:start + ENTITY_IDS_PER_EVENT]),
+                entity_ids=ids[start:start + ENTITY_IDS_PER_EVENT],
+                body_name=body_name,
             )
-            await self._publish(self.CHANNEL_ENTITIES, batch_event)
-
-        self._batch_buffer.clear()
+            for start in range(0, len(ids), ENTITY_IDS_PER_EVENT)
+        ]
 
     # ========== Sync Lifecycle Events ==========
 
@@ -280,18 +344,40 @@ class EventEmitter:
         )
         await self._publish(self.CHANNEL_ENTITIES, event)
 
+    async def emit_entities_changed(
+        self,
+        entity_type: str,
+        entity_ids: list[Any],
+        body_name: str | None = None,
+    ) -> None:
+        """
+        Emit batch events for rows written to the database.
+
+        Consumed by the Django search indexer (index_events command), which
+        reindexes the rows in Meilisearch.
+
+        Args:
+            entity_type: Type of entity (meeting, paper, person, organization, file)
+            entity_ids: Internal UUIDs of the written rows
+            body_name: Body name (optional)
+        """
+        ids = [str(entity_id) for entity_id in dict.fromkeys(entity_ids)]
+        await self._publish_many(
+            self.CHANNEL_ENTITIES, self._id_batches(entity_type, ids, body_name=body_name)
+        )
+
     # ========== Convenience Methods ==========
 
-    async def emit_new_meeting(
-        self,
+    @staticmethod
+    def new_meeting_event(
         meeting_id: str,
         external_id: str,
         name: str,
         body_name: str | None = None,
         start_time: datetime | None = None,
-    ) -> None:
-        """Emit event for a new meeting (high priority, not batched)."""
-        event = SyncEvent(
+    ) -> SyncEvent:
+        """Build the entity:created event of a new meeting."""
+        return SyncEvent(
             event_type=EventType.ENTITY_CREATED,
             entity_type="meeting",
             entity_id=meeting_id,
@@ -300,19 +386,17 @@ class EventEmitter:
             body_name=body_name,
             metadata={"start_time": start_time.isoformat() if start_time else None},
         )
-        # Meetings are high-priority - emit immediately
-        await self._publish(self.CHANNEL_ENTITIES, event)
 
-    async def emit_new_paper(
-        self,
+    @staticmethod
+    def new_paper_event(
         paper_id: str,
         external_id: str,
         name: str,
         body_name: str | None = None,
         paper_type: str | None = None,
-    ) -> None:
-        """Emit event for a new paper (high priority, not batched)."""
-        event = SyncEvent(
+    ) -> SyncEvent:
+        """Build the entity:created event of a new paper."""
+        return SyncEvent(
             event_type=EventType.ENTITY_CREATED,
             entity_type="paper",
             entity_id=paper_id,
@@ -321,8 +405,221 @@ class EventEmitter:
             body_name=body_name,
             metadata={"paper_type": paper_type} if paper_type else {},
         )
-        # Papers are high-priority - emit immediately
-        await self._publish(self.CHANNEL_ENTITIES, event)
+
+    async def emit_new_meeting(
+        self,
+        meeting_id: str,
+        external_id: str,
+        name: str,
+        body_name: str | None = None,
+        start_time: datetime | None = None,
+    ) -> None:
+        """Emit event for a new meeting (high priority, not batched)."""
+        await self.emit_new_entities(
+            [self.new_meeting_event(meeting_id, external_id, name, body_name, start_time)]
+        )
+
+    async def emit_new_paper(
+        self,
+        paper_id: str,
+        external_id: str,
+        name: str,
+        body_name: str | None = None,
+        paper_type: str | None = None,
+    ) -> None:
+        """Emit event for a new paper (high priority, not batched)."""
+        await self.emit_new_entities(
+            [self.new_paper_event(paper_id, external_id, name, body_name, paper_type)]
+        )
+
+    async def emit_new_entities(self, events: list[SyncEvent]) -> None:
+        """
+        Emit entity:created events of new meetings/papers immediately.
+
+        Unlike emit_entity_created they are not aggregated into batch events
+        (notifications need the details); all events of a call are sent in
+        one round-trip.
+        """
+        await self._publish_many(self.CHANNEL_ENTITIES, events)
+
+
+class EventStreamReader:
+    """
+    Reads events of the streams transport through a Redis consumer group.
+
+    Every event is delivered to one consumer of the group. Events stay
+    pending until they are acknowledged, so a consumer that restarts under
+    the same name first gets its unacknowledged events again, and events of
+    crashed consumers can be taken over with claim_stale().
+
+    Usage:
+        async with EventStreamReader("search-indexer") as reader:
+            while True:
+                messages = await reader.read()
+                for stream, message_id, event in messages:
+                    ...  # handle event
+                await reader.ack(messages)
+    """
+
+    def __init__(
+        self,
+        group: str,
+        consumer: str | None = None,
+        streams: tuple[str, ...] = (EventEmitter.CHANNEL_ENTITIES,),
+        redis_url: str | None = None,
+        count: int = 100,
+        block_ms: int = 5000,
+    ) -> None:
+        """
+        Initialize the reader.
+
+        Args:
+            group: Consumer group name (one group per kind of downstream service)
+            consumer: Consumer name within the group, stable across restarts
+                so pending events are redelivered (default: host name)
+            streams: Stream keys to read
+            redis_url: Redis connection URL (default from settings)
+            count: Maximum entries per stream and read() call
+            block_ms: Milliseconds read() waits for new entries
+        """
+        self.group = group
+        self.consumer = consumer or socket.gethostname()
+        self.streams = streams
+        self.redis_url = redis_url or settings.redis_url
+        self.count = count
+        self.block_ms = block_ms
+        self._client: redis.Redis | None = None
+        # Position in this consumer's pending entries per stream; None once
+        # the backlog is read and only new entries (">") are requested
+        self._pending_from: dict[str, str] | None = {stream: "0" for stream in streams}
+
+    async def __aenter__(self) -> "EventStreamReader":
+        """Connect and create the consumer groups if needed."""
+        self._client = redis.from_url(
+            self.redis_url,
+            encoding="utf-8",
+            decode_responses=True,
+        )
+        for stream in self.streams:
+            try:
+                # New groups start at the beginning of the (trimmed) stream
+                await self._client.xgroup_create(stream, self.group, id="0", mkstream=True)
+            except redis.ResponseError as e:
+                if "BUSYGROUP" not in str(e):
+                    raise
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Close the connection."""
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+
+    async def read(self) -> list[tuple[str, str, SyncEvent]]:
+        """
+        Read the next events of this consumer.
+
+        Returns:
+            List of (stream, message_id, event), empty after block_ms without entries
+        """
+        if not self._client:
+            raise RuntimeError("EventStreamReader is not connected")
+
+        if self._pending_from is not None:
+            response = await self._client.xreadgroup(
+                self.group, self.consumer, self._pending_from, count=self.count
+            )
+            if not any(entries for _, entries in response or []):
+                # Backlog of this consumer is done, continue with new entries
+                self._pending_from = None
+                return []
+            for stream, entries in response:
+                if entries:
+                    self._pending_from[stream] = entries[-1][0]
+        else:
+            response = await self._client.xreadgroup(
+                self.group,
+                self.consumer,
+                {stream: ">" for stream in self.streams},
+                count=self.count,
+                block=self.block_ms,
+            )
+        return await self._parse(response)
+
+    async def ack(self, messages: list[tuple[str, str, SyncEvent]]) -> None:
+        """Acknowledge handled events, in one round-trip per call."""
+        if not self._client or not messages:
+            return
+
+        by_stream: dict[str, list[str]] = {}
+        for stream, message_id, _ in messages:
+            by_stream.setdefault(stream, []).append(message_id)
+        async with self._client.pipeline(transaction=False) as pipe:
+            for stream, message_ids in by_stream.items():
+                pipe.xack(stream, self.group, *message_ids)
+            await pipe.execute()
+
+    async def claim_stale(self, min_idle_ms: int = 60_000) -> list[tuple[str, str, SyncEvent]]:
+        """
+        Take over events other consumers read but didn't acknowledge in time.
+
+        Claims the whole pending list of each stream (XAUTOCLAIM until its
+        cursor wraps around). Claimed events belong to this consumer: handle
+        and ack() them like the events of read(); unacknowledged ones are
+        delivered again with this consumer's backlog.
+
+        Args:
+            min_idle_ms: Minimum milliseconds since the entry was delivered
+
+        Returns:
+            Claimed events as returned by read()
+        """
+        if not self._client:
+            raise RuntimeError("EventStreamReader is not connected")
+
+        messages: list[tuple[str, str, SyncEvent]] = []
+        for stream in self.streams:
+            start_id = "0-0"
+            while True:
+                response = await self._client.xautoclaim(
+                    stream,
+                    self.group,
+                    self.consumer,
+                    min_idle_ms,
+                    start_id=start_id,
+                    count=self.count,
+                )
+                # [next start id, entries, (deleted ids - Redis 7)]
+                start_id = response[0]
+                messages.extend(await self._parse([[stream, response[1]]]))
+                if start_id == "0-0":
+                    break
+        return messages
+
+    async def _parse(self, response: Any) -> list[tuple[str, str, SyncEvent]]:
+        """
+        Convert an XREADGROUP/XAUTOCLAIM response into events.
+
+        Entries that can't be handled (trimmed while pending, invalid JSON)
+        are acknowledged right away, so they don't stay pending forever.
+        """
+        messages: list[tuple[str, str, SyncEvent]] = []
+        unusable: list[tuple[str, str, Any]] = []
+        for stream, entries in response or []:
+            for message_id, values in entries:
+                if not values or STREAM_FIELD not in values:
+                    unusable.append((stream, message_id, None))
+                    continue
+                try:
+                    event = SyncEvent.from_json(values[STREAM_FIELD])
+                except (TypeError, ValueError) as e:
+                    console.print(f"[yellow]Skipping invalid event {message_id}: {e}[/yellow]")
+                    unusable.append((stream, message_id, None))
+                    continue
+                messages.append((stream, message_id, event))
+
+        await self.ack(unusable)
+        return messages
 
 
 # Global emitter instance (lazy initialization)
@@ -27,6 +27,7 @@ from rich.table import Table
 
 from src.config import settings
 from src.sync.orchestrator import SyncOrchestrator
+from src.sync.workers import merge_results, sync_sharded
 
 app = typer.Typer(
     name="mandari-ingestor",
@@ -63,6 +64,12 @@ def sync(
     max_concurrent: int = typer.Option(
         10, "--concurrent", "-c", help="Maximum concurrent HTTP requests"
     ),
+    workers: int = typer.Option(
+        1, "--workers", "-w", help="Worker processes (shards sources and bodies)"
+    ),
+    resume: bool = typer.Option(
+        False, "--resume", "-r", help="Continue an interrupted full sync (with --full)"
+    ),
 ) -> None:
     """
     Synchronize OParl data from registered sources.
@@ -83,6 +90,12 @@ def sync(
 
         # Sync specific body only
         mandari-ingestor sync --source URL --body "Stadtrat"
+
+        # Full sync of all sources with 4 worker processes
+        mandari-ingestor sync --all --full --workers 4
+
+        # Continue a full sync that was interrupted
+        mandari-ingestor sync --source URL --full --resume
     """
     print_banner()
 
@@ -93,16 +106,51 @@ def sync(
         console.print("  mandari-ingestor sync --all")
         raise typer.Exit(1)
 
+    if resume and not full:
+        console.print("[red]Error:[/red] --resume only applies to a full sync (--full)")
+        raise typer.Exit(1)
+
     mode = "[bold green]Full Sync[/bold green]" if full else "[bold cyan]Incremental Sync[/bold cyan]"
+    if resume:
+        mode += " [dim](resumed)[/dim]"
     console.print(f"Mode: {mode}")
     console.print(f"Concurrent requests: {max_concurrent}")
+    if workers > 1:
+        console.print(f"Worker processes: {workers}")
     console.print()
 
+    if workers > 1:
+        # Each worker has its own DB pool - keep workers x pool size below
+        # PostgreSQL's max_connections
+        try:
+            results = sync_sharded(
+                source_urls=None if all_sources else [source_url],  # type: ignore[list-item]
+                workers=workers,
+                full=full,
+                body_filter=body_filter,
+                max_concurrent=max_concurrent,
+                resume=resume,
+            )
+        except KeyboardInterrupt:
+            console.print("\n[yellow]Sync interrupted by user[/yellow]")
+            raise typer.Exit(130)
+        except Exception as e:
+            console.print(f"\n[red]Sync failed: {e}[/red]")
+            raise typer.Exit(1)
+
+        for result in results:
+            SyncOrchestrator.print_result(result)
+        if len(results) > 1:
+            SyncOrchestrator.print_result(
+                merge_results(results, source_url="", source_name=f"All sources ({len(results)})")
+            )
+        return
+
     async def run_sync() -> None:
         async with SyncOrchestrator(max_concurrent=max_concurrent) as orchestrator:
             if all_sources:
                 console.print("[blue]Syncing all registered sources...[/blue]")
-                results = await orchestrator.sync_all(full=full)
+                results = await orchestrator.sync_all(full=full, resume=resume)
                 for result in results:
                     orchestrator.print_result(result)
             else:
@@ -111,6 +159,7 @@ def sync(
                     url=source_url,
                     full=full,
                     body_filter=body_filter,
+                    resume=resume,
                 )
                 orchestrator.print_result(result)
 
@@ -6,7 +6,7 @@ Exposes metrics for monitoring the OParl sync service.
 Metrics:
 - Counters: requests, entities synced, errors
 - Histograms: request duration, sync duration
-- Gauges: active syncs, circuit breaker status
+- Gauges: active syncs, circuit breaker status, per-host limits
 
 Usage:
     from src.metrics import metrics
@@ -61,6 +61,7 @@ class SimpleMetrics:
     sync_runs: int = 0
     sync_errors: int = 0
     active_syncs: int = 0
+    host_limits: dict[str, dict[str, float]] = field(default_factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON output."""
@@ -75,6 +76,7 @@ class SimpleMetrics:
             "sync_runs_total": self.sync_runs,
             "sync_errors_total": self.sync_errors,
             "active_syncs": self.active_syncs,
+            "host_limits": self.host_limits,
         }
 
 
@@ -183,6 +185,28 @@ class MetricsCollector:
             registry=self.registry,
         )
 
+        # Adaptive per-host limits
+        self.host_concurrency_limit = Gauge(
+            "mandari_ingestor_host_concurrency_limit",
+            "Current concurrent request limit per host",
+            ["host"],
+            registry=self.registry,
+        )
+
+        self.host_rate_limit = Gauge(
+            "mandari_ingestor_host_rate_limit",
+            "Current request rate limit per host (requests/second)",
+            ["host"],
+            registry=self.registry,
+        )
+
+        self.host_backoffs_total = Counter(
+            "mandari_ingestor_host_backoffs_total",
+            "Limit decreases per host",
+            ["host", "reason"],
+            registry=self.registry,
+        )
+
         # Cache metrics
         self.cache_hits_total = Counter(
             "mandari_ingestor_cache_hits_total",
@@ -238,14 +262,15 @@ class MetricsCollector:
         entity_type: str,
         source: str,
         action: str = "created",
+        count: int = 1,
     ) -> None:
-        """Record an entity sync."""
+        """Record an entity sync (or `count` entities of the same type)."""
         if not self.enabled:
             return
 
         # Simple metrics
         self.simple.entities_synced[entity_type] = (
-            self.simple.entities_synced.get(entity_type, 0) + 1
+            self.simple.entities_synced.get(entity_type, 0) + count
         )
 
         # Prometheus metrics
@@ -254,7 +279,7 @@ class MetricsCollector:
                 entity_type=entity_type,
                 source=source,
                 action=action,
-            ).inc()
+            ).inc(count)
 
     def record_entities_batch(
         self,
@@ -330,6 +355,26 @@ class MetricsCollector:
 
         self.circuit_breaker_failures.labels(source=source).inc()
 
+    # ========== Host Limit Metrics ==========
+
+    def record_host_limits(self, host: str, concurrency: int, rate: float) -> None:
+        """Record the current adaptive limits of a host."""
+        if not self.enabled:
+            return
+
+        self.simple.host_limits[host] = {"concurrency": concurrency, "rate": rate}
+
+        if self._prometheus_enabled:
+            self.host_concurrency_limit.labels(host=host).set(concurrency)
+            self.host_rate_limit.labels(host=host).set(rate)
+
+    def record_host_backoff(self, host: str, reason: str) -> None:
+        """Record a limit decrease (throttled, server_error, timeout, slow)."""
+        if not self.enabled or not self._prometheus_enabled:
+            return
+
+        self.host_backoffs_total.labels(host=host, reason=reason).inc()
+
     # ========== Metrics Server ==========
 
     async def start_server(self, port: int = 9090) -> None:
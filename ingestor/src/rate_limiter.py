@@ -0,0 +1,234 @@
+"""
+Adaptive Rate Limiter Module
+
+Per-host concurrency and request rate control for OParl APIs (AIMD).
+Lives next to the per-host circuit breaker: the breaker stops requests to
+a failing host, the limiter adapts the load on a working one.
+
+Behavior:
+- Additive increase: after a window of `limit` healthy responses, the
+  concurrency limit grows by one and the rate by rate_increase
+- Multiplicative decrease: 429, 5xx, timeouts and responses slower than
+  latency_threshold halve both (at most once per cooldown)
+- Token bucket: requests are spaced according to the current rate,
+  Retry-After of a 429/503 pauses the host
+
+Usage:
+    limiter = HostLimiter("oparl.example.org")
+
+    async with limiter.slot():
+        await limiter.wait_for_token()
+        response = await client.get(url)
+        limiter.record_response(response.status_code, latency)
+"""
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from src.metrics import metrics
+
+
+@dataclass
+class HostLimiterConfig:
+    """Configuration for adaptive per-host limits."""
+
+    # Concurrent requests per host
+    initial_concurrency: int = 4
+    min_concurrency: int = 1
+    max_concurrency: int = 20
+
+    # Requests per second per host (token bucket refill rate)
+    initial_rate: float = 20.0
+    min_rate: float = 0.5
+    max_rate: float = 100.0
+    rate_increase: float = 2.0
+
+    # Factor applied to both limits on overload
+    decrease_factor: float = 0.5
+
+    # Responses slower than this (seconds) count as overload
+    latency_threshold: float = 10.0
+
+    # Minimum seconds between two decreases (failures of one burst count once)
+    decrease_cooldown: float = 2.0
+
+
+class HostLimiter:
+    """
+    AIMD concurrency limit plus token bucket for one host.
+
+    The concurrency slots work like a semaphore whose size changes at
+    runtime; slots above a lowered limit are simply not handed out again
+    until enough requests have finished.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        config: HostLimiterConfig | None = None,
+    ) -> None:
+        """
+        Initialize the limiter.
+
+        Args:
+            name: Host name (used in metrics)
+            config: Configuration options (uses defaults if not provided)
+        """
+        self.name = name
+        self.config = config or HostLimiterConfig()
+
+        self.limit = max(
+            self.config.min_concurrency,
+            min(self.config.initial_concurrency, self.config.max_concurrency),
+        )
+        self.rate = max(self.config.min_rate, min(self.config.initial_rate, self.config.max_rate))
+
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._successes = 0
+        self._last_decrease = 0.0
+
+        self._tokens = 1.0
+        self._last_refill = time.monotonic()
+        self._paused_until = 0.0
+
+        self._publish()
+
+    # ========== Concurrency ==========
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one of the host's concurrency slots."""
+        await self._acquire()
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self) -> None:
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Slot was handed over just before the cancellation
+                self._release()
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+        self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+    # ========== Rate ==========
+
+    async def wait_for_token(self) -> None:
+        """Wait until the token bucket allows the next request."""
+        while True:
+            now = time.monotonic()
+            if now < self._paused_until:
+                await asyncio.sleep(self._paused_until - now)
+                continue
+
+            # Bucket holds at most one second worth of requests
+            capacity = max(1.0, self.rate)
+            self._tokens = min(capacity, self._tokens + (now - self._last_refill) * self.rate)
+            self._last_refill = now
+
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return
+            await asyncio.sleep((1.0 - self._tokens) / self.rate)
+
+    # ========== Feedback ==========
+
+    def record_response(
+        self,
+        status_code: int,
+        latency: float,
+        retry_after: str | None = None,
+    ) -> None:
+        """
+        Adapt the limits to a response.
+
+        Args:
+            status_code: HTTP status of the response
+            latency: Seconds until the response headers arrived
+            retry_after: Retry-After header of the response, if any
+        """
+        if status_code == 429 or status_code >= 500:
+            self._pause(retry_after)
+            self._decrease("throttled" if status_code == 429 else "server_error")
+        elif latency > self.config.latency_threshold:
+            self._decrease("slow")
+        else:
+            self._increase()
+
+    def record_timeout(self) -> None:
+        """Adapt the limits to a request that timed out."""
+        self._decrease("timeout")
+
+    def _pause(self, retry_after: str | None) -> None:
+        if not retry_after:
+            return
+        try:
+            seconds = float(retry_after)
+        except ValueError:
+            # HTTP-date form is rare for APIs - the decrease has to do
+            return
+        self._paused_until = max(self._paused_until, time.monotonic() + min(seconds, 60.0))
+
+    def _increase(self) -> None:
+        self._successes += 1
+        if self._successes < self.limit:
+            return
+
+        self._successes = 0
+        self.limit = min(self.config.max_concurrency, self.limit + 1)
+        self.rate = min(self.config.max_rate, self.rate + self.config.rate_increase)
+        self._wake_waiters()
+        self._publish()
+
+    def _decrease(self, reason: str) -> None:
+        self._successes = 0
+        now = time.monotonic()
+        if now - self._last_decrease < self.config.decrease_cooldown:
+            return
+
+        self._last_decrease = now
+        self.limit = max(self.config.min_concurrency, int(self.limit * self.config.decrease_factor))
+        self.rate = max(self.config.min_rate, self.rate * self.config.decrease_factor)
+        self._tokens = min(self._tokens, 1.0)
+        metrics.record_host_backoff(self.name, reason)
+        self._publish()
+
+    def _publish(self) -> None:
+        metrics.record_host_limits(self.name, self.limit, self.rate)
+
+    def get_status(self) -> dict[str, Any]:
+        """Get current limits and load."""
+        return {
+            "name": self.name,
+            "concurrency_limit": self.limit,
+            "rate_limit": round(self.rate, 2),
+            "in_flight": self._in_flight,
+            "waiting": len(self._waiters),
+        }
@@ -5,8 +5,10 @@ from src.storage.models import (
     Base,
     OParlAgendaItem,
     OParlBody,
+    OParlBodyStatistics,
     OParlConsultation,
     OParlFile,
+    OParlHttpValidator,
     OParlLegislativeTerm,
     OParlLocation,
     OParlMeeting,
@@ -15,15 +17,20 @@ from src.storage.models import (
     OParlPaper,
     OParlPerson,
     OParlSource,
+    OParlSyncCheckpoint,
+    meeting_organizations,
 )
+from src.storage.resolver import UUIDResolver
 
 __all__ = [
     "Base",
     "DatabaseStorage",
     "OParlAgendaItem",
     "OParlBody",
+    "OParlBodyStatistics",
     "OParlConsultation",
     "OParlFile",
+    "OParlHttpValidator",
     "OParlLegislativeTerm",
     "OParlLocation",
     "OParlMeeting",
@@ -32,4 +39,7 @@ __all__ = [
     "OParlPaper",
     "OParlPerson",
     "OParlSource",
+    "OParlSyncCheckpoint",
+    "UUIDResolver",
+    "meeting_organizations",
 ]
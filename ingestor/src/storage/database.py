@@ -5,22 +5,26 @@ High-performance async database operations with proper upsert support.
 Uses PostgreSQL ON CONFLICT for efficient insert-or-update operations.
 """
 
-from datetime import datetime, timezone
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta, timezone
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import select, func
+from rich.console import Console
+from sqlalchemy import case, delete, func, literal, or_, select, true, tuple_, union_all
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from rich.console import Console
 
 from src.config import settings
 from src.storage.models import (
     Base,
     OParlAgendaItem,
     OParlBody,
+    OParlBodyStatistics,
     OParlConsultation,
     OParlFile,
+    OParlHttpValidator,
     OParlLegislativeTerm,
     OParlLocation,
     OParlMeeting,
@@ -29,7 +33,10 @@ from src.storage.models import (
     OParlPaper,
     OParlPerson,
     OParlSource,
+    OParlSyncCheckpoint,
+    meeting_organizations,
 )
+from src.storage.resolver import UUIDResolver
 from src.sync.processor import (
     OParlType,
     ProcessedAgendaItem,
@@ -48,6 +55,48 @@ from src.sync.processor import (
 
 console = Console()
 
+# Rows per multi-row INSERT. asyncpg allows 32767 bind parameters per statement
+# and the widest OParl table has 15 insert columns.
+BULK_CHUNK_SIZE = 1000
+
+# Columns written on insert but never touched by ON CONFLICT DO UPDATE
+INSERT_ONLY_COLUMNS = frozenset({"id", "external_id", "body_id", "source_id"})
+
+# Links that don't come from raw_json: a row with an unchanged content hash
+# is still written if one of them differs from the stored value
+LINK_COLUMNS = frozenset({"meeting_id", "paper_id", "person_id", "organization_id"})
+
+# Tables indexed in Meilisearch -> entity type used in change events
+SEARCH_INDEXED_TABLES = {
+    "oparl_papers": "paper",
+    "oparl_meetings": "meeting",
+    "oparl_persons": "person",
+    "oparl_organizations": "organization",
+    "oparl_files": "file",
+}
+
+
+@dataclass
+class WriteStats:
+    """Rows written vs. skipped as unchanged by the bulk upserts."""
+
+    written: int = 0
+    skipped: int = 0
+
+
+# Write statistics of the running sync. A context variable, so parallel
+# source syncs sharing one DatabaseStorage keep separate counts.
+current_write_stats: ContextVar[WriteStats | None] = ContextVar(
+    "current_write_stats", default=None
+)
+
+# Searchable entity types -> UUIDs of the rows written by the running store
+# call. Set by the orchestrator while events are enabled, so the search
+# indexer only hears about rows that actually changed.
+current_changed_ids: ContextVar[dict[str, list[UUID]] | None] = ContextVar(
+    "current_changed_ids", default=None
+)
+
 
 class DatabaseStorage:
     """
@@ -81,12 +130,8 @@ class DatabaseStorage:
             expire_on_commit=False,
         )
 
-        # Cache for body UUIDs (external_id -> UUID)
-        self._body_uuid_cache: dict[str, UUID] = {}
-        self._meeting_uuid_cache: dict[str, UUID] = {}
-        self._paper_uuid_cache: dict[str, UUID] = {}
-        self._person_uuid_cache: dict[str, UUID] = {}
-        self._organization_uuid_cache: dict[str, UUID] = {}
+        # external_id -> UUID of referenced entities, shared by all sync tasks
+        self.resolver = UUIDResolver(self.get_session)
 
     async def initialize(self) -> None:
         """Create all tables if they don't exist."""
@@ -183,6 +228,21 @@ class DatabaseStorage:
                     source.last_full_sync = now
                 await session.commit()
 
+    async def get_source_sync_config(self, source_id: UUID) -> dict[str, Any]:
+        """Get the sync configuration of a source (e.g. detected server capabilities)."""
+        async with self.get_session() as session:
+            source = await session.get(OParlSource, source_id)
+            return dict(source.sync_config or {}) if source else {}
+
+    async def update_source_sync_config(self, source_id: UUID, **values: Any) -> None:
+        """Merge values into the sync configuration of a source."""
+        async with self.get_session() as session:
+            source = await session.get(OParlSource, source_id)
+            if source:
+                # Assign a new dict - in-place changes of JSONB aren't tracked
+                source.sync_config = {**(source.sync_config or {}), **values}
+                await session.commit()
+
     # ========== Body Operations ==========
 
     async def upsert_body(
@@ -215,6 +275,7 @@ class DatabaseStorage:
                 oparl_created=body.oparl_created,
                 oparl_modified=body.oparl_modified,
                 raw_json=body.raw_json,
+                content_hash=body.content_hash,
             )
             stmt = stmt.on_conflict_do_update(
                 index_elements=["external_id"],
@@ -234,6 +295,7 @@ class DatabaseStorage:
                     "oparl_created": stmt.excluded.oparl_created,
                     "oparl_modified": stmt.excluded.oparl_modified,
                     "raw_json": stmt.excluded.raw_json,
+                    "content_hash": stmt.excluded.content_hash,
                     "updated_at": func.now(),
                 },
             ).returning(OParlBody.id)
@@ -243,12 +305,13 @@ class DatabaseStorage:
             await session.commit()
 
             # Cache the UUID
-            self._body_uuid_cache[body.external_id] = body_id
+            self.resolver.remember("body", {body.external_id: body_id})
 
             # Process nested legislative terms
-            for nested in body.nested_entities:
-                if isinstance(nested, ProcessedLegislativeTerm):
-                    await self.upsert_legislative_term(nested, body_id)
+            await self.upsert_legislative_terms_batch(
+                [n for n in body.nested_entities if isinstance(n, ProcessedLegislativeTerm)],
+                body_id,
+            )
 
             return body_id
 
@@ -261,23 +324,114 @@ class DatabaseStorage:
 
     async def get_body_uuid(self, external_id: str) -> UUID | None:
         """Get a body's UUID by external ID (cached)."""
-        if external_id in self._body_uuid_cache:
-            return self._body_uuid_cache[external_id]
+        return await self.resolver.resolve("body", external_id)
 
-        body = await self.get_body_by_external_id(external_id)
-        if body:
-            self._body_uuid_cache[external_id] = body.id
-            return body.id
-        return None
+    async def update_body_sync_time(
+        self, body_id: UUID, synced_at: datetime | None = None
+    ) -> None:
+        """
+        Update the last sync timestamp for a body.
 
-    async def update_body_sync_time(self, body_id: UUID) -> None:
-        """Update the last sync timestamp for a body."""
+        Args:
+            synced_at: Start of the sync (default: now); the next incremental
+                sync requests objects modified since then
+        """
         async with self.get_session() as session:
             body = await session.get(OParlBody, body_id)
             if body:
-                body.last_sync = datetime.now(timezone.utc)
+                body.last_sync = synced_at or datetime.now(UTC)
                 await session.commit()
 
+    # ========== HTTP Validator Operations ==========
+
+    async def get_http_validators(
+        self,
+        url_prefix: str,
+        max_age: timedelta,
+    ) -> list[OParlHttpValidator]:
+        """
+        Load stored HTTP validators for all URLs starting with url_prefix.
+
+        Entries older than max_age are ignored, so every page is fetched
+        unconditionally at least once per max_age.
+        """
+        async with self.get_session() as session:
+            stmt = select(OParlHttpValidator).where(
+                OParlHttpValidator.url.startswith(url_prefix, autoescape=True),
+                OParlHttpValidator.updated_at >= datetime.now(UTC) - max_age,
+            )
+            result = await session.execute(stmt)
+            return list(result.scalars().all())
+
+    async def upsert_http_validators(self, rows: list[dict[str, Any]]) -> None:
+        """
+        Insert or update HTTP validators in one transaction.
+
+        Args:
+            rows: Dicts with url, etag, last_modified and next_url
+        """
+        if not rows:
+            return
+
+        async with self.get_session() as session:
+            for start in range(0, len(rows), BULK_CHUNK_SIZE):
+                stmt = pg_insert(OParlHttpValidator).values(rows[start:start + BULK_CHUNK_SIZE])
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["url"],
+                    set_={
+                        "etag": stmt.excluded.etag,
+                        "last_modified": stmt.excluded.last_modified,
+                        "next_url": stmt.excluded.next_url,
+                        "updated_at": func.now(),
+                    },
+                )
+                await session.execute(stmt)
+            await session.commit()
+
+    # ========== Sync Checkpoint Operations ==========
+
+    async def get_sync_checkpoints(self, body_id: UUID) -> dict[str, str | None]:
+        """
+        Get the full sync checkpoints of a body.
+
+        Returns:
+            Mapping entity_type -> next_url (None = entity type complete)
+        """
+        async with self.get_session() as session:
+            stmt = select(OParlSyncCheckpoint.entity_type, OParlSyncCheckpoint.next_url).where(
+                OParlSyncCheckpoint.body_id == body_id
+            )
+            result = await session.execute(stmt)
+            return {entity_type: next_url for entity_type, next_url in result.all()}
+
+    async def save_sync_checkpoint(
+        self,
+        body_id: UUID,
+        entity_type: str,
+        next_url: str | None,
+    ) -> None:
+        """Store the position of a full sync after a page was written."""
+        async with self.get_session() as session:
+            stmt = pg_insert(OParlSyncCheckpoint).values(
+                body_id=body_id,
+                entity_type=entity_type,
+                next_url=next_url,
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["body_id", "entity_type"],
+                set_={"next_url": stmt.excluded.next_url, "updated_at": func.now()},
+            )
+            await session.execute(stmt)
+            await session.commit()
+
+    async def clear_sync_checkpoints(self, body_id: UUID) -> None:
+        """Forget the checkpoints of a body (a new full sync starts at page one)."""
+        async with self.get_session() as session:
+            await session.execute(
+                delete(OParlSyncCheckpoint).where(OParlSyncCheckpoint.body_id == body_id)
+            )
+            await session.commit()
+
     # ========== Entity Existence Check ==========
 
     async def get_entity_modified_date(
@@ -332,7 +486,9 @@ class DatabaseStorage:
             external_ids: List of external IDs to check
 
         Returns:
-            Dict mapping external_id -> oparl_modified (or None if not found)
+            Dict mapping the external_id of each stored entity -> oparl_modified
+            (None if the stored row has no modified date). IDs that are not
+            stored are missing from the dict.
         """
         model_map = {
             "meeting": OParlMeeting,
@@ -356,201 +512,507 @@ class DatabaseStorage:
                 model.external_id.in_(external_ids)
             )
             result = await session.execute(stmt)
-            rows = result.all()
+            return {external_id: modified for external_id, modified in result.all()}
 
-            # Create dict with all IDs defaulting to None
-            result_dict: dict[str, datetime | None] = {eid: None for eid in external_ids}
-            # Update with found entries
-            for external_id, modified in rows:
-                result_dict[external_id] = modified
+    # ========== Bulk Upsert Helpers ==========
 
-            return result_dict
+    async def _bulk_upsert(
+        self,
+        session: AsyncSession,
+        model: type[Base],
+        rows: list[dict[str, Any]],
+        keep_existing: tuple[str, ...] = (),
+    ) -> dict[str, UUID]:
+        """
+        Multi-row INSERT ... ON CONFLICT (external_id) DO UPDATE.
+
+        Rows are deduplicated by external_id (last one wins) because PostgreSQL
+        refuses to update the same row twice within one statement. Large inputs
+        are split into chunks of BULK_CHUNK_SIZE rows to stay below the bind
+        parameter limit of asyncpg.
+
+        Rows whose content_hash (and links) match the stored row are not
+        written at all; their UUIDs come from the lookup instead.
+
+        Args:
+            session: Session the statements are executed in (caller commits)
+            model: Target model
+            rows: Column values per row, all rows must have the same keys
+            keep_existing: Columns that keep their stored value when the new one is NULL
+
+        Returns:
+            Mapping external_id -> UUID for all given rows
+        """
+        unique_rows = list({row["external_id"]: row for row in rows}.values())
+        if not unique_rows:
+            return {}
+
+        ids: dict[str, UUID] = {}
+        if settings.sync_skip_unchanged and "content_hash" in unique_rows[0]:
+            ids, unique_rows = await self._split_unchanged(
+                session, model, unique_rows, keep_existing
+            )
+
+        stats = current_write_stats.get()
+        if stats:
+            stats.skipped += len(ids)
+            stats.written += len(unique_rows)
+        if not unique_rows:
+            return ids
+
+        changed = current_changed_ids.get()
+        changed_type = SEARCH_INDEXED_TABLES.get(model.__tablename__)
+
+        update_columns = [
+            column
+            for column in unique_rows[0]
+            if column not in INSERT_ONLY_COLUMNS and column not in keep_existing
+        ]
+
+        for start in range(0, len(unique_rows), BULK_CHUNK_SIZE):
+            chunk = unique_rows[start:start + BULK_CHUNK_SIZE]
+            stmt = pg_insert(model).values(chunk)
+            set_: dict[str, Any] = {column: stmt.excluded[column] for column in update_columns}
+            for column in keep_existing:
+                # Don't overwrite an existing link with NULL
+                set_[column] = func.coalesce(stmt.excluded[column], getattr(model, column))
+            set_["updated_at"] = func.now()
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["external_id"],
+                set_=set_,
+            ).returning(model.external_id, model.id)
+
+            result = await session.execute(stmt)
+            for external_id, entity_id in result.all():
+                ids[external_id] = entity_id
+                if changed is not None and changed_type:
+                    changed.setdefault(changed_type, []).append(entity_id)
+
+        return ids
+
+    async def _split_unchanged(
+        self,
+        session: AsyncSession,
+        model: type[Base],
+        rows: list[dict[str, Any]],
+        keep_existing: tuple[str, ...] = (),
+    ) -> tuple[dict[str, UUID], list[dict[str, Any]]]:
+        """
+        Separate rows that are already stored unchanged from rows to write.
+
+        Looks up content_hash and link columns of all rows with one SELECT
+        per chunk (like batch_check_entities_exist).
+
+        Returns:
+            Tuple of (external_id -> UUID of unchanged rows, rows to write)
+        """
+        link_columns = [column for column in rows[0] if column in LINK_COLUMNS]
+
+        stored: dict[str, Any] = {}
+        for start in range(0, len(rows), BULK_CHUNK_SIZE):
+            external_ids = [row["external_id"] for row in rows[start:start + BULK_CHUNK_SIZE]]
+            stmt = select(
+                model.external_id,
+                model.id,
+                model.content_hash,
+                *[getattr(model, column) for column in link_columns],
+            ).where(model.external_id.in_(external_ids))
+            result = await session.execute(stmt)
+            for stored_row in result.all():
+                stored[stored_row.external_id] = stored_row
+
+        unchanged: dict[str, UUID] = {}
+        changed: list[dict[str, Any]] = []
+        for row in rows:
+            current = stored.get(row["external_id"])
+            if (
+                current is None
+                or current.content_hash != row["content_hash"]
+                or any(
+                    row[column] != getattr(current, column)
+                    # NULL doesn't overwrite these, so it isn't a change
+                    and not (row[column] is None and column in keep_existing)
+                    for column in link_columns
+                )
+            ):
+                changed.append(row)
+            else:
+                unchanged[row["external_id"]] = current.id
+
+        return unchanged, changed
+
+    async def _upsert_rows(
+        self,
+        model: type[Base],
+        rows: list[dict[str, Any]],
+        keep_existing: tuple[str, ...] = (),
+    ) -> dict[str, UUID]:
+        """Bulk upsert rows of one model in a single transaction."""
+        if not rows:
+            return {}
+
+        async with self.get_session() as session:
+            ids = await self._bulk_upsert(session, model, rows, keep_existing)
+            await session.commit()
+            return ids
 
     # ========== Meeting Operations ==========
 
-    async def upsert_meeting(
+    @staticmethod
+    def _meeting_row(meeting: ProcessedMeeting, body_id: UUID) -> dict[str, Any]:
+        return {
+            "id": meeting.id,
+            "external_id": meeting.external_id,
+            "body_id": body_id,
+            "name": meeting.name,
+            "meeting_state": meeting.meeting_state,
+            "cancelled": meeting.cancelled,
+            "start": meeting.start,
+            "end": meeting.end,
+            "location_external_id": meeting.location_external_id,
+            "location_name": meeting.location_name,
+            "location_address": meeting.location_address,
+            "oparl_created": meeting.oparl_created,
+            "oparl_modified": meeting.oparl_modified,
+            "raw_json": meeting.raw_json,
+            "content_hash": meeting.content_hash,
+        }
+
+    async def upsert_meetings_batch(
         self,
-        meeting: ProcessedMeeting,
+        meetings: list[ProcessedMeeting],
         body_id: UUID,
-    ) -> UUID:
-        """Insert or update a meeting."""
+    ) -> dict[str, UUID]:
+        """
+        Insert or update a page of meetings in one transaction.
+
+        Nested entities are not written here (see upsert_meeting). The
+        committee links (oparl_meetings_organizations) are replaced in the
+        same transaction; organizations are synced before meetings.
+
+        Returns:
+            Mapping external_id -> meeting UUID
+        """
+        if not meetings:
+            return {}
+
+        organization_ids = await self.resolver.resolve_many(
+            "organization",
+            [ref for m in meetings for ref in m.references.get("organization", []) if ref],
+        )
+
         async with self.get_session() as session:
-            stmt = pg_insert(OParlMeeting).values(
-                id=meeting.id,
-                external_id=meeting.external_id,
-                body_id=body_id,
-                name=meeting.name,
-                meeting_state=meeting.meeting_state,
-                cancelled=meeting.cancelled,
-                start=meeting.start,
-                end=meeting.end,
-                location_external_id=meeting.location_external_id,
-                location_name=meeting.location_name,
-                location_address=meeting.location_address,
-                oparl_created=meeting.oparl_created,
-                oparl_modified=meeting.oparl_modified,
-                raw_json=meeting.raw_json,
+            ids = await self._bulk_upsert(
+                session, OParlMeeting, [self._meeting_row(m, body_id) for m in meetings]
             )
-            stmt = stmt.on_conflict_do_update(
-                index_elements=["external_id"],
-                set_={
-                    "name": stmt.excluded.name,
-                    "meeting_state": stmt.excluded.meeting_state,
-                    "cancelled": stmt.excluded.cancelled,
-                    "start": stmt.excluded.start,
-                    "end": stmt.excluded.end,
-                    "location_external_id": stmt.excluded.location_external_id,
-                    "location_name": stmt.excluded.location_name,
-                    "location_address": stmt.excluded.location_address,
-                    "oparl_created": stmt.excluded.oparl_created,
-                    "oparl_modified": stmt.excluded.oparl_modified,
-                    "raw_json": stmt.excluded.raw_json,
-                    "updated_at": func.now(),
-                },
-            ).returning(OParlMeeting.id)
+            links = {
+                (ids[m.external_id], organization_ids[ref])
+                for m in meetings
+                if m.external_id in ids
+                for ref in m.references.get("organization", [])
+                if ref in organization_ids
+            }
+            await self._replace_meeting_organizations(session, set(ids.values()), links)
+            await session.commit()
+
+        self.resolver.remember("meeting", ids)
+        return ids
 
+    async def _replace_meeting_organizations(
+        self,
+        session: AsyncSession,
+        meeting_ids: set[UUID],
+        links: set[tuple[UUID, UUID]],
+    ) -> None:
+        """
+        Make links the complete set of committee links of the given meetings.
+
+        Stale links are removed with one DELETE and new ones added with one
+        INSERT ... ON CONFLICT DO NOTHING per chunk, so unchanged meetings
+        cost no writes.
+
+        Args:
+            session: Session the statements are executed in (caller commits)
+            meeting_ids: Meetings whose links are replaced
+            links: (meeting UUID, organization UUID) pairs to keep
+        """
+        meeting_column = meeting_organizations.c.oparlmeeting_id
+        organization_column = meeting_organizations.c.oparlorganization_id
+
+        ordered_meetings = sorted(meeting_ids)
+        for start in range(0, len(ordered_meetings), BULK_CHUNK_SIZE):
+            chunk = ordered_meetings[start:start + BULK_CHUNK_SIZE]
+            chunk_ids = set(chunk)
+            keep = [link for link in links if link[0] in chunk_ids]
+            stmt = delete(meeting_organizations).where(meeting_column.in_(chunk))
+            if keep:
+                stmt = stmt.where(tuple_(meeting_column, organization_column).not_in(keep))
+            await session.execute(stmt)
+
+        rows = [
+            {"oparlmeeting_id": meeting_id, "oparlorganization_id": organization_id}
+            for meeting_id, organization_id in sorted(links)
+        ]
+        for start in range(0, len(rows), BULK_CHUNK_SIZE):
+            stmt = pg_insert(meeting_organizations).values(rows[start:start + BULK_CHUNK_SIZE])
+            await session.execute(
+                stmt.on_conflict_do_nothing(
+                    index_elements=["oparlmeeting_id", "oparlorganization_id"]
+                )
+            )
+
+    async def link_meeting_organizations(self, body_id: UUID) -> int:
+        """
+        Add missing committee links of a body's meetings from their raw_json.
+
+        upsert_meetings_batch only links the meetings it writes, and a reference
+        to an organization that isn't stored yet is dropped. Unchanged meetings
+        are never written again, so their links are added here once the
+        organization exists. One INSERT ... SELECT, existing links are kept.
+
+        Returns:
+            Number of links added
+        """
+        organization_refs = OParlMeeting.raw_json["organization"]
+        ref = (
+            func.jsonb_array_elements_text(
+                case(
+                    (func.jsonb_typeof(organization_refs) == "array", organization_refs),
+                    else_=func.jsonb_build_array(),
+                )
+            )
+            .table_valued("url")
+            .render_derived()
+            .lateral("ref")
+        )
+        links = (
+            select(OParlMeeting.id, OParlOrganization.id)
+            .select_from(OParlMeeting)
+            .join(ref, true())
+            .join(OParlOrganization, OParlOrganization.external_id == ref.c.url)
+            .where(OParlMeeting.body_id == body_id)
+        )
+        stmt = (
+            pg_insert(meeting_organizations)
+            .from_select(["oparlmeeting_id", "oparlorganization_id"], links)
+            .on_conflict_do_nothing(index_elements=["oparlmeeting_id", "oparlorganization_id"])
+        )
+
+        async with self.get_session() as session:
             result = await session.execute(stmt)
-            meeting_id = result.scalar_one()
             await session.commit()
+        return result.rowcount
+
+    async def upsert_meeting(
+        self,
+        meeting: ProcessedMeeting,
+        body_id: UUID,
+    ) -> UUID:
+        """Insert or update a meeting including its nested entities."""
+        ids = await self.upsert_meetings_batch([meeting], body_id)
+        meeting_id = ids[meeting.external_id]
+        await self.upsert_meetings_nested_batch([(meeting, meeting_id)], body_id)
+        return meeting_id
 
-            self._meeting_uuid_cache[meeting.external_id] = meeting_id
+    async def upsert_meetings_nested_batch(
+        self,
+        meetings: list[tuple[ProcessedMeeting, UUID]],
+        body_id: UUID,
+    ) -> dict[str, int]:
+        """
+        Write the agenda items, files and locations embedded in a page of meetings.
+
+        The nested entities of all meetings are collected and written with one
+        bulk statement per type; duplicates (e.g. the same room in several
+        meetings) are collapsed by external_id.
+
+        Args:
+            meetings: Meetings with the UUIDs returned by upsert_meetings_batch
+            body_id: Body UUID
 
-            # Process nested entities
+        Returns:
+            Number of written entities per type ("location", "agendaitem", "file")
+        """
+        agenda_items: list[tuple[ProcessedAgendaItem, UUID]] = []
+        files: list[tuple[ProcessedFile, UUID | None, UUID | None]] = []
+        locations: list[ProcessedLocation] = []
+        for meeting, meeting_id in meetings:
             for nested in meeting.nested_entities:
                 if isinstance(nested, ProcessedAgendaItem):
-                    await self.upsert_agenda_item(nested, meeting_id)
+                    agenda_items.append((nested, meeting_id))
                 elif isinstance(nested, ProcessedFile):
-                    await self.upsert_file(nested, body_id, meeting_id=meeting_id)
+                    files.append((nested, None, meeting_id))
                 elif isinstance(nested, ProcessedLocation):
-                    await self.upsert_location(nested, body_id)
+                    locations.append(nested)
 
-            return meeting_id
+        return {
+            "location": len(await self.upsert_locations_batch(locations, body_id)),
+            "agendaitem": len(await self.upsert_agenda_items_batch(agenda_items)),
+            "file": len(await self.upsert_files_batch(files, body_id)),
+        }
 
     async def get_meeting_uuid(self, external_id: str) -> UUID | None:
         """Get a meeting's UUID by external ID (cached)."""
-        if external_id in self._meeting_uuid_cache:
-            return self._meeting_uuid_cache[external_id]
-
-        async with self.get_session() as session:
-            stmt = select(OParlMeeting.id).where(OParlMeeting.external_id == external_id)
-            result = await session.execute(stmt)
-            uuid = result.scalar_one_or_none()
-            if uuid:
-                self._meeting_uuid_cache[external_id] = uuid
-            return uuid
+        return await self.resolver.resolve("meeting", external_id)
 
     # ========== Paper Operations ==========
 
+    @staticmethod
+    def _paper_row(paper: ProcessedPaper, body_id: UUID) -> dict[str, Any]:
+        return {
+            "id": paper.id,
+            "external_id": paper.external_id,
+            "body_id": body_id,
+            "name": paper.name,
+            "reference": paper.reference,
+            "paper_type": paper.paper_type,
+            "date": paper.date,
+            "oparl_created": paper.oparl_created,
+            "oparl_modified": paper.oparl_modified,
+            "raw_json": paper.raw_json,
+            "content_hash": paper.content_hash,
+        }
+
+    async def upsert_papers_batch(
+        self,
+        papers: list[ProcessedPaper],
+        body_id: UUID,
+    ) -> dict[str, UUID]:
+        """
+        Insert or update a page of papers in one transaction.
+
+        Nested entities are not written here (see upsert_paper).
+
+        Returns:
+            Mapping external_id -> paper UUID
+        """
+        ids = await self._upsert_rows(
+            OParlPaper, [self._paper_row(p, body_id) for p in papers]
+        )
+        self.resolver.remember("paper", ids)
+        return ids
+
     async def upsert_paper(
         self,
         paper: ProcessedPaper,
         body_id: UUID,
     ) -> UUID:
-        """Insert or update a paper."""
-        async with self.get_session() as session:
-            stmt = pg_insert(OParlPaper).values(
-                id=paper.id,
-                external_id=paper.external_id,
-                body_id=body_id,
-                name=paper.name,
-                reference=paper.reference,
-                paper_type=paper.paper_type,
-                date=paper.date,
-                oparl_created=paper.oparl_created,
-                oparl_modified=paper.oparl_modified,
-                raw_json=paper.raw_json,
-            )
-            stmt = stmt.on_conflict_do_update(
-                index_elements=["external_id"],
-                set_={
-                    "name": stmt.excluded.name,
-                    "reference": stmt.excluded.reference,
-                    "paper_type": stmt.excluded.paper_type,
-                    "date": stmt.excluded.date,
-                    "oparl_created": stmt.excluded.oparl_created,
-                    "oparl_modified": stmt.excluded.oparl_modified,
-                    "raw_json": stmt.excluded.raw_json,
-                    "updated_at": func.now(),
-                },
-            ).returning(OParlPaper.id)
+        """Insert or update a paper including its nested entities."""
+        ids = await self.upsert_papers_batch([paper], body_id)
+        paper_id = ids[paper.external_id]
+        await self.upsert_papers_nested_batch([(paper, paper_id)], body_id)
+        return paper_id
 
-            result = await session.execute(stmt)
-            paper_id = result.scalar_one()
-            await session.commit()
+    async def upsert_papers_nested_batch(
+        self,
+        papers: list[tuple[ProcessedPaper, UUID]],
+        body_id: UUID,
+    ) -> dict[str, int]:
+        """
+        Write the files and consultations embedded in a page of papers.
+
+        Like upsert_meetings_nested_batch: one bulk statement per type,
+        duplicates collapsed by external_id.
 
-            self._paper_uuid_cache[paper.external_id] = paper_id
+        Args:
+            papers: Papers with the UUIDs returned by upsert_papers_batch
+            body_id: Body UUID
 
-            # Process nested entities
+        Returns:
+            Number of written entities per type ("file", "consultation")
+        """
+        files: list[tuple[ProcessedFile, UUID | None, UUID | None]] = []
+        consultations: list[tuple[ProcessedConsultation, UUID | None]] = []
+        for paper, paper_id in papers:
             for nested in paper.nested_entities:
                 if isinstance(nested, ProcessedFile):
-                    await self.upsert_file(nested, body_id, paper_id=paper_id)
+                    files.append((nested, paper_id, None))
                 elif isinstance(nested, ProcessedConsultation):
-                    await self.upsert_consultation(nested, body_id, paper_id)
+                    consultations.append((nested, paper_id))
 
-            return paper_id
+        return {
+            "file": len(await self.upsert_files_batch(files, body_id)),
+            "consultation": len(await self.upsert_consultations_batch(consultations, body_id)),
+        }
 
     async def get_paper_uuid(self, external_id: str) -> UUID | None:
         """Get a paper's UUID by external ID (cached)."""
-        if external_id in self._paper_uuid_cache:
-            return self._paper_uuid_cache[external_id]
-
-        async with self.get_session() as session:
-            stmt = select(OParlPaper.id).where(OParlPaper.external_id == external_id)
-            result = await session.execute(stmt)
-            uuid = result.scalar_one_or_none()
-            if uuid:
-                self._paper_uuid_cache[external_id] = uuid
-            return uuid
+        return await self.resolver.resolve("paper", external_id)
 
     # ========== Person Operations ==========
 
+    @staticmethod
+    def _person_row(person: ProcessedPerson, body_id: UUID) -> dict[str, Any]:
+        return {
+            "id": person.id,
+            "external_id": person.external_id,
+            "body_id": body_id,
+            "name": person.name,
+            "family_name": person.family_name,
+            "given_name": person.given_name,
+            "title": person.title,
+            "gender": person.gender,
+            "email": person.email,
+            "phone": person.phone,
+            "oparl_created": person.oparl_created,
+            "oparl_modified": person.oparl_modified,
+            "raw_json": person.raw_json,
+            "content_hash": person.content_hash,
+        }
+
+    async def upsert_persons_batch(
+        self,
+        persons: list[ProcessedPerson],
+        body_id: UUID,
+    ) -> dict[str, UUID]:
+        """Insert or update a page of persons in one transaction."""
+        ids = await self._upsert_rows(
+            OParlPerson, [self._person_row(p, body_id) for p in persons]
+        )
+        self.resolver.remember("person", ids)
+        return ids
+
     async def upsert_person(
         self,
         person: ProcessedPerson,
         body_id: UUID,
     ) -> UUID:
         """Insert or update a person."""
-        async with self.get_session() as session:
-            stmt = pg_insert(OParlPerson).values(
-                id=person.id,
-                external_id=person.external_id,
-                body_id=body_id,
-                name=person.name,
-                family_name=person.family_name,
-                given_name=person.given_name,
-                title=person.title,
-                gender=person.gender,
-                email=person.email,
-                phone=person.phone,
-                oparl_created=person.oparl_created,
-                oparl_modified=person.oparl_modified,
-                raw_json=person.raw_json,
-            )
-            stmt = stmt.on_conflict_do_update(
-                index_elements=["external_id"],
-                set_={
-                    "name": stmt.excluded.name,
-                    "family_name": stmt.excluded.family_name,
-                    "given_name": stmt.excluded.given_name,
-                    "title": stmt.excluded.title,
-                    "gender": stmt.excluded.gender,
-                    "email": stmt.excluded.email,
-                    "phone": stmt.excluded.phone,
-                    "oparl_created": stmt.excluded.oparl_created,
-                    "oparl_modified": stmt.excluded.oparl_modified,
-                    "raw_json": stmt.excluded.raw_json,
-                    "updated_at": func.now(),
-                },
-            ).returning(OParlPerson.id)
+        ids = await self.upsert_persons_batch([person], body_id)
+        return ids[person.external_id]
 
-            result = await session.execute(stmt)
-            person_id = result.scalar_one()
-            await session.commit()
+    # ========== Organization Operations ==========
 
-            self._person_uuid_cache[person.external_id] = person_id
-            return person_id
+    @staticmethod
+    def _organization_row(org: ProcessedOrganization, body_id: UUID) -> dict[str, Any]:
+        return {
+            "id": org.id,
+            "external_id": org.external_id,
+            "body_id": body_id,
+            "name": org.name,
+            "short_name": org.short_name,
+            "organization_type": org.organization_type,
+            "classification": org.classification,
+            "start_date": org.start_date,
+            "end_date": org.end_date,
+            "website": org.website,
+            "oparl_created": org.oparl_created,
+            "oparl_modified": org.oparl_modified,
+            "raw_json": org.raw_json,
+            "content_hash": org.content_hash,
+        }
 
-    # ========== Organization Operations ==========
+    async def upsert_organizations_batch(
+        self,
+        orgs: list[ProcessedOrganization],
+        body_id: UUID,
+    ) -> dict[str, UUID]:
+        """Insert or update a page of organizations in one transaction."""
+        ids = await self._upsert_rows(
+            OParlOrganization, [self._organization_row(o, body_id) for o in orgs]
+        )
+        self.resolver.remember("organization", ids)
+        return ids
 
     async def upsert_organization(
         self,
@@ -558,47 +1020,43 @@ class DatabaseStorage:
         body_id: UUID,
     ) -> UUID:
         """Insert or update an organization."""
-        async with self.get_session() as session:
-            stmt = pg_insert(OParlOrganization).values(
-                id=org.id,
-                external_id=org.external_id,
-                body_id=body_id,
-                name=org.name,
-                short_name=org.short_name,
-                organization_type=org.organization_type,
-                classification=org.classification,
-                start_date=org.start_date,
-                end_date=org.end_date,
-                website=org.website,
-                oparl_created=org.oparl_created,
-                oparl_modified=org.oparl_modified,
-                raw_json=org.raw_json,
-            )
-            stmt = stmt.on_conflict_do_update(
-                index_elements=["external_id"],
-                set_={
-                    "name": stmt.excluded.name,
-                    "short_name": stmt.excluded.short_name,
-                    "organization_type": stmt.excluded.organization_type,
-                    "classification": stmt.excluded.classification,
-                    "start_date": stmt.excluded.start_date,
-                    "end_date": stmt.excluded.end_date,
-                    "website": stmt.excluded.website,
-                    "oparl_created": stmt.excluded.oparl_created,
-                    "oparl_modified": stmt.excluded.oparl_modified,
-                    "raw_json": stmt.excluded.raw_json,
-                    "updated_at": func.now(),
-                },
-            ).returning(OParlOrganization.id)
+        ids = await self.upsert_organizations_batch([org], body_id)
+        return ids[org.external_id]
 
-            result = await session.execute(stmt)
-            org_id = result.scalar_one()
-            await session.commit()
+    # ========== Agenda Item Operations ==========
 
-            self._organization_uuid_cache[org.external_id] = org_id
-            return org_id
+    @staticmethod
+    def _agenda_item_row(item: ProcessedAgendaItem, meeting_id: UUID) -> dict[str, Any]:
+        return {
+            "id": item.id,
+            "external_id": item.external_id,
+            "meeting_id": meeting_id,
+            "number": item.number,
+            "order": item.order,
+            "name": item.name,
+            "public": item.public,
+            "result": item.result,
+            "resolution_text": item.resolution_text,
+            "oparl_created": item.oparl_created,
+            "oparl_modified": item.oparl_modified,
+            "raw_json": item.raw_json,
+            "content_hash": item.content_hash,
+        }
 
-    # ========== Agenda Item Operations ==========
+    async def upsert_agenda_items_batch(
+        self,
+        items: list[tuple[ProcessedAgendaItem, UUID]],
+    ) -> dict[str, UUID]:
+        """
+        Insert or update agenda items in one transaction.
+
+        Args:
+            items: (agenda item, meeting UUID) pairs
+        """
+        return await self._upsert_rows(
+            OParlAgendaItem,
+            [self._agenda_item_row(item, meeting_id) for item, meeting_id in items],
+        )
 
     async def upsert_agenda_item(
         self,
@@ -606,45 +1064,61 @@ class DatabaseStorage:
         meeting_id: UUID,
     ) -> UUID:
         """Insert or update an agenda item."""
-        async with self.get_session() as session:
-            stmt = pg_insert(OParlAgendaItem).values(
-                id=item.id,
-                external_id=item.external_id,
-                meeting_id=meeting_id,
-                number=item.number,
-                order=item.order,
-                name=item.name,
-                public=item.public,
-                result=item.result,
-                resolution_text=item.resolution_text,
-                oparl_created=item.oparl_created,
-                oparl_modified=item.oparl_modified,
-                raw_json=item.raw_json,
-            )
-            stmt = stmt.on_conflict_do_update(
-                index_elements=["external_id"],
-                set_={
-                    "meeting_id": meeting_id,
-                    "number": stmt.excluded.number,
-                    "order": stmt.excluded.order,
-                    "name": stmt.excluded.name,
-                    "public": stmt.excluded.public,
-                    "result": stmt.excluded.result,
-                    "resolution_text": stmt.excluded.resolution_text,
-                    "oparl_created": stmt.excluded.oparl_created,
-                    "oparl_modified": stmt.excluded.oparl_modified,
-                    "raw_json": stmt.excluded.raw_json,
-                    "updated_at": func.now(),
-                },
-            ).returning(OParlAgendaItem.id)
-
-            result = await session.execute(stmt)
-            item_id = result.scalar_one()
-            await session.commit()
-            return item_id
+        ids = await self.upsert_agenda_items_batch([(item, meeting_id)])
+        return ids[item.external_id]
 
     # ========== File Operations ==========
 
+    @staticmethod
+    def _file_row(
+        file: ProcessedFile,
+        body_id: UUID,
+        paper_id: UUID | None,
+        meeting_id: UUID | None,
+    ) -> dict[str, Any]:
+        return {
+            "id": file.id,
+            "external_id": file.external_id,
+            "body_id": body_id,
+            "paper_id": paper_id,
+            "meeting_id": meeting_id,
+            "name": file.name,
+            "file_name": file.file_name,
+            "mime_type": file.mime_type,
+            "size": file.size,
+            "access_url": file.access_url,
+            "download_url": file.download_url,
+            "file_date": file.date,
+            "oparl_created": file.oparl_created,
+            "oparl_modified": file.oparl_modified,
+            "raw_json": file.raw_json,
+            "content_hash": file.content_hash,
+        }
+
+    async def upsert_files_batch(
+        self,
+        files: list[tuple[ProcessedFile, UUID | None, UUID | None]],
+        body_id: UUID,
+    ) -> dict[str, UUID]:
+        """
+        Insert or update files in one transaction.
+
+        paper_id/meeting_id are only updated when a value is given, so syncing
+        standalone files does not remove links set by their parent entity.
+
+        Args:
+            files: (file, paper UUID, meeting UUID) triples
+            body_id: The body UUID the files belong to
+        """
+        return await self._upsert_rows(
+            OParlFile,
+            [
+                self._file_row(file, body_id, paper_id, meeting_id)
+                for file, paper_id, meeting_id in files
+            ],
+            keep_existing=("paper_id", "meeting_id"),
+        )
+
     async def upsert_file(
         self,
         file: ProcessedFile,
@@ -653,59 +1127,38 @@ class DatabaseStorage:
         meeting_id: UUID | None = None,
     ) -> UUID:
         """Insert or update a file."""
-        async with self.get_session() as session:
-            stmt = pg_insert(OParlFile).values(
-                id=file.id,
-                external_id=file.external_id,
-                body_id=body_id,
-                paper_id=paper_id,
-                meeting_id=meeting_id,
-                name=file.name,
-                file_name=file.file_name,
-                mime_type=file.mime_type,
-                size=file.size,
-                access_url=file.access_url,
-                download_url=file.download_url,
-                file_date=file.date,
-                oparl_created=file.oparl_created,
-                oparl_modified=file.oparl_modified,
-                raw_json=file.raw_json,
-            )
+        ids = await self.upsert_files_batch([(file, paper_id, meeting_id)], body_id)
+        return ids[file.external_id]
 
-            # Build update set - only update paper_id/meeting_id if we have values
-            # This prevents overwriting existing links when syncing standalone files
-            update_set = {
-                "name": stmt.excluded.name,
-                "file_name": stmt.excluded.file_name,
-                "mime_type": stmt.excluded.mime_type,
-                "size": stmt.excluded.size,
-                "access_url": stmt.excluded.access_url,
-                "download_url": stmt.excluded.download_url,
-                "file_date": stmt.excluded.file_date,
-                "oparl_created": stmt.excluded.oparl_created,
-                "oparl_modified": stmt.excluded.oparl_modified,
-                "raw_json": stmt.excluded.raw_json,
-                "updated_at": func.now(),
-            }
-
-            # Only update paper_id if provided (don't overwrite existing link)
-            if paper_id is not None:
-                update_set["paper_id"] = paper_id
-            # Only update meeting_id if provided
-            if meeting_id is not None:
-                update_set["meeting_id"] = meeting_id
-
-            stmt = stmt.on_conflict_do_update(
-                index_elements=["external_id"],
-                set_=update_set,
-            ).returning(OParlFile.id)
+    # ========== Location Operations ==========
 
-            result = await session.execute(stmt)
-            file_id = result.scalar_one()
-            await session.commit()
-            return file_id
+    @staticmethod
+    def _location_row(location: ProcessedLocation, body_id: UUID) -> dict[str, Any]:
+        return {
+            "id": location.id,
+            "external_id": location.external_id,
+            "body_id": body_id,
+            "description": location.description,
+            "street_address": location.street_address,
+            "room": location.room,
+            "postal_code": location.postal_code,
+            "locality": location.locality,
+            "geojson": location.geojson,
+            "oparl_created": location.oparl_created,
+            "oparl_modified": location.oparl_modified,
+            "raw_json": location.raw_json,
+            "content_hash": location.content_hash,
+        }
 
-    # ========== Location Operations ==========
+    async def upsert_locations_batch(
+        self,
+        locations: list[ProcessedLocation],
+        body_id: UUID,
+    ) -> dict[str, UUID]:
+        """Insert or update locations in one transaction."""
+        return await self._upsert_rows(
+            OParlLocation, [self._location_row(loc, body_id) for loc in locations]
+        )
 
     async def upsert_location(
         self,
@@ -713,44 +1166,50 @@ class DatabaseStorage:
         body_id: UUID,
     ) -> UUID:
         """Insert or update a location."""
-        async with self.get_session() as session:
-            stmt = pg_insert(OParlLocation).values(
-                id=location.id,
-                external_id=location.external_id,
-                body_id=body_id,
-                description=location.description,
-                street_address=location.street_address,
-                room=location.room,
-                postal_code=location.postal_code,
-                locality=location.locality,
-                geojson=location.geojson,
-                oparl_created=location.oparl_created,
-                oparl_modified=location.oparl_modified,
-                raw_json=location.raw_json,
-            )
-            stmt = stmt.on_conflict_do_update(
-                index_elements=["external_id"],
-                set_={
-                    "description": stmt.excluded.description,
-                    "street_address": stmt.excluded.street_address,
-                    "room": stmt.excluded.room,
-                    "postal_code": stmt.excluded.postal_code,
-                    "locality": stmt.excluded.locality,
-                    "geojson": stmt.excluded.geojson,
-                    "oparl_created": stmt.excluded.oparl_created,
-                    "oparl_modified": stmt.excluded.oparl_modified,
-                    "raw_json": stmt.excluded.raw_json,
-                    "updated_at": func.now(),
-                },
-            ).returning(OParlLocation.id)
-
-            result = await session.execute(stmt)
-            location_id = result.scalar_one()
-            await session.commit()
-            return location_id
+        ids = await self.upsert_locations_batch([location], body_id)
+        return ids[location.external_id]
 
     # ========== Consultation Operations ==========
 
+    @staticmethod
+    def _consultation_row(
+        consultation: ProcessedConsultation,
+        body_id: UUID,
+        paper_id: UUID | None,
+    ) -> dict[str, Any]:
+        return {
+            "id": consultation.id,
+            "external_id": consultation.external_id,
+            "body_id": body_id,
+            "paper_id": paper_id,
+            "paper_external_id": consultation.paper_external_id,
+            "meeting_external_id": consultation.meeting_external_id,
+            "agenda_item_external_id": consultation.agenda_item_external_id,
+            "role": consultation.role,
+            "authoritative": consultation.authoritative,
+            "oparl_created": consultation.oparl_created,
+            "oparl_modified": consultation.oparl_modified,
+            "raw_json": consultation.raw_json,
+            "content_hash": consultation.content_hash,
+        }
+
+    async def upsert_consultations_batch(
+        self,
+        consultations: list[tuple[ProcessedConsultation, UUID | None]],
+        body_id: UUID,
+    ) -> dict[str, UUID]:
+        """
+        Insert or update consultations in one transaction.
+
+        Args:
+            consultations: (consultation, paper UUID) pairs
+            body_id: The body UUID the consultations belong to
+        """
+        return await self._upsert_rows(
+            OParlConsultation,
+            [self._consultation_row(c, body_id, paper_id) for c, paper_id in consultations],
+        )
+
     async def upsert_consultation(
         self,
         consultation: ProcessedConsultation,
@@ -758,103 +1217,91 @@ class DatabaseStorage:
         paper_id: UUID | None = None,
     ) -> UUID:
         """Insert or update a consultation."""
-        async with self.get_session() as session:
-            stmt = pg_insert(OParlConsultation).values(
-                id=consultation.id,
-                external_id=consultation.external_id,
-                body_id=body_id,
-                paper_id=paper_id,
-                paper_external_id=consultation.paper_external_id,
-                meeting_external_id=consultation.meeting_external_id,
-                agenda_item_external_id=consultation.agenda_item_external_id,
-                role=consultation.role,
-                authoritative=consultation.authoritative,
-                oparl_created=consultation.oparl_created,
-                oparl_modified=consultation.oparl_modified,
-                raw_json=consultation.raw_json,
-            )
-            stmt = stmt.on_conflict_do_update(
-                index_elements=["external_id"],
-                set_={
-                    "paper_id": paper_id,
-                    "paper_external_id": stmt.excluded.paper_external_id,
-                    "meeting_external_id": stmt.excluded.meeting_external_id,
-                    "agenda_item_external_id": stmt.excluded.agenda_item_external_id,
-                    "role": stmt.excluded.role,
-                    "authoritative": stmt.excluded.authoritative,
-                    "oparl_created": stmt.excluded.oparl_created,
-                    "oparl_modified": stmt.excluded.oparl_modified,
-                    "raw_json": stmt.excluded.raw_json,
-                    "updated_at": func.now(),
-                },
-            ).returning(OParlConsultation.id)
-
-            result = await session.execute(stmt)
-            consultation_id = result.scalar_one()
-            await session.commit()
-            return consultation_id
+        ids = await self.upsert_consultations_batch([(consultation, paper_id)], body_id)
+        return ids[consultation.external_id]
 
     # ========== Membership Operations ==========
 
+    @staticmethod
+    def _membership_row(
+        membership: ProcessedMembership,
+        body_id: UUID,
+        person_ids: dict[str, UUID],
+        organization_ids: dict[str, UUID],
+    ) -> dict[str, Any]:
+        return {
+            "id": membership.id,
+            "external_id": membership.external_id,
+            "body_id": body_id,
+            "person_id": person_ids.get(membership.person_external_id or ""),
+            "organization_id": organization_ids.get(membership.organization_external_id or ""),
+            "person_external_id": membership.person_external_id,
+            "organization_external_id": membership.organization_external_id,
+            "role": membership.role,
+            "voting_right": membership.voting_right,
+            "start_date": membership.start_date,
+            "end_date": membership.end_date,
+            "oparl_created": membership.oparl_created,
+            "oparl_modified": membership.oparl_modified,
+            "raw_json": membership.raw_json,
+            "content_hash": membership.content_hash,
+        }
+
+    async def upsert_memberships_batch(
+        self,
+        memberships: list[ProcessedMembership],
+        body_id: UUID,
+    ) -> dict[str, UUID]:
+        """Insert or update a page of memberships in one transaction."""
+        # Persons and organizations are synced before memberships, so these
+        # are usually answered by the resolver cache
+        person_ids = await self.resolver.resolve_many(
+            "person", [m.person_external_id for m in memberships if m.person_external_id]
+        )
+        organization_ids = await self.resolver.resolve_many(
+            "organization",
+            [m.organization_external_id for m in memberships if m.organization_external_id],
+        )
+        return await self._upsert_rows(
+            OParlMembership,
+            [self._membership_row(m, body_id, person_ids, organization_ids) for m in memberships],
+        )
+
     async def upsert_membership(
         self,
         membership: ProcessedMembership,
         body_id: UUID,
     ) -> UUID:
         """Insert or update a membership."""
-        # Try to resolve person and organization UUIDs
-        person_id = None
-        organization_id = None
-
-        if membership.person_external_id:
-            if membership.person_external_id in self._person_uuid_cache:
-                person_id = self._person_uuid_cache[membership.person_external_id]
+        ids = await self.upsert_memberships_batch([membership], body_id)
+        return ids[membership.external_id]
 
-        if membership.organization_external_id:
-            if membership.organization_external_id in self._organization_uuid_cache:
-                organization_id = self._organization_uuid_cache[membership.organization_external_id]
-
-        async with self.get_session() as session:
-            stmt = pg_insert(OParlMembership).values(
-                id=membership.id,
-                external_id=membership.external_id,
-                body_id=body_id,
-                person_id=person_id,
-                organization_id=organization_id,
-                person_external_id=membership.person_external_id,
-                organization_external_id=membership.organization_external_id,
-                role=membership.role,
-                voting_right=membership.voting_right,
-                start_date=membership.start_date,
-                end_date=membership.end_date,
-                oparl_created=membership.oparl_created,
-                oparl_modified=membership.oparl_modified,
-                raw_json=membership.raw_json,
-            )
-            stmt = stmt.on_conflict_do_update(
-                index_elements=["external_id"],
-                set_={
-                    "person_id": person_id,
-                    "organization_id": organization_id,
-                    "person_external_id": stmt.excluded.person_external_id,
-                    "organization_external_id": stmt.excluded.organization_external_id,
-                    "role": stmt.excluded.role,
-                    "voting_right": stmt.excluded.voting_right,
-                    "start_date": stmt.excluded.start_date,
-                    "end_date": stmt.excluded.end_date,
-                    "oparl_created": stmt.excluded.oparl_created,
-                    "oparl_modified": stmt.excluded.oparl_modified,
-                    "raw_json": stmt.excluded.raw_json,
-                    "updated_at": func.now(),
-                },
-            ).returning(OParlMembership.id)
+    # ========== Legislative Term Operations ==========
 
-            result = await session.execute(stmt)
-            membership_id = result.scalar_one()
-            await session.commit()
-            return membership_id
+    @staticmethod
+    def _legislative_term_row(term: ProcessedLegislativeTerm, body_id: UUID) -> dict[str, Any]:
+        return {
+            "id": term.id,
+            "external_id": term.external_id,
+            "body_id": body_id,
+            "name": term.name,
+            "start_date": term.start_date,
+            "end_date": term.end_date,
+            "oparl_created": term.oparl_created,
+            "oparl_modified": term.oparl_modified,
+            "raw_json": term.raw_json,
+            "content_hash": term.content_hash,
+        }
 
-    # ========== Legislative Term Operations ==========
+    async def upsert_legislative_terms_batch(
+        self,
+        terms: list[ProcessedLegislativeTerm],
+        body_id: UUID,
+    ) -> dict[str, UUID]:
+        """Insert or update legislative terms in one transaction."""
+        return await self._upsert_rows(
+            OParlLegislativeTerm, [self._legislative_term_row(t, body_id) for t in terms]
+        )
 
     async def upsert_legislative_term(
         self,
@@ -862,35 +1309,8 @@ class DatabaseStorage:
         body_id: UUID,
     ) -> UUID:
         """Insert or update a legislative term."""
-        async with self.get_session() as session:
-            stmt = pg_insert(OParlLegislativeTerm).values(
-                id=term.id,
-                external_id=term.external_id,
-                body_id=body_id,
-                name=term.name,
-                start_date=term.start_date,
-                end_date=term.end_date,
-                oparl_created=term.oparl_created,
-                oparl_modified=term.oparl_modified,
-                raw_json=term.raw_json,
-            )
-            stmt = stmt.on_conflict_do_update(
-                index_elements=["external_id"],
-                set_={
-                    "name": stmt.excluded.name,
-                    "start_date": stmt.excluded.start_date,
-                    "end_date": stmt.excluded.end_date,
-                    "oparl_created": stmt.excluded.oparl_created,
-                    "oparl_modified": stmt.excluded.oparl_modified,
-                    "raw_json": stmt.excluded.raw_json,
-                    "updated_at": func.now(),
-                },
-            ).returning(OParlLegislativeTerm.id)
-
-            result = await session.execute(stmt)
-            term_id = result.scalar_one()
-            await session.commit()
-            return term_id
+        ids = await self.upsert_legislative_terms_batch([term], body_id)
+        return ids[term.external_id]
 
     # ========== Generic Entity Dispatcher ==========
 
@@ -936,16 +1356,46 @@ class DatabaseStorage:
         body_id: UUID,
     ) -> int:
         """
-        Upsert multiple entities in a batch.
+        Upsert multiple entities with one multi-row statement per entity type.
+
+        Nested entities of meetings and papers are written after their parents.
+        Types without a table (e.g. standalone agenda items without meeting) are skipped.
 
         Returns the number of entities processed.
         """
-        count = 0
-        for entity in entities:
-            result = await self.upsert_entity(entity, body_id)
-            if result:
-                count += 1
-        return count
+        meetings = [e for e in entities if isinstance(e, ProcessedMeeting)]
+        papers = [e for e in entities if isinstance(e, ProcessedPaper)]
+
+        written: dict[str, UUID] = {}
+        written.update(await self.upsert_meetings_batch(meetings, body_id))
+        written.update(await self.upsert_papers_batch(papers, body_id))
+        written.update(await self.upsert_persons_batch(
+            [e for e in entities if isinstance(e, ProcessedPerson)], body_id
+        ))
+        written.update(await self.upsert_organizations_batch(
+            [e for e in entities if isinstance(e, ProcessedOrganization)], body_id
+        ))
+        written.update(await self.upsert_memberships_batch(
+            [e for e in entities if isinstance(e, ProcessedMembership)], body_id
+        ))
+        written.update(await self.upsert_locations_batch(
+            [e for e in entities if isinstance(e, ProcessedLocation)], body_id
+        ))
+        written.update(await self.upsert_legislative_terms_batch(
+            [e for e in entities if isinstance(e, ProcessedLegislativeTerm)], body_id
+        ))
+        written.update(await self.upsert_files_batch(
+            [(e, None, None) for e in entities if isinstance(e, ProcessedFile)], body_id
+        ))
+
+        await self.upsert_meetings_nested_batch(
+            [(m, written[m.external_id]) for m in meetings], body_id
+        )
+        await self.upsert_papers_nested_batch(
+            [(p, written[p.external_id]) for p in papers], body_id
+        )
+
+        return sum(1 for entity in entities if entity.external_id in written)
 
     # ========== Statistics ==========
 
@@ -976,6 +1426,99 @@ class DatabaseStorage:
 
             return stats
 
+    async def refresh_body_statistics(self, body_id: UUID) -> dict[str, Any]:
+        """
+        Recompute the overview counters of a body (oparl_body_statistics).
+
+        All counts are filtered by body_id and run as one statement; the
+        monthly series is a second one. Time-dependent values (this year,
+        upcoming meetings) are as of now; papers_this_year counts papers
+        dated within the current calendar year (UTC), like Django's
+        BodyStatistics.refresh.
+
+        Returns:
+            The stored row
+        """
+        now = datetime.now(UTC)
+        year_start = datetime(now.year, 1, 1, tzinfo=UTC)
+        next_year_start = year_start.replace(year=now.year + 1)
+        months_start = datetime(now.year - 1, now.month, 1, tzinfo=UTC)
+
+        def count(model: Any, *conditions: Any) -> Any:
+            return (
+                select(func.count())
+                .select_from(model)
+                .where(model.body_id == body_id, *conditions)
+                .scalar_subquery()
+            )
+
+        counts_stmt = select(
+            count(OParlPaper).label("papers_total"),
+            count(
+                OParlPaper, OParlPaper.date >= year_start, OParlPaper.date < next_year_start
+            ).label("papers_this_year"),
+            count(OParlMeeting).label("meetings_total"),
+            count(
+                OParlMeeting, OParlMeeting.start > now, OParlMeeting.cancelled.is_not(True)
+            ).label("meetings_upcoming"),
+            count(OParlOrganization).label("organizations_total"),
+            count(
+                OParlOrganization,
+                or_(
+                    OParlOrganization.end_date.is_(None),
+                    OParlOrganization.end_date >= func.current_date(),
+                ),
+            ).label("organizations_active"),
+            count(OParlPerson).label("persons_total"),
+            count(OParlFile).label("files_total"),
+            count(
+                OParlFile, OParlFile.text_content.is_not(None), OParlFile.text_content != ""
+            ).label("files_with_text"),
+            # Agenda items belong to a body through their meeting
+            select(func.count())
+            .select_from(OParlAgendaItem)
+            .join(OParlMeeting, OParlAgendaItem.meeting_id == OParlMeeting.id)
+            .where(OParlMeeting.body_id == body_id)
+            .scalar_subquery()
+            .label("agenda_items_total"),
+            count(OParlMembership).label("memberships_total"),
+            count(OParlLocation).label("locations_total"),
+            count(OParlConsultation).label("consultations_total"),
+        )
+
+        def per_month(name: str, column: Any, model: Any) -> Any:
+            month = func.to_char(func.date_trunc("month", column), "YYYY-MM")
+            return (
+                select(
+                    literal(name).label("series"), month.label("month"), func.count().label("count")
+                )
+                .where(model.body_id == body_id, column >= months_start, column <= now)
+                .group_by(month)
+            )
+
+        monthly_stmt = union_all(
+            per_month("papers", OParlPaper.date, OParlPaper),
+            per_month("meetings", OParlMeeting.start, OParlMeeting),
+        )
+
+        async with self.get_session() as session:
+            row: dict[str, Any] = dict((await session.execute(counts_stmt)).one()._mapping)
+
+            monthly: dict[str, dict[str, int]] = {"papers": {}, "meetings": {}}
+            for series, month, month_count in (await session.execute(monthly_stmt)).all():
+                monthly[series][month] = month_count
+
+            row.update(body_id=body_id, monthly=monthly, year=now.year, computed_at=now)
+            stmt = pg_insert(OParlBodyStatistics).values(row)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["body_id"],
+                set_={key: stmt.excluded[key] for key in row if key != "body_id"},
+            )
+            await session.execute(stmt)
+            await session.commit()
+
+        return row
+
     async def get_all_bodies(self) -> list[OParlBody]:
         """Get all bodies from the database."""
         async with self.get_session() as session:
@@ -10,12 +10,16 @@ from datetime import datetime
 from typing import Any
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
+    Column,
     DateTime,
     ForeignKey,
     Integer,
     String,
+    Table,
     Text,
+    UniqueConstraint,
     func,
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID
@@ -107,6 +111,7 @@ class OParlBody(Base):
 
     # Raw OParl data
     raw_json: Mapped[dict[str, Any]] = mapped_column(JSONB, default=dict)
+    content_hash: Mapped[str | None] = mapped_column(String(64))
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
@@ -173,6 +178,7 @@ class OParlMeeting(Base):
 
     # Raw OParl data
     raw_json: Mapped[dict[str, Any]] = mapped_column(JSONB, default=dict)
+    content_hash: Mapped[str | None] = mapped_column(String(64))
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
@@ -190,6 +196,33 @@ class OParlMeeting(Base):
     files: Mapped[list["OParlFile"]] = relationship(
         back_populates="meeting", cascade="all, delete-orphan"
     )
+    organizations: Mapped[list["OParlOrganization"]] = relationship(
+        secondary="oparl_meetings_organizations", viewonly=True
+    )
+
+
+# Committees of a meeting (OParl Meeting.organization). Django's auto-created
+# through table of OParlMeeting.organizations, hence the column names.
+meeting_organizations = Table(
+    "oparl_meetings_organizations",
+    Base.metadata,
+    Column("id", BigInteger, primary_key=True, autoincrement=True),
+    Column(
+        "oparlmeeting_id",
+        UUID(as_uuid=True),
+        ForeignKey("oparl_meetings.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    ),
+    Column(
+        "oparlorganization_id",
+        UUID(as_uuid=True),
+        ForeignKey("oparl_organizations.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    ),
+    UniqueConstraint("oparlmeeting_id", "oparlorganization_id"),
+)
 
 
 class OParlPaper(Base):
@@ -219,6 +252,7 @@ class OParlPaper(Base):
 
     # Raw OParl data
     raw_json: Mapped[dict[str, Any]] = mapped_column(JSONB, default=dict)
+    content_hash: Mapped[str | None] = mapped_column(String(64))
 
     # AI-enhanced fields
     summary: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -271,6 +305,7 @@ class OParlPerson(Base):
 
     # Raw OParl data
     raw_json: Mapped[dict[str, Any]] = mapped_column(JSONB, default=dict)
+    content_hash: Mapped[str | None] = mapped_column(String(64))
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
@@ -316,6 +351,7 @@ class OParlOrganization(Base):
 
     # Raw OParl data
     raw_json: Mapped[dict[str, Any]] = mapped_column(JSONB, default=dict)
+    content_hash: Mapped[str | None] = mapped_column(String(64))
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
@@ -360,6 +396,7 @@ class OParlAgendaItem(Base):
 
     # Raw OParl data
     raw_json: Mapped[dict[str, Any]] = mapped_column(JSONB, default=dict)
+    content_hash: Mapped[str | None] = mapped_column(String(64))
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
@@ -415,6 +452,7 @@ class OParlFile(Base):
 
     # Raw OParl data
     raw_json: Mapped[dict[str, Any]] = mapped_column(JSONB, default=dict)
+    content_hash: Mapped[str | None] = mapped_column(String(64))
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
@@ -459,6 +497,7 @@ class OParlLocation(Base):
 
     # Raw OParl data
     raw_json: Mapped[dict[str, Any]] = mapped_column(JSONB, default=dict)
+    content_hash: Mapped[str | None] = mapped_column(String(64))
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
@@ -504,6 +543,7 @@ class OParlConsultation(Base):
 
     # Raw OParl data
     raw_json: Mapped[dict[str, Any]] = mapped_column(JSONB, default=dict)
+    content_hash: Mapped[str | None] = mapped_column(String(64))
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
@@ -553,6 +593,7 @@ class OParlMembership(Base):
 
     # Raw OParl data
     raw_json: Mapped[dict[str, Any]] = mapped_column(JSONB, default=dict)
+    content_hash: Mapped[str | None] = mapped_column(String(64))
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
@@ -595,6 +636,7 @@ class OParlLegislativeTerm(Base):
 
     # Raw OParl data
     raw_json: Mapped[dict[str, Any]] = mapped_column(JSONB, default=dict)
+    content_hash: Mapped[str | None] = mapped_column(String(64))
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
@@ -606,3 +648,85 @@ class OParlLegislativeTerm(Base):
 
     # Relationships
     body: Mapped["OParlBody | None"] = relationship(back_populates="legislative_terms")
+
+
+class OParlBodyStatistics(Base):
+    """
+    Precomputed counters of a body for the portal and RIS overview pages.
+
+    Mirrors Django's BodyStatistics. Recomputed by the ingestor after each
+    body sync, so the web views read one row instead of counting the
+    oparl_* tables on every request.
+    """
+
+    __tablename__ = "oparl_body_statistics"
+
+    body_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("oparl_bodies.id", ondelete="CASCADE"), primary_key=True
+    )
+
+    papers_total: Mapped[int] = mapped_column(Integer, default=0)
+    papers_this_year: Mapped[int] = mapped_column(Integer, default=0)
+    meetings_total: Mapped[int] = mapped_column(Integer, default=0)
+    meetings_upcoming: Mapped[int] = mapped_column(Integer, default=0)
+    organizations_total: Mapped[int] = mapped_column(Integer, default=0)
+    organizations_active: Mapped[int] = mapped_column(Integer, default=0)
+    persons_total: Mapped[int] = mapped_column(Integer, default=0)
+    files_total: Mapped[int] = mapped_column(Integer, default=0)
+    files_with_text: Mapped[int] = mapped_column(Integer, default=0)
+    agenda_items_total: Mapped[int] = mapped_column(Integer, default=0)
+    memberships_total: Mapped[int] = mapped_column(Integer, default=0)
+    locations_total: Mapped[int] = mapped_column(Integer, default=0)
+    consultations_total: Mapped[int] = mapped_column(Integer, default=0)
+
+    # {"papers": {"2026-01": 12, ...}, "meetings": {...}} for the last 12 months
+    monthly: Mapped[dict[str, Any]] = mapped_column(JSONB, default=dict)
+
+    # Year of papers_this_year
+    year: Mapped[int] = mapped_column(Integer)
+    computed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+
+
+class OParlHttpValidator(Base):
+    """
+    HTTP cache validators of OParl list pages.
+
+    Ingestor-internal table (not mirrored in Django) that persists ETag and
+    Last-Modified values between sync runs, so unchanged pages can be
+    answered with 304 Not Modified. next_url allows pagination to continue
+    without a response body.
+    """
+
+    __tablename__ = "oparl_http_validators"
+
+    url: Mapped[str] = mapped_column(Text, primary_key=True)
+    etag: Mapped[str | None] = mapped_column(Text, nullable=True)
+    last_modified: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    next_url: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+
+class OParlSyncCheckpoint(Base):
+    """
+    Progress of full syncs per body and entity type.
+
+    Ingestor-internal table (not mirrored in Django). After each stored list
+    page, next_url points to the first page that isn't written yet; NULL
+    means the entity type is complete. `sync --full --resume` continues
+    from here instead of page one.
+    """
+
+    __tablename__ = "oparl_sync_checkpoints"
+
+    body_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    entity_type: Mapped[str] = mapped_column(String(50), primary_key=True)
+    next_url: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
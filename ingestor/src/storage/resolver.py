@@ -0,0 +1,180 @@
+"""
+External ID Resolver
+
+Resolves OParl external IDs (URLs) to the UUIDs of stored rows, for
+references between entities (agenda item -> meeting, file -> paper, ...).
+
+Features:
+- Preloads the maps of a body with one query per entity type
+- Resolves cache misses in batches instead of one SELECT per reference
+- LRU-bounded, so syncing many bodies doesn't grow memory without limit
+- Shared by all entity-type tasks of a DatabaseStorage
+- Hit/miss counters for the sync summary
+
+Usage:
+    resolver = UUIDResolver(storage.get_session)
+    await resolver.preload(body_id)
+    paper_ids = await resolver.resolve_many("paper", external_ids)
+"""
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.storage.models import OParlBody, OParlMeeting, OParlOrganization, OParlPaper, OParlPerson
+
+# Entity types that are referenced by other entities
+RESOLVABLE_MODELS: dict[str, Any] = {
+    "body": OParlBody,
+    "meeting": OParlMeeting,
+    "paper": OParlPaper,
+    "person": OParlPerson,
+    "organization": OParlOrganization,
+}
+
+# External IDs per IN (...) lookup
+LOOKUP_CHUNK_SIZE = 1000
+
+
+class UUIDResolver:
+    """
+    LRU cache external_id -> UUID per entity type, backed by PostgreSQL.
+
+    All entity types share one size budget. Entries are added by preload(),
+    by batch lookups of misses and by the bulk upserts (remember()).
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        max_size: int | None = None,
+    ) -> None:
+        """
+        Initialize the resolver.
+
+        Args:
+            session_factory: Returns a new database session (DatabaseStorage.get_session)
+            max_size: Maximum number of cached IDs over all entity types
+        """
+        self._session_factory = session_factory
+        self.max_size = max_size or settings.resolver_cache_size
+
+        self._cache: OrderedDict[tuple[str, str], UUID] = OrderedDict()
+        self._preloaded: set[tuple[str, UUID]] = set()
+        self._lock = asyncio.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    # ========== Cache ==========
+
+    def remember(self, entity_type: str, ids: Mapping[str, UUID]) -> None:
+        """Add known external_id -> UUID pairs (e.g. returned by a bulk upsert)."""
+        for external_id, uuid in ids.items():
+            key = (entity_type, external_id)
+            self._cache[key] = uuid
+            self._cache.move_to_end(key)
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+
+    def get(self, entity_type: str, external_id: str) -> UUID | None:
+        """Look up a cached UUID without querying the database."""
+        uuid = self._cache.get((entity_type, external_id))
+        if uuid is None:
+            self.misses += 1
+            return None
+        self._cache.move_to_end((entity_type, external_id))
+        self.hits += 1
+        return uuid
+
+    def clear(self) -> None:
+        """Drop all cached IDs (counters are kept)."""
+        self._cache.clear()
+        self._preloaded.clear()
+
+    # ========== Database ==========
+
+    async def preload(
+        self,
+        body_id: UUID,
+        entity_types: Iterable[str] = ("organization", "person", "meeting", "paper"),
+    ) -> None:
+        """
+        Load the ID maps of a body, one query per entity type.
+
+        Bodies larger than the cache only keep their most recently loaded IDs;
+        the rest is resolved in batches on demand.
+        """
+        async with self._lock:
+            for entity_type in entity_types:
+                if (entity_type, body_id) in self._preloaded:
+                    continue
+                model = RESOLVABLE_MODELS[entity_type]
+                async with self._session_factory() as session:
+                    stmt = select(model.external_id, model.id).where(model.body_id == body_id)
+                    result = await session.execute(stmt)
+                    self.remember(entity_type, dict(result.all()))
+                self._preloaded.add((entity_type, body_id))
+
+    async def resolve_many(
+        self,
+        entity_type: str,
+        external_ids: Iterable[str],
+    ) -> dict[str, UUID]:
+        """
+        Resolve external IDs, querying all cache misses at once.
+
+        Returns:
+            Mapping external_id -> UUID for the IDs that exist in the database
+        """
+        resolved: dict[str, UUID] = {}
+        missing: list[str] = []
+        for external_id in dict.fromkeys(external_ids):
+            uuid = self.get(entity_type, external_id)
+            if uuid is None:
+                missing.append(external_id)
+            else:
+                resolved[external_id] = uuid
+
+        if missing:
+            model = RESOLVABLE_MODELS[entity_type]
+            async with self._session_factory() as session:
+                for start in range(0, len(missing), LOOKUP_CHUNK_SIZE):
+                    chunk = missing[start:start + LOOKUP_CHUNK_SIZE]
+                    stmt = select(model.external_id, model.id).where(
+                        model.external_id.in_(chunk)
+                    )
+                    result = await session.execute(stmt)
+                    found = dict(result.all())
+                    self.remember(entity_type, found)
+                    resolved.update(found)
+
+        return resolved
+
+    async def resolve(self, entity_type: str, external_id: str) -> UUID | None:
+        """Resolve a single external ID."""
+        return (await self.resolve_many(entity_type, [external_id])).get(external_id)
+
+    # ========== Statistics ==========
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups answered from the cache (0.0 - 1.0)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache size and hit statistics."""
+        return {
+            "size": len(self._cache),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate, 3),
+        }
@@ -1,5 +1,6 @@
 """Sync module - OParl synchronization logic."""
 
 from src.sync.orchestrator import SyncOrchestrator
+from src.sync.workers import sync_sharded
 
-__all__ = ["SyncOrchestrator"]
+__all__ = ["SyncOrchestrator", "sync_sharded"]
@@ -2,7 +2,8 @@
 Sync Orchestrator
 
 Coordinates the complete OParl synchronization process with:
-- Full and incremental sync modes
+- Full and incremental sync modes (server-side modified_since where supported)
+- Resumable full syncs (checkpoint per body and entity type)
 - Parallel processing of entities
 - Progress tracking and statistics
 - Error handling and retry logic
@@ -11,8 +12,10 @@ Coordinates the complete OParl synchronization process with:
 """
 
 import asyncio
+from collections.abc import Collection
+from contextlib import aclosing
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import UTC, datetime, timedelta, timezone
 from typing import Any
 from uuid import UUID
 
@@ -26,11 +29,17 @@ from rich.progress import (
     TimeElapsedColumn,
 )
 
-from src.client.oparl_client import OParlClient, SyncStats
+from src.client.oparl_client import ListCursor, OParlClient, SyncStats
+from src.client.validator_store import ValidatorStore
 from src.config import settings
 from src.events import EventEmitter
 from src.metrics import metrics
-from src.storage.database import DatabaseStorage
+from src.storage.database import (
+    DatabaseStorage,
+    WriteStats,
+    current_changed_ids,
+    current_write_stats,
+)
 from src.sync.processor import (
     OParlProcessor,
     ProcessedAgendaItem,
@@ -45,9 +54,23 @@ from src.sync.processor import (
     ProcessedPaper,
     ProcessedPerson,
 )
+from src.sync.task_graph import BODY_SYNC_GRAPH, TaskBudget, run_task_graph
 
 console = Console()
 
+# Entity types of a body: stats key, display label, list URL attribute of ProcessedBody
+BODY_ENTITY_TYPES: dict[str, tuple[str, str, str]] = {
+    "organization": ("organizations", "Organizations", "organization_list_url"),
+    "person": ("persons", "Persons", "person_list_url"),
+    "membership": ("memberships", "Memberships", "membership_list_url"),
+    "meeting": ("meetings", "Meetings", "meeting_list_url"),
+    "paper": ("papers", "Papers", "paper_list_url"),
+    "location": ("locations", "Locations", "location_list_url"),
+    "agendaitem": ("agenda_items", "AgendaItems", "agenda_item_list_url"),
+    "file": ("files", "Files", "file_list_url"),
+    "consultation": ("consultations", "Consultations", "consultation_list_url"),
+}
+
 
 @dataclass
 class SyncResult:
@@ -69,6 +92,23 @@ class SyncResult:
     errors: list[str] = field(default_factory=list)
     duration_seconds: float = 0.0
     http_stats: SyncStats | None = None
+    write_stats: WriteStats | None = None
+
+
+def body_matches(
+    body_data: dict[str, Any],
+    body_filter: str | None = None,
+    body_ids: Collection[str] | None = None,
+) -> bool:
+    """Check a body against the name/ID filter and the exact ID list of a sync."""
+    if body_ids is not None and body_data.get("id") not in body_ids:
+        return False
+    if body_filter:
+        return (
+            body_filter.lower() in body_data.get("name", "").lower()
+            or body_filter in body_data.get("id", "")
+        )
+    return True
 
 
 class SyncOrchestrator:
@@ -170,6 +210,8 @@ class SyncOrchestrator:
         url: str,
         full: bool = False,
         body_filter: str | None = None,
+        body_ids: Collection[str] | None = None,
+        resume: bool = False,
     ) -> SyncResult:
         """
         Synchronize a single OParl source.
@@ -178,18 +220,43 @@ class SyncOrchestrator:
             url: The OParl API URL
             full: Whether to perform a full sync (ignores last_sync)
             body_filter: Optional body name/ID filter
+            body_ids: Only sync the bodies with these external IDs (exact match)
+            resume: Continue an interrupted full sync from its checkpoints
 
         Returns:
             SyncResult with statistics
         """
+        # Count written vs. unchanged rows of this source only
+        write_stats = WriteStats()
+        token = current_write_stats.set(write_stats)
+        try:
+            result = await self._sync_source(url, full, body_filter, body_ids, resume)
+        finally:
+            current_write_stats.reset(token)
+        result.write_stats = write_stats
+        return result
+
+    async def _sync_source(
+        self,
+        url: str,
+        full: bool,
+        body_filter: str | None,
+        body_ids: Collection[str] | None,
+        resume: bool = False,
+    ) -> SyncResult:
+        """Synchronize a single OParl source (see sync_source)."""
         start_time = datetime.now(timezone.utc)
         result = SyncResult(source_url=url, source_name="", success=False)
         sync_type = "full" if full else "incremental"
 
         try:
+            validator_store = (
+                ValidatorStore(self.storage) if settings.oparl_validator_store_enabled else None
+            )
             async with OParlClient(
                 max_concurrent=self.max_concurrent,
                 source_name=url.split("/")[2] if "/" in url else "unknown",
+                validator_store=validator_store,
             ) as client:
                 # Fetch system
                 console.print(f"\n[bold blue]Connecting to {url}...[/bold blue]")
@@ -223,21 +290,31 @@ class SyncOrchestrator:
                     result.errors.append("No body list found in system")
                     return result
 
-                # Fetch all bodies
+                # Fetch all bodies, filtering while the list is read so
+                # bodies that aren't synced are never kept
                 console.print("[blue]Fetching bodies list...[/blue]")
-                bodies_data = await client.fetch_list_all(body_list_url)
-                console.print(f"[dim]Found {len(bodies_data)} bodies[/dim]")
-
-                # Filter bodies if requested
-                if body_filter:
-                    bodies_data = [
-                        b for b in bodies_data
-                        if body_filter.lower() in b.get("name", "").lower()
-                        or body_filter in b.get("id", "")
-                    ]
+                bodies_data: list[dict[str, Any]] = []
+                bodies_found = 0
+                async with aclosing(client.fetch_list(body_list_url)) as body_pages:
+                    async for page in body_pages:
+                        bodies_found += len(page)
+                        bodies_data.extend(
+                            b for b in page if body_matches(b, body_filter, body_ids)
+                        )
+                console.print(f"[dim]Found {bodies_found} bodies[/dim]")
+                if body_filter or body_ids is not None:
                     console.print(f"[dim]Filtered to {len(bodies_data)} bodies[/dim]")
 
-                # Sync all bodies IN PARALLEL for massive speedup
+                # Incremental sync: let the server filter by modification date if it can
+                server_filter = False
+                if not full and bodies_data and settings.oparl_modified_since_filter_enabled:
+                    server_filter = await self._supports_modified_since(
+                        client, source_id, bodies_data
+                    )
+
+                # Sync all bodies IN PARALLEL for massive speedup, their
+                # entity-type tasks share one concurrency budget
+                budget = TaskBudget(settings.sync_task_budget)
                 console.print(f"[bold green]Starting PARALLEL sync of {len(bodies_data)} bodies...[/bold green]")
 
                 # Disable Progress bars if syncing multiple bodies in parallel
@@ -253,6 +330,9 @@ class SyncOrchestrator:
                             body_data=body_data,
                             source_id=source_id,
                             full=full,
+                            server_filter=server_filter,
+                            resume=resume,
+                            budget=budget,
                         )
                     except Exception as e:
                         console.print(f"[red]Error syncing {body_data.get('name', 'Unknown')}: {e}[/red]")
@@ -324,16 +404,62 @@ class SyncOrchestrator:
         result.duration_seconds = (datetime.now(timezone.utc) - start_time).total_seconds()
         return result
 
+    async def _supports_modified_since(
+        self,
+        client: OParlClient,
+        source_id: UUID,
+        bodies_data: list[dict[str, Any]],
+    ) -> bool:
+        """
+        Whether the source applies the modified_since list filter.
+
+        The capability is probed once and stored in the source's sync_config;
+        inconclusive probes (e.g. only empty lists) are repeated next time.
+        """
+        sync_config = await self.storage.get_source_sync_config(source_id)
+        if "modified_since_supported" in sync_config:
+            return bool(sync_config["modified_since_supported"])
+
+        # Probe with a list that usually has entries
+        list_urls = [
+            body.get(key)
+            for key in ("paper", "meeting", "person")
+            for body in bodies_data[:1]
+            if isinstance(body.get(key), str)
+        ]
+        for list_url in list_urls:
+            supported = await client.probe_modified_since(list_url)
+            if supported is not None:
+                await self.storage.update_source_sync_config(
+                    source_id, modified_since_supported=supported
+                )
+                state = "supported" if supported else "not supported"
+                console.print(f"[dim]Server-side modified_since filter: {state}[/dim]")
+                return supported
+        return False
+
     async def _sync_body(
         self,
         client: OParlClient,
         body_data: dict[str, Any],
         source_id: UUID,
         full: bool,
+        server_filter: bool = False,
+        resume: bool = False,
+        budget: TaskBudget | None = None,
     ) -> dict[str, Any]:
         """
         Sync a single body and all its entities.
 
+        The entity types run as a task graph (see BODY_SYNC_GRAPH): each one
+        starts when the types it references are synced.
+
+        Args:
+            server_filter: Incremental sync may request only changed objects
+                (the server supports modified_since)
+            resume: Full sync continues from the stored checkpoints
+            budget: Concurrency budget shared with the other bodies of the source
+
         Returns statistics about synced entities.
         """
         stats: dict[str, Any] = {
@@ -360,16 +486,48 @@ class SyncOrchestrator:
         processed_body = self.processor.process_body(body_data, body_external_id)
         body_id = await self.storage.upsert_body(processed_body, source_id)
 
+        # Warm the external_id -> UUID maps for references (one query per type)
+        await self.storage.resolver.preload(body_id)
+
         # Determine modified_since for incremental sync
         modified_since: datetime | None = None
         if not full:
             body_db = await self.storage.get_body_by_external_id(body_external_id)
             if body_db and body_db.last_sync:
                 modified_since = body_db.last_sync
-                console.print(f"[dim]Incremental sync since {modified_since}[/dim]")
+                mode = "server-side filter" if server_filter else "comparing modified dates"
+                console.print(f"[dim]Incremental sync since {modified_since} ({mode})[/dim]")
         else:
             console.print(f"[dim]Full sync: fetching ALL pages[/dim]")
 
+        # Full sync: record progress per entity type, optionally continue from it
+        checkpoints: dict[str, str | None] | None = None
+        if full:
+            if resume:
+                checkpoints = await self.storage.get_sync_checkpoints(body_id)
+                if checkpoints:
+                    console.print(f"[dim]Resuming from {len(checkpoints)} checkpoints[/dim]")
+            else:
+                await self.storage.clear_sync_checkpoints(body_id)
+                checkpoints = {}
+
+        async def sync_entities(entity_type: str) -> int:
+            list_attribute = BODY_ENTITY_TYPES[entity_type][2]
+            count = await self._sync_entity_type(
+                client=client,
+                list_url=getattr(processed_body, list_attribute),
+                entity_type=entity_type,
+                body_id=body_id,
+                body_external_id=body_external_id,
+                body_name=body_name,
+                modified_since=modified_since,
+                server_filter=server_filter,
+                checkpoints=checkpoints,
+                full=full,
+            )
+            progress.update(progress_tasks[entity_type], completed=count, total=count)
+            return count
+
         # Create progress display (disabled when not running in terminal or in parallel mode)
         # Rich doesn't support multiple live displays, so disable when syncing multiple sources
         with Progress(
@@ -381,186 +539,49 @@ class SyncOrchestrator:
             console=console,
             disable=not console.is_terminal or self._parallel_mode,
         ) as progress:
-            # Sync entities in parallel (but ordered for dependencies)
-            # First: Organizations and Persons (no dependencies)
-            task1 = progress.add_task("[cyan]Organizations...", total=None)
-            task2 = progress.add_task("[cyan]Persons...", total=None)
-
-            org_task = self._sync_entity_type(
-                client=client,
-                list_url=processed_body.organization_list_url,
-                entity_type="organization",
-                body_id=body_id,
-                body_external_id=body_external_id,
-                body_name=body_name,
-                modified_since=modified_since,
-                full=full,
-            )
-
-            person_task = self._sync_entity_type(
-                client=client,
-                list_url=processed_body.person_list_url,
-                entity_type="person",
-                body_id=body_id,
-                body_external_id=body_external_id,
-                body_name=body_name,
-                modified_since=modified_since,
-                full=full,
-            )
-
-            org_result, person_result = await asyncio.gather(
-                org_task, person_task, return_exceptions=True
-            )
-
-            if isinstance(org_result, Exception):
-                stats["errors"].append(f"Organizations: {org_result}")
-            else:
-                stats["organizations"] = org_result
-                progress.update(task1, completed=org_result, total=org_result)
-
-            if isinstance(person_result, Exception):
-                stats["errors"].append(f"Persons: {person_result}")
-            else:
-                stats["persons"] = person_result
-                progress.update(task2, completed=person_result, total=person_result)
-
-            # Second: Memberships (depends on persons + organizations)
-            task3 = progress.add_task("[cyan]Memberships...", total=None)
-            membership_result = await self._sync_entity_type(
-                client=client,
-                list_url=processed_body.membership_list_url,
-                entity_type="membership",
-                body_id=body_id,
-                body_external_id=body_external_id,
-                body_name=body_name,
-                modified_since=modified_since,
-                full=full,
-            )
-            stats["memberships"] = membership_result
-            progress.update(task3, completed=membership_result, total=membership_result)
-
-            # Third: Meetings and Papers (parallel, include nested entities)
-            task4 = progress.add_task("[cyan]Meetings...", total=None)
-            task5 = progress.add_task("[cyan]Papers...", total=None)
-
-            meeting_task = self._sync_entity_type(
-                client=client,
-                list_url=processed_body.meeting_list_url,
-                entity_type="meeting",
-                body_id=body_id,
-                body_external_id=body_external_id,
-                body_name=body_name,
-                modified_since=modified_since,
-                full=full,
-            )
-
-            paper_task = self._sync_entity_type(
-                client=client,
-                list_url=processed_body.paper_list_url,
-                entity_type="paper",
-                body_id=body_id,
-                body_external_id=body_external_id,
-                body_name=body_name,
-                modified_since=modified_since,
-                full=full,
-            )
-
-            meeting_result, paper_result = await asyncio.gather(
-                meeting_task, paper_task, return_exceptions=True
-            )
-
-            if isinstance(meeting_result, Exception):
-                stats["errors"].append(f"Meetings: {meeting_result}")
-            else:
-                stats["meetings"] = meeting_result
-                progress.update(task4, completed=meeting_result, total=meeting_result)
-
-            if isinstance(paper_result, Exception):
-                stats["errors"].append(f"Papers: {paper_result}")
-            else:
-                stats["papers"] = paper_result
-                progress.update(task5, completed=paper_result, total=paper_result)
-
-            # Fourth: Locations, AgendaItems, Files, Consultations (parallel)
-            task6 = progress.add_task("[cyan]Locations...", total=None)
-            task7 = progress.add_task("[cyan]AgendaItems...", total=None)
-            task8 = progress.add_task("[cyan]Files...", total=None)
-            task9 = progress.add_task("[cyan]Consultations...", total=None)
-
-            location_task = self._sync_entity_type(
-                client=client,
-                list_url=processed_body.location_list_url,
-                entity_type="location",
-                body_id=body_id,
-                body_external_id=body_external_id,
-                body_name=body_name,
-                modified_since=modified_since,
-                full=full,
-            )
-
-            agenda_item_task = self._sync_entity_type(
-                client=client,
-                list_url=processed_body.agenda_item_list_url,
-                entity_type="agendaitem",
-                body_id=body_id,
-                body_external_id=body_external_id,
-                body_name=body_name,
-                modified_since=modified_since,
-                full=full,
-            )
-
-            file_task = self._sync_entity_type(
-                client=client,
-                list_url=processed_body.file_list_url,
-                entity_type="file",
-                body_id=body_id,
-                body_external_id=body_external_id,
-                body_name=body_name,
-                modified_since=modified_since,
-                full=full,
-            )
-
-            consultation_task = self._sync_entity_type(
-                client=client,
-                list_url=processed_body.consultation_list_url,
-                entity_type="consultation",
-                body_id=body_id,
-                body_external_id=body_external_id,
-                body_name=body_name,
-                modified_since=modified_since,
-                full=full,
-            )
-
-            location_result, agenda_item_result, file_result, consultation_result = await asyncio.gather(
-                location_task, agenda_item_task, file_task, consultation_task, return_exceptions=True
-            )
-
-            if isinstance(location_result, Exception):
-                stats["errors"].append(f"Locations: {location_result}")
-            else:
-                stats["locations"] = location_result
-                progress.update(task6, completed=location_result, total=location_result)
-
-            if isinstance(agenda_item_result, Exception):
-                stats["errors"].append(f"AgendaItems: {agenda_item_result}")
+            # The next incremental sync continues from the start of this one:
+            # objects changed while it ran are requested again
+            sync_started = datetime.now(UTC)
+            progress_tasks = {
+                entity_type: progress.add_task(f"[cyan]{label}...", total=None)
+                for entity_type, (_, label, _) in BODY_ENTITY_TYPES.items()
+            }
+
+            # Each entity type starts as soon as the types it references are done
+            results = await run_task_graph(BODY_SYNC_GRAPH, sync_entities, budget)
+
+        for entity_type, entity_result in results.items():
+            stats_key, label, _ = BODY_ENTITY_TYPES[entity_type]
+            if isinstance(entity_result, BaseException):
+                stats["errors"].append(f"{label}: {entity_result}")
             else:
-                stats["agenda_items"] = agenda_item_result
-                progress.update(task7, completed=agenda_item_result, total=agenda_item_result)
-
-            if isinstance(file_result, Exception):
-                stats["errors"].append(f"Files: {file_result}")
-            else:
-                stats["files"] = file_result
-                progress.update(task8, completed=file_result, total=file_result)
-
-            if isinstance(consultation_result, Exception):
-                stats["errors"].append(f"Consultations: {consultation_result}")
-            else:
-                stats["consultations"] = consultation_result
-                progress.update(task9, completed=consultation_result, total=consultation_result)
+                stats[stats_key] = entity_result
+
+        # Only a sync without failed entity types moves the incremental
+        # baseline - otherwise objects of the failed types would be skipped
+        if not any(isinstance(result, BaseException) for result in results.values()):
+            await self.storage.update_body_sync_time(body_id, sync_started)
+
+        # Every entity type was written completely: the next --resume starts over
+        if checkpoints is not None and all(
+            entity_type in checkpoints and checkpoints[entity_type] is None
+            for entity_type in BODY_ENTITY_TYPES
+        ):
+            await self.storage.clear_sync_checkpoints(body_id)
+
+        # Meetings skipped as unchanged keep the committee links they were
+        # written with: link them to the organizations stored in this run
+        if stats["organizations"]:
+            try:
+                await self.storage.link_meeting_organizations(body_id)
+            except Exception as e:
+                console.print(f"[yellow]Could not link meetings to organizations: {e}[/yellow]")
 
-        # Update body sync time
-        await self.storage.update_body_sync_time(body_id)
+        # Recompute the overview counters read by the web frontend
+        try:
+            await self.storage.refresh_body_statistics(body_id)
+        except Exception as e:
+            console.print(f"[yellow]Could not refresh body statistics: {e}[/yellow]")
 
         # Print summary
         console.print(f"[green]Body sync complete:[/green]")
@@ -573,6 +594,11 @@ class SyncOrchestrator:
         console.print(f"  AgendaItems: {stats['agenda_items']}")
         console.print(f"  Files: {stats['files']}")
         console.print(f"  Consultations: {stats['consultations']}")
+        resolver_stats = self.storage.resolver.get_stats()
+        console.print(
+            f"[dim]  ID resolver: {resolver_stats['hit_rate']:.1%} hits "
+            f"({resolver_stats['size']:,} cached)[/dim]"
+        )
 
         return stats
 
@@ -586,192 +612,468 @@ class SyncOrchestrator:
         body_name: str | None = None,
         modified_since: datetime | None = None,
         full: bool = False,
+        server_filter: bool = False,
+        checkpoints: dict[str, str | None] | None = None,
     ) -> int:
         """
         Sync all entities of a specific type.
 
-        For incremental sync:
+        For incremental sync with server_filter:
+        - Requests the list with modified_since (minus a small overlap)
+        - Every returned item is new or changed → Save
+
+        For incremental sync without server_filter:
         - Fetches pages and checks each item against DB
         - New items (not in DB) → Save
         - Changed items (modified date newer) → Update
         - Unchanged items (in DB, same modified) → Skip
-        - Stops when a full page (25 items) is unchanged
+        - Stops after several consecutive pages without changes
 
         For full sync:
         - Fetches all pages and saves everything
+        - With checkpoints (full sync), the resume position is stored after
+          each written page; an entity type with a checkpoint continues there.
+          It stays at the first page with unwritten entities. checkpoints
+          is updated as well (None: entity type complete)
+        - HTTP validators of a list page are only committed once its items
+          are written, so a failed page is requested unconditionally again
+
+        Fetching, processing and storing run as a pipeline of three stages
+        connected by bounded queues (settings.sync_pipeline_depth pages), so
+        the next pages are downloaded while the current one is written.
+        A full queue blocks the stage in front of it (backpressure).
 
         Returns the number of entities synced.
         """
         if not list_url:
+            if checkpoints is not None:
+                checkpoints[entity_type] = None
             return 0
 
+        if checkpoints and entity_type in checkpoints:
+            if checkpoints[entity_type] is None:
+                console.print(f"[dim]  {entity_type}: already complete (checkpoint)[/dim]")
+                return 0
+            list_url = checkpoints[entity_type]
+            console.print(f"[dim]  {entity_type}: resuming at {list_url}[/dim]")
+
+        depth = max(settings.sync_pipeline_depth, 1)
+        # Pages travel with their resume position and the list pages they
+        # complete (see ListCursor)
+        page_queue: asyncio.Queue[tuple[list[dict[str, Any]], str | None, list[str]] | None] = (
+            asyncio.Queue(maxsize=depth)
+        )
+        store_queue: asyncio.Queue[tuple[list[ProcessedEntity], str | None, list[str]] | None] = (
+            asyncio.Queue(maxsize=depth)
+        )
+        cursor = ListCursor()
+        fetch_error: Exception | None = None
+        processed_all = False
+        pages_valid = True  # All pages stored so far were written completely
         count = 0
-        pages_checked = 0
-        consecutive_existing_pages = 0
-        min_pages_to_check = 10  # Always check at least 10 pages
-        existing_pages_to_stop = 3  # Stop after 3 consecutive pages where ALL items exist
-
-        async for page in client.fetch_list(list_url, max_pages=None):
-            pages_checked += 1
-            existing_on_page = 0
-            new_on_page = 0
-            page_size = len(page)
-
-            if full:
-                # Full sync: just save everything
-                for item in page:
-                    try:
-                        processed = self.processor.process(item, body_external_id)
-                        if processed:
-                            await self._store_entity(processed, body_id, entity_type, body_name)
-                            count += 1
-                    except Exception as e:
-                        console.print(f"[red]Error processing {entity_type}: {e}[/red]")
-            else:
-                # Incremental sync: check if items EXIST in DB (not modified date!)
+        filtered = not full and server_filter and modified_since is not None
+
+        async def fetch_stage() -> None:
+            """Prefetch list pages (follows links.next)."""
+            nonlocal fetch_error
+            since = None
+            if filtered:
+                since = modified_since - timedelta(
+                    minutes=settings.oparl_modified_since_overlap_minutes
+                )
+            try:
+                # aclosing: stopping early also cancels in-flight page requests
+                # Full sync: request pages conditionally and skip unchanged ones
+                async with aclosing(
+                    client.fetch_list(
+                        list_url,
+                        modified_since=since,
+                        max_pages=None,
+                        use_cache=full,
+                        cursor=cursor,
+                    )
+                ) as pages:
+                    async for page in pages:
+                        await page_queue.put((page, cursor.resume_url, cursor.take_finished()))
+            except Exception as e:
+                fetch_error = e
+            await page_queue.put(None)
+
+        async def process_stage() -> None:
+            """Validate pages and, for incremental sync, decide when to stop."""
+            nonlocal processed_all
+            pages_checked = 0
+            consecutive_existing_pages = 0
+            min_pages_to_check = 10  # Always check at least 10 pages
+            existing_pages_to_stop = 3  # Stop after 3 consecutive pages without changes
+
+            while (queued := await page_queue.get()) is not None:
+                page, resume_url, finished = queued
+                pages_checked += 1
+
+                if full or filtered:
+                    # Full sync or server-filtered list: save everything
+                    await store_queue.put(
+                        (
+                            self._process_page(page, entity_type, body_external_id),
+                            resume_url,
+                            finished,
+                        )
+                    )
+                    continue
+
+                # Incremental sync: compare with the stored modified dates
                 external_ids = [item.get("id", "") for item in page if item.get("id")]
-                existing_ids = await self.storage.batch_check_entities_exist(
+                stored_modified = await self.storage.batch_check_entities_exist(
                     entity_type, external_ids
                 )
 
+                unchanged_on_page = 0
+                changed_items: list[dict[str, Any]] = []
                 for item in page:
-                    try:
-                        external_id = item.get("id", "")
-                        if not external_id:
-                            continue
-
-                        # Check if item exists in DB (value is not None means it exists)
-                        exists_in_db = existing_ids.get(external_id) is not None
-
-                        if exists_in_db:
-                            # Already in DB → skip (count for stop condition)
-                            existing_on_page += 1
-                        else:
-                            # New item → save
-                            new_on_page += 1
-                            processed = self.processor.process(item, body_external_id)
-                            if processed:
-                                await self._store_entity(processed, body_id, entity_type, body_name)
-                                count += 1
-
-                    except Exception as e:
-                        console.print(f"[red]Error processing {entity_type}: {e}[/red]")
+                    external_id = item.get("id", "")
+                    if not external_id:
+                        continue
+
+                    if external_id in stored_modified and not self._is_modified(
+                        item, stored_modified[external_id]
+                    ):
+                        # Stored and unchanged → skip (count for stop condition)
+                        unchanged_on_page += 1
+                    else:
+                        # New or changed item → save
+                        changed_items.append(item)
+
+                if changed_items or finished:
+                    # Pages without changes still pass their finished list pages on
+                    await store_queue.put(
+                        (
+                            self._process_page(changed_items, entity_type, body_external_id),
+                            resume_url,
+                            finished,
+                        )
+                    )
 
-                # Track consecutive pages where ALL items already exist
-                if page_size > 0 and existing_on_page >= page_size:
+                # Track consecutive pages without new or changed items
+                page_size = len(page)
+                if page_size > 0 and unchanged_on_page >= page_size:
                     consecutive_existing_pages += 1
-                    console.print(f"[dim]  Page {pages_checked}: all {page_size} items exist in DB[/dim]")
+                    console.print(
+                        f"[dim]  Page {pages_checked}: all {page_size} items unchanged[/dim]"
+                    )
                 else:
-                    consecutive_existing_pages = 0  # Reset if we found new items
-                    if new_on_page > 0:
-                        console.print(f"[green]  Page {pages_checked}: {new_on_page} new items saved[/green]")
+                    consecutive_existing_pages = 0  # Reset if we found changes
+                    if changed_items:
+                        console.print(
+                            f"[green]  Page {pages_checked}: {len(changed_items)} "
+                            f"new/changed items queued[/green]"
+                        )
 
-                # Stop condition: after min pages, stop if N consecutive pages all exist
+                # Stop condition: after min pages, stop if N consecutive pages are unchanged
                 if (pages_checked >= min_pages_to_check and
                     consecutive_existing_pages >= existing_pages_to_stop):
-                    console.print(f"[yellow]  Stopping {entity_type}: {consecutive_existing_pages} consecutive pages already in DB[/yellow]")
+                    console.print(
+                        f"[yellow]  Stopping {entity_type}: {consecutive_existing_pages} "
+                        f"consecutive pages unchanged[/yellow]"
+                    )
                     break
+            else:
+                processed_all = True
+
+            await store_queue.put(None)
+
+        async def store_stage() -> None:
+            """Write processed pages to the database."""
+            nonlocal count, pages_valid
+            while (queued := await store_queue.get()) is not None:
+                entities, resume_url, finished = queued
+                stored = await self._store_page(entities, body_id, entity_type, body_name)
+                count += stored
+                if stored < len(entities):
+                    # Pages of failed entities must be refetched next time; the
+                    # failed page may still be finished by a later batch
+                    pages_valid = False
+                if pages_valid:
+                    await client.commit_validators(finished)
+                    # --resume continues behind this page only if it was written
+                    if checkpoints is not None:
+                        await self.storage.save_sync_checkpoint(body_id, entity_type, resume_url)
+                        checkpoints[entity_type] = resume_url
+
+        tasks = [
+            asyncio.create_task(fetch_stage()),
+            asyncio.create_task(process_stage()),
+            asyncio.create_task(store_stage()),
+        ]
+        try:
+            # The fetcher may still be blocked on a full queue when incremental
+            # sync stops early, so only wait for the consuming stages
+            await asyncio.gather(tasks[1], tasks[2])
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        if fetch_error:
+            raise fetch_error
+
+        if cursor.complete and processed_all and pages_valid:
+            # Pages finished after the last yielded items (e.g. the last streamed page)
+            await client.commit_validators(cursor.take_finished())
+            if checkpoints is not None:
+                await self.storage.save_sync_checkpoint(body_id, entity_type, None)
+                checkpoints[entity_type] = None
 
         return count
 
-    async def _store_entity(
+    def _is_modified(self, item: dict[str, Any], stored_modified: datetime | None) -> bool:
+        """Whether a listed item is newer than its stored row (by OParl "modified")."""
+        modified = self.processor.parse_datetime(item.get("modified"))
+        if modified is None:
+            # No modification date - can't tell, keep the stored row
+            return False
+        if stored_modified is None:
+            return True
+        if modified.tzinfo is None:
+            modified = modified.replace(tzinfo=UTC)
+        if stored_modified.tzinfo is None:
+            stored_modified = stored_modified.replace(tzinfo=UTC)
+        return modified > stored_modified
+
+    def _process_page(
+        self,
+        items: list[dict[str, Any]],
+        entity_type: str,
+        body_external_id: str,
+    ) -> list[ProcessedEntity]:
+        """Process the raw items of a list page, skipping invalid ones."""
+        processed_page: list[ProcessedEntity] = []
+        for item in items:
+            try:
+                processed = self.processor.process(item, body_external_id)
+                if processed:
+                    processed_page.append(processed)
+            except Exception as e:
+                console.print(f"[red]Error processing {entity_type}: {e}[/red]")
+        return processed_page
+
+    async def _store_page(
         self,
-        entity: ProcessedEntity,
+        entities: list[ProcessedEntity],
         body_id: UUID,
         entity_type: str,
         body_name: str | None = None,
+    ) -> int:
+        """
+        Store a processed page in bulk.
+
+        If the bulk write fails (e.g. one row violates a constraint), the page
+        is retried entity by entity so a single bad object does not drop the
+        whole page.
+
+        Returns the number of stored entities.
+        """
+        if not entities:
+            return 0
+
+        try:
+            await self._store_and_announce(entities, body_id, body_name)
+            return len(entities)
+        except Exception as e:
+            if len(entities) == 1:
+                console.print(f"[red]Error processing {entity_type}: {e}[/red]")
+                return 0
+            console.print(
+                f"[yellow]Bulk write of {len(entities)} {entity_type} failed, "
+                f"retrying one by one: {e}[/yellow]"
+            )
+
+        count = 0
+        for entity in entities:
+            try:
+                await self._store_and_announce([entity], body_id, body_name)
+                count += 1
+            except Exception as e:
+                console.print(f"[red]Error processing {entity_type}: {e}[/red]")
+        return count
+
+    async def _store_and_announce(
+        self,
+        entities: list[ProcessedEntity],
+        body_id: UUID,
+        body_name: str | None = None,
     ) -> None:
-        """Store a processed entity to the database and emit events."""
-        entity_id: str | None = None
-
-        if isinstance(entity, ProcessedMeeting):
-            entity_id = str(await self.storage.upsert_meeting(entity, body_id))
-            meeting_uuid = UUID(entity_id)
-            # Emit high-priority event for new meetings
-            if self._event_emitter and entity_id:
-                await self._event_emitter.emit_new_meeting(
-                    meeting_id=entity_id,
-                    external_id=entity.external_id,
-                    name=entity.name or "Unbekannte Sitzung",
-                    body_name=body_name,
-                    start_time=entity.start,
-                )
-            # Process nested entities (files, agenda items) with meeting_id
-            for nested in entity.nested_entities:
-                if isinstance(nested, ProcessedFile):
-                    await self.storage.upsert_file(nested, body_id, meeting_id=meeting_uuid)
-                    metrics.record_entity_synced("file", body_name or "unknown")
-                elif isinstance(nested, ProcessedAgendaItem):
-                    await self.storage.upsert_agenda_item(nested, meeting_uuid)
-                    metrics.record_entity_synced("agendaitem", body_name or "unknown")
-        elif isinstance(entity, ProcessedPaper):
-            entity_id = str(await self.storage.upsert_paper(entity, body_id))
-            paper_uuid = UUID(entity_id)
-            # Emit high-priority event for new papers
-            if self._event_emitter and entity_id:
-                await self._event_emitter.emit_new_paper(
-                    paper_id=entity_id,
-                    external_id=entity.external_id,
-                    name=entity.name or "Unbekannte Vorlage",
-                    body_name=body_name,
-                    paper_type=entity.paper_type,
-                )
-            # Process nested entities (files, consultations) with paper_id
-            for nested in entity.nested_entities:
-                if isinstance(nested, ProcessedFile):
-                    await self.storage.upsert_file(nested, body_id, paper_id=paper_uuid)
-                    metrics.record_entity_synced("file", body_name or "unknown")
-                elif isinstance(nested, ProcessedConsultation):
-                    await self.storage.upsert_consultation(nested, body_id, paper_uuid)
-                    metrics.record_entity_synced("consultation", body_name or "unknown")
-        elif isinstance(entity, ProcessedPerson):
-            await self.storage.upsert_person(entity, body_id)
-            metrics.record_entity_synced("person", body_name or "unknown")
-        elif isinstance(entity, ProcessedOrganization):
-            await self.storage.upsert_organization(entity, body_id)
-            metrics.record_entity_synced("organization", body_name or "unknown")
-        elif isinstance(entity, ProcessedMembership):
-            await self.storage.upsert_membership(entity, body_id)
-            metrics.record_entity_synced("membership", body_name or "unknown")
-        elif isinstance(entity, ProcessedLocation):
-            await self.storage.upsert_location(entity, body_id)
-            metrics.record_entity_synced("location", body_name or "unknown")
-        elif isinstance(entity, ProcessedAgendaItem):
-            # AgendaItems need meeting_id - try to look it up
-            meeting_id = None
-            if entity.meeting_external_id:
-                meeting_id = await self.storage.get_meeting_uuid(entity.meeting_external_id)
-            if meeting_id:
-                await self.storage.upsert_agenda_item(entity, meeting_id)
-                metrics.record_entity_synced("agendaitem", body_name or "unknown")
+        """
+        Store entities and announce the written searchable rows.
+
+        Rows skipped as unchanged are not announced. Events are only sent
+        after _store_entities returned, i.e. once all rows are committed.
+        """
+        if not self._event_emitter or not self._event_emitter.enabled:
+            await self._store_entities(entities, body_id, body_name)
+            return
+
+        changed: dict[str, list[UUID]] = {}
+        token = current_changed_ids.set(changed)
+        try:
+            await self._store_entities(entities, body_id, body_name)
+        finally:
+            current_changed_ids.reset(token)
+
+        for entity_type, entity_ids in changed.items():
+            await self._event_emitter.emit_entities_changed(
+                entity_type, entity_ids, body_name=body_name
+            )
+
+    async def _store_entities(
+        self,
+        entities: list[ProcessedEntity],
+        body_id: UUID,
+        body_name: str | None = None,
+    ) -> None:
+        """Store processed entities to the database and emit events."""
+        body_label = body_name or "unknown"
+
+        meetings = [e for e in entities if isinstance(e, ProcessedMeeting)]
+        if meetings:
+            meeting_ids = await self.storage.upsert_meetings_batch(meetings, body_id)
+            # Emit high-priority events for new meetings, one round-trip per
+            # page; updated and unchanged rows keep their stored UUID
+            if self._event_emitter:
+                await self._event_emitter.emit_new_entities([
+                    self._event_emitter.new_meeting_event(
+                        meeting_id=str(meeting.id),
+                        external_id=meeting.external_id,
+                        name=meeting.name or "Unbekannte Sitzung",
+                        body_name=body_name,
+                        start_time=meeting.start,
+                    )
+                    for meeting in meetings
+                    if meeting_ids[meeting.external_id] == meeting.id
+                ])
+            metrics.record_entity_synced("meeting", body_label, count=len(meetings))
+
+            # Nested entities of the whole page, parent UUIDs from the bulk insert
+            nested_counts = await self.storage.upsert_meetings_nested_batch(
+                [(meeting, meeting_ids[meeting.external_id]) for meeting in meetings], body_id
+            )
+            metrics.record_entity_synced(
+                "agendaitem", body_label, count=nested_counts["agendaitem"]
+            )
+            metrics.record_entity_synced("file", body_label, count=nested_counts["file"])
+
+        papers = [e for e in entities if isinstance(e, ProcessedPaper)]
+        if papers:
+            paper_ids = await self.storage.upsert_papers_batch(papers, body_id)
+            # Emit high-priority events for new papers (inserted rows only)
+            if self._event_emitter:
+                await self._event_emitter.emit_new_entities([
+                    self._event_emitter.new_paper_event(
+                        paper_id=str(paper.id),
+                        external_id=paper.external_id,
+                        name=paper.name or "Unbekannte Vorlage",
+                        body_name=body_name,
+                        paper_type=paper.paper_type,
+                    )
+                    for paper in papers
+                    if paper_ids[paper.external_id] == paper.id
+                ])
+            metrics.record_entity_synced("paper", body_label, count=len(papers))
+
+            # Nested entities of the whole page, parent UUIDs from the bulk insert
+            nested_counts = await self.storage.upsert_papers_nested_batch(
+                [(paper, paper_ids[paper.external_id]) for paper in papers], body_id
+            )
+            metrics.record_entity_synced("file", body_label, count=nested_counts["file"])
+            metrics.record_entity_synced(
+                "consultation", body_label, count=nested_counts["consultation"]
+            )
+
+        persons = [e for e in entities if isinstance(e, ProcessedPerson)]
+        if persons:
+            await self.storage.upsert_persons_batch(persons, body_id)
+            metrics.record_entity_synced("person", body_label, count=len(persons))
+
+        organizations = [e for e in entities if isinstance(e, ProcessedOrganization)]
+        if organizations:
+            await self.storage.upsert_organizations_batch(organizations, body_id)
+            metrics.record_entity_synced("organization", body_label, count=len(organizations))
+
+        memberships = [e for e in entities if isinstance(e, ProcessedMembership)]
+        if memberships:
+            await self.storage.upsert_memberships_batch(memberships, body_id)
+            metrics.record_entity_synced("membership", body_label, count=len(memberships))
+
+        locations = [e for e in entities if isinstance(e, ProcessedLocation)]
+        if locations:
+            await self.storage.upsert_locations_batch(locations, body_id)
+            metrics.record_entity_synced("location", body_label, count=len(locations))
+
+        agenda_items = [e for e in entities if isinstance(e, ProcessedAgendaItem)]
+        if agenda_items:
+            # AgendaItems need meeting_id - resolve all of the page at once
+            meeting_ids = await self.storage.resolver.resolve_many(
+                "meeting",
+                [item.meeting_external_id for item in agenda_items if item.meeting_external_id],
+            )
             # If no meeting_id found, skip (item likely from nested sync already)
-        elif isinstance(entity, ProcessedFile):
+            resolved_items: list[tuple[ProcessedAgendaItem, UUID]] = [
+                (item, meeting_ids[item.meeting_external_id])
+                for item in agenda_items
+                if item.meeting_external_id in meeting_ids
+            ]
+            await self.storage.upsert_agenda_items_batch(resolved_items)
+            metrics.record_entity_synced("agendaitem", body_label, count=len(resolved_items))
+
+        files = [e for e in entities if isinstance(e, ProcessedFile)]
+        if files:
             # Files can belong to papers or meetings
-            # Try to resolve paper_id from back-references (OParl spec: standalone files have these)
-            paper_id = None
-            meeting_id = None
-            if entity.paper_external_ids:
-                # Use first paper reference (files can belong to multiple papers)
-                paper_id = await self.storage.get_paper_uuid(entity.paper_external_ids[0])
-            if entity.meeting_external_ids:
-                meeting_id = await self.storage.get_meeting_uuid(entity.meeting_external_ids[0])
-            await self.storage.upsert_file(entity, body_id, paper_id=paper_id, meeting_id=meeting_id)
-            metrics.record_entity_synced("file", body_name or "unknown")
-        elif isinstance(entity, ProcessedConsultation):
-            # Consultations can belong to papers - try to look it up
-            paper_id = None
-            if entity.paper_external_id:
-                paper_id = await self.storage.get_paper_uuid(entity.paper_external_id)
-            await self.storage.upsert_consultation(entity, body_id, paper_id)
-            metrics.record_entity_synced("consultation", body_name or "unknown")
-        else:
-            await self.storage.upsert_entity(entity, body_id)
-
-        # Record metrics for meetings and papers
-        if isinstance(entity, ProcessedMeeting):
-            metrics.record_entity_synced("meeting", body_name or "unknown")
-        elif isinstance(entity, ProcessedPaper):
-            metrics.record_entity_synced("paper", body_name or "unknown")
+            # Try to resolve parents from back-references (OParl spec: standalone files have these)
+            # Use first reference (files can belong to multiple papers/meetings)
+            paper_ids = await self.storage.resolver.resolve_many(
+                "paper", [f.paper_external_ids[0] for f in files if f.paper_external_ids]
+            )
+            meeting_ids = await self.storage.resolver.resolve_many(
+                "meeting", [f.meeting_external_ids[0] for f in files if f.meeting_external_ids]
+            )
+            resolved_files: list[tuple[ProcessedFile, UUID | None, UUID | None]] = [
+                (
+                    file,
+                    paper_ids.get(file.paper_external_ids[0]) if file.paper_external_ids else None,
+                    (
+                        meeting_ids.get(file.meeting_external_ids[0])
+                        if file.meeting_external_ids
+                        else None
+                    ),
+                )
+                for file in files
+            ]
+            await self.storage.upsert_files_batch(resolved_files, body_id)
+            metrics.record_entity_synced("file", body_label, count=len(files))
+
+        consultations = [e for e in entities if isinstance(e, ProcessedConsultation)]
+        if consultations:
+            # Consultations can belong to papers - try to look them up
+            paper_ids = await self.storage.resolver.resolve_many(
+                "paper", [c.paper_external_id for c in consultations if c.paper_external_id]
+            )
+            resolved_consultations: list[tuple[ProcessedConsultation, UUID | None]] = [
+                (consultation, paper_ids.get(consultation.paper_external_id or ""))
+                for consultation in consultations
+            ]
+            await self.storage.upsert_consultations_batch(resolved_consultations, body_id)
+            metrics.record_entity_synced("consultation", body_label, count=len(consultations))
+
+        other = [
+            e for e in entities
+            if not isinstance(e, (
+                ProcessedMeeting, ProcessedPaper, ProcessedPerson, ProcessedOrganization,
+                ProcessedMembership, ProcessedLocation, ProcessedAgendaItem, ProcessedFile,
+                ProcessedConsultation,
+            ))
+        ]
+        if other:
+            await self.storage.upsert_entities_batch(other, body_id)
 
     # ========== Sync All Sources ==========
 
@@ -779,6 +1081,7 @@ class SyncOrchestrator:
         self,
         full: bool = False,
         parallel: bool = True,  # Default to parallel for better performance
+        resume: bool = False,
     ) -> list[SyncResult]:
         """
         Sync all registered sources.
@@ -786,6 +1089,7 @@ class SyncOrchestrator:
         Args:
             full: Whether to perform full sync
             parallel: Whether to sync sources in parallel (default: True)
+            resume: Continue interrupted full syncs from their checkpoints
 
         Returns:
             List of SyncResults for each source
@@ -806,7 +1110,7 @@ class SyncOrchestrator:
             async def sync_source_wrapper(source):
                 """Wrapper to catch exceptions per source."""
                 try:
-                    return await self.sync_source(source.url, full=full)
+                    return await self.sync_source(source.url, full=full, resume=resume)
                 except Exception as e:
                     console.print(f"[red]Error syncing {source.name}: {e}[/red]")
                     return SyncResult(
@@ -828,7 +1132,7 @@ class SyncOrchestrator:
             # Sequential sync (fallback)
             results = []
             for source in sources:
-                result = await self.sync_source(source.url, full=full)
+                result = await self.sync_source(source.url, full=full, resume=resume)
                 results.append(result)
             return results
 
@@ -843,7 +1147,8 @@ class SyncOrchestrator:
             "status": "ready",
         }
 
-    def print_result(self, result: SyncResult) -> None:
+    @staticmethod
+    def print_result(result: SyncResult) -> None:
         """Print a sync result summary."""
         console.print("\n[bold]" + "=" * 60 + "[/bold]")
         console.print(f"[bold]Sync Result: {result.source_name}[/bold]")
@@ -874,6 +1179,11 @@ class SyncOrchestrator:
                 avg = result.http_stats.http_time / result.http_stats.http_requests
                 console.print(f"  Avg/Request: {avg * 1000:.0f}ms")
 
+        if result.write_stats:
+            console.print("\n[bold]Write Statistics:[/bold]")
+            console.print(f"  Written:     {result.write_stats.written:,}")
+            console.print(f"  Unchanged:   {result.write_stats.skipped:,}")
+
         if result.errors:
             console.print(f"\n[red]Errors ({len(result.errors)}):[/red]")
             for error in result.errors[:10]:
@@ -5,12 +5,14 @@ Processes, validates, and normalizes OParl entities.
 Handles nested objects and extracts relationships.
 """
 
+import hashlib
+import json
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Any
 from uuid import UUID, uuid5, NAMESPACE_URL
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 
 class OParlType(str, Enum):
@@ -59,6 +61,28 @@ OPARL_TYPE_MAP: dict[str, OParlType] = {
 }
 
 
+# Bump when the processing of raw_json into columns changes, so the next
+# sync rewrites all rows instead of skipping them as unchanged
+CONTENT_HASH_VERSION = 1
+
+
+def compute_content_hash(data: dict[str, Any]) -> str:
+    """
+    Stable SHA-256 of an OParl object.
+
+    The JSON is canonicalized (sorted keys, no whitespace), so the hash only
+    changes when the content does, not with the server's key order.
+    """
+    canonical = json.dumps(
+        data,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(f"{CONTENT_HASH_VERSION}:{canonical}".encode()).hexdigest()
+
+
 class ProcessedEntity(BaseModel):
     """Base class for all processed OParl entities."""
 
@@ -70,12 +94,21 @@ class ProcessedEntity(BaseModel):
     oparl_created: datetime | None = None
     oparl_modified: datetime | None = None
 
+    # Change detection (computed from raw_json if not given)
+    content_hash: str = ""
+
     # Extracted nested entities
     nested_entities: list["ProcessedEntity"] = Field(default_factory=list)
 
     # Extracted references (external IDs)
     references: dict[str, list[str]] = Field(default_factory=dict)
 
+    @model_validator(mode="after")
+    def _set_content_hash(self) -> "ProcessedEntity":
+        if not self.content_hash:
+            self.content_hash = compute_content_hash(self.raw_json)
+        return self
+
 
 class ProcessedBody(ProcessedEntity):
     """Processed OParl Body."""
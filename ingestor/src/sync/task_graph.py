@@ -0,0 +1,188 @@
+"""
+Task Graph Scheduler
+
+Runs the entity-type syncs of a body as a DAG: every task starts as soon as
+the tasks it depends on have finished, instead of waiting for fixed phases.
+A TaskBudget shared by all bodies of a source bounds how many tasks run at
+once; when a slot frees up, the waiting task on the longest chain of
+dependents goes first.
+
+Usage:
+    budget = TaskBudget(16)
+    results = await run_task_graph(BODY_SYNC_GRAPH, sync_entity_type, budget)
+"""
+
+import asyncio
+import heapq
+import itertools
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping
+from contextlib import asynccontextmanager, nullcontext
+
+# Entity types of a body and the types whose rows they reference
+BODY_SYNC_GRAPH: dict[str, tuple[str, ...]] = {
+    "organization": (),
+    "person": (),
+    "meeting": ("organization",),
+    "paper": (),
+    "location": (),
+    "membership": ("person", "organization"),
+    "agendaitem": ("meeting",),
+    "file": ("meeting", "paper"),
+    "consultation": ("paper",),
+}
+
+
+# ========== Graph ==========
+
+
+def topological_order(graph: Mapping[str, tuple[str, ...]]) -> list[str]:
+    """
+    Order the tasks so that every task comes after its dependencies.
+
+    Raises:
+        ValueError: On unknown dependencies or cycles
+    """
+    for name, dependencies in graph.items():
+        unknown = set(dependencies) - set(graph)
+        if unknown:
+            raise ValueError(f"Task {name!r} depends on unknown tasks: {sorted(unknown)}")
+
+    remaining = {name: set(dependencies) for name, dependencies in graph.items()}
+    order: list[str] = []
+    ready = [name for name, dependencies in remaining.items() if not dependencies]
+    while ready:
+        name = ready.pop(0)
+        order.append(name)
+        for other, dependencies in remaining.items():
+            if name in dependencies:
+                dependencies.discard(name)
+                if not dependencies:
+                    ready.append(other)
+
+    if len(order) != len(graph):
+        cyclic = sorted(set(graph) - set(order))
+        raise ValueError(f"Task graph has a cycle between: {cyclic}")
+    return order
+
+
+def critical_path_lengths(graph: Mapping[str, tuple[str, ...]]) -> dict[str, int]:
+    """Number of tasks on the longest chain starting at each task (itself included)."""
+    dependents: dict[str, list[str]] = {name: [] for name in graph}
+    for name, dependencies in graph.items():
+        for dependency in dependencies:
+            dependents[dependency].append(name)
+
+    lengths: dict[str, int] = {}
+    for name in reversed(topological_order(graph)):
+        lengths[name] = 1 + max((lengths[d] for d in dependents[name]), default=0)
+    return lengths
+
+
+# ========== Budget ==========
+
+
+class TaskBudget:
+    """
+    Concurrency limit for tasks of several graphs.
+
+    Works like a semaphore, but a released slot goes to the waiter with the
+    highest priority (FIFO among equal priorities).
+    """
+
+    def __init__(self, limit: int) -> None:
+        self.limit = max(limit, 1)
+        self._running = 0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._counter = itertools.count()
+
+    @property
+    def running(self) -> int:
+        return self._running
+
+    @asynccontextmanager
+    async def slot(self, priority: int = 0) -> AsyncIterator[None]:
+        """Hold one slot of the budget."""
+        await self._acquire(priority)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, priority: int) -> None:
+        if self._running < self.limit and not self._waiters:
+            self._running += 1
+            return
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (-priority, next(self._counter), waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Slot was handed over just before the cancellation
+                self._release()
+            else:
+                self._waiters = [entry for entry in self._waiters if entry[2] is not waiter]
+                heapq.heapify(self._waiters)
+            raise
+
+    def _release(self) -> None:
+        self._running -= 1
+        while self._waiters and self._running < self.limit:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                self._running += 1
+                waiter.set_result(None)
+
+
+# ========== Scheduler ==========
+
+
+async def run_task_graph[T](
+    graph: Mapping[str, tuple[str, ...]],
+    run: Callable[[str], Awaitable[T]],
+    budget: TaskBudget | None = None,
+) -> dict[str, T | BaseException]:
+    """
+    Run every task of the graph once its dependencies have finished.
+
+    A failed task doesn't cancel its dependents - they run anyway, like the
+    later phases of a body sync did (unresolvable references are skipped).
+
+    Args:
+        graph: Task name -> names of the tasks it depends on
+        run: Coroutine function executing one task
+        budget: Shared concurrency limit (None = unlimited)
+
+    Returns:
+        Task name -> result, or the exception the task raised
+    """
+    priorities = critical_path_lengths(graph)
+    tasks: dict[str, asyncio.Task[T]] = {}
+
+    async def run_one(name: str) -> T:
+        dependencies = [tasks[dependency] for dependency in graph[name]]
+        if dependencies:
+            await asyncio.wait(dependencies)
+        async with budget.slot(priorities[name]) if budget else nullcontext():
+            return await run(name)
+
+    for name in topological_order(graph):
+        tasks[name] = asyncio.create_task(run_one(name), name=f"sync-{name}")
+
+    try:
+        await asyncio.wait(tasks.values())
+    finally:
+        for task in tasks.values():
+            task.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+    results: dict[str, T | BaseException] = {}
+    for name, task in tasks.items():
+        if task.cancelled():
+            results[name] = asyncio.CancelledError()
+        elif task.exception() is not None:
+            results[name] = task.exception()  # type: ignore[assignment]
+        else:
+            results[name] = task.result()
+    return results
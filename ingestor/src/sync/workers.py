@@ -0,0 +1,280 @@
+"""
+Multi-Process Sync
+
+Spreads a sync over several worker processes, so the CPU-bound parts
+(JSON decoding, Pydantic processing) are no longer limited to one core.
+
+Features:
+- Sources with several bodies are split into body shards
+- Shards are balanced over the workers by number of bodies
+- Each worker runs its own event loop, OParlClient and DB pool
+- Shard results are merged into one SyncResult per source
+
+Usage:
+    results = sync_sharded(source_urls=None, workers=4, full=True)
+"""
+
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+from rich.console import Console
+
+from src.client.oparl_client import OParlClient, SyncStats
+from src.storage.database import DatabaseStorage, WriteStats
+from src.sync.orchestrator import SyncOrchestrator, SyncResult, body_matches
+
+console = Console()
+
+
+@dataclass(frozen=True)
+class SyncShard:
+    """A source, or a subset of its bodies, synced by one worker."""
+
+    source_url: str
+    body_ids: tuple[str, ...] | None = None  # None = all bodies of the source
+
+    @property
+    def weight(self) -> int:
+        return len(self.body_ids) if self.body_ids else 1
+
+
+# ========== Planning ==========
+
+
+async def _discover_body_ids(
+    client: OParlClient,
+    url: str,
+    body_filter: str | None,
+) -> list[str] | None:
+    """Fetch the body list of a source. Returns None if it isn't available."""
+    system = await client.fetch_system(url)
+    body_list_url = system.get("body") if system else None
+    if not body_list_url:
+        return None
+
+    body_ids: list[str] = []
+    async for page in client.fetch_list(body_list_url):
+        body_ids.extend(
+            body["id"] for body in page
+            if body.get("id") and body_matches(body, body_filter)
+        )
+    return body_ids
+
+
+async def plan_shards(
+    source_urls: list[str] | None,
+    workers: int,
+    body_filter: str | None = None,
+    max_concurrent: int = 10,
+) -> list[SyncShard]:
+    """
+    Split the sources into shards.
+
+    Sources with several bodies are split into up to `workers` shards of
+    bodies. Sources whose body list can't be read stay one shard, the worker
+    then reports the error.
+
+    Args:
+        source_urls: Sources to sync (None = all active registered sources)
+        workers: Number of worker processes
+        body_filter: Optional body name/ID filter
+        max_concurrent: Maximum concurrent HTTP requests for body discovery
+    """
+    if source_urls is None:
+        storage = DatabaseStorage()
+        try:
+            source_urls = [source.url for source in await storage.get_all_sources()]
+        finally:
+            await storage.close()
+
+    shards: list[SyncShard] = []
+    async with OParlClient(max_concurrent=max_concurrent) as client:
+        discovered = await asyncio.gather(
+            *[_discover_body_ids(client, url, body_filter) for url in source_urls],
+            return_exceptions=True,
+        )
+
+    for url, body_ids in zip(source_urls, discovered):
+        if isinstance(body_ids, BaseException) or not body_ids or len(body_ids) == 1:
+            shards.append(SyncShard(url))
+            continue
+        groups = min(workers, len(body_ids))
+        shards.extend(SyncShard(url, tuple(body_ids[i::groups])) for i in range(groups))
+
+    return shards
+
+
+def assign_shards(shards: list[SyncShard], workers: int) -> list[list[SyncShard]]:
+    """Distribute shards over the workers, heaviest first onto the least loaded."""
+    batches: list[list[SyncShard]] = [[] for _ in range(min(workers, len(shards)))]
+    loads = [0] * len(batches)
+
+    for shard in sorted(shards, key=lambda s: s.weight, reverse=True):
+        index = loads.index(min(loads))
+        batches[index].append(shard)
+        loads[index] += shard.weight
+
+    return batches
+
+
+# ========== Worker ==========
+
+
+async def _sync_shards(
+    shards: list[SyncShard],
+    full: bool,
+    body_filter: str | None,
+    max_concurrent: int,
+    resume: bool = False,
+) -> list[SyncResult]:
+    """Sync the shards of one worker concurrently, like sync_all(parallel=True)."""
+    async with SyncOrchestrator(max_concurrent=max_concurrent) as orchestrator:
+        orchestrator._parallel_mode = len(shards) > 1
+
+        async def sync_shard(shard: SyncShard) -> SyncResult:
+            try:
+                return await orchestrator.sync_source(
+                    shard.source_url,
+                    full=full,
+                    body_filter=body_filter,
+                    body_ids=shard.body_ids,
+                    resume=resume,
+                )
+            except Exception as e:
+                console.print(f"[red]Error syncing {shard.source_url}: {e}[/red]")
+                return SyncResult(
+                    source_url=shard.source_url,
+                    source_name="",
+                    success=False,
+                    errors=[str(e)],
+                )
+
+        return list(await asyncio.gather(*[sync_shard(shard) for shard in shards]))
+
+
+def _run_worker(
+    shards: list[SyncShard],
+    full: bool,
+    body_filter: str | None,
+    max_concurrent: int,
+    resume: bool = False,
+) -> list[SyncResult]:
+    """Entry point of a worker process."""
+    return asyncio.run(_sync_shards(shards, full, body_filter, max_concurrent, resume))
+
+
+# ========== Results ==========
+
+
+def merge_results(
+    results: list[SyncResult],
+    source_url: str | None = None,
+    source_name: str | None = None,
+) -> SyncResult:
+    """
+    Combine several results (shards of one source, or all sources) into one.
+
+    Counts and statistics are summed, errors concatenated. The duration is
+    the longest one, as the shards ran in parallel.
+    """
+    merged = SyncResult(
+        source_url=source_url if source_url is not None else results[0].source_url,
+        source_name=source_name or next((r.source_name for r in results if r.source_name), ""),
+        success=all(r.success for r in results),
+    )
+
+    counters = [name for name in vars(merged) if name.endswith("_synced")]
+    for result in results:
+        for name in counters:
+            setattr(merged, name, getattr(merged, name) + getattr(result, name))
+        merged.errors.extend(result.errors)
+        merged.duration_seconds = max(merged.duration_seconds, result.duration_seconds)
+
+        if result.http_stats:
+            if merged.http_stats is None:
+                merged.http_stats = SyncStats(start_time=result.http_stats.start_time)
+            stats = merged.http_stats
+            stats.http_requests += result.http_stats.http_requests
+            stats.cache_hits += result.http_stats.cache_hits
+            stats.objects_processed += result.http_stats.objects_processed
+            stats.pages_fetched += result.http_stats.pages_fetched
+            stats.errors += result.http_stats.errors
+            stats.http_time += result.http_stats.http_time
+            stats.start_time = min(stats.start_time, result.http_stats.start_time)
+
+        if result.write_stats:
+            if merged.write_stats is None:
+                merged.write_stats = WriteStats()
+            merged.write_stats.written += result.write_stats.written
+            merged.write_stats.skipped += result.write_stats.skipped
+
+    return merged
+
+
+# ========== Entry Point ==========
+
+
+def sync_sharded(
+    source_urls: list[str] | None,
+    workers: int,
+    full: bool = False,
+    body_filter: str | None = None,
+    max_concurrent: int = 10,
+    resume: bool = False,
+) -> list[SyncResult]:
+    """
+    Sync sources with a pool of worker processes.
+
+    Args:
+        source_urls: Sources to sync (None = all active registered sources)
+        workers: Number of worker processes
+        full: Whether to perform full sync
+        body_filter: Optional body name/ID filter
+        max_concurrent: Maximum concurrent HTTP requests per worker
+        resume: Continue interrupted full syncs from their checkpoints
+
+    Returns:
+        One SyncResult per source, in the order of the sources
+    """
+    shards = asyncio.run(plan_shards(source_urls, workers, body_filter, max_concurrent))
+    if not shards:
+        console.print("[yellow]No sources registered. Use 'add-source' first.[/yellow]")
+        return []
+
+    batches = assign_shards(shards, workers)
+    console.print(
+        f"[bold]Syncing {len(shards)} shards of {len({s.source_url for s in shards})} "
+        f"sources with {len(batches)} worker processes...[/bold]"
+    )
+
+    # spawn: workers must not inherit the parent's event loop or connections
+    context = multiprocessing.get_context("spawn")
+    results: list[SyncResult] = []
+    with ProcessPoolExecutor(max_workers=len(batches), mp_context=context) as pool:
+        futures = [
+            (batch, pool.submit(_run_worker, batch, full, body_filter, max_concurrent, resume))
+            for batch in batches
+        ]
+        for batch, future in futures:
+            try:
+                results.extend(future.result())
+            except Exception as e:
+                # Worker process died - report its shards as failed
+                console.print(f"[red]Worker failed: {e}[/red]")
+                results.extend(
+                    SyncResult(
+                        source_url=shard.source_url,
+                        source_name="",
+                        success=False,
+                        errors=[f"Worker failed: {e}"],
+                    )
+                    for shard in batch
+                )
+
+    by_source: dict[str, list[SyncResult]] = {shard.source_url: [] for shard in shards}
+    for result in results:
+        by_source[result.source_url].append(result)
+
+    return [merge_results(source_results) for source_results in by_source.values()]
@@ -221,3 +221,409 @@ class TestFetchIntegration:
 
                     assert result.status_code == 200
                     assert call_count == 2
+
+
+class TestPaginatedLists:
+    """Tests for sequential and concurrent list pagination."""
+
+    def _page(self, page: int, total: int, next_url: str | None) -> dict:
+        return {
+            "data": [{"id": f"https://example.org/paper/{page}"}],
+            "pagination": {"currentPage": page, "totalPages": total},
+            "links": {"next": next_url} if next_url else {},
+        }
+
+    def test_page_urls_for_numbered_pagination(self) -> None:
+        """Test page URLs are derived from links.next and totalPages."""
+        client = OParlClient()
+        data = self._page(1, 4, "https://example.org/papers?body=1&page=2")
+
+        assert client._get_page_urls(data) == [
+            "https://example.org/papers?body=1&page=2",
+            "https://example.org/papers?body=1&page=3",
+            "https://example.org/papers?body=1&page=4",
+        ]
+
+    def test_no_page_urls_for_cursor_pagination(self) -> None:
+        """Test cursor-style next links are not expanded."""
+        client = OParlClient()
+        data = self._page(1, 4, "https://example.org/papers?cursor=abc")
+
+        assert client._get_page_urls(data) is None
+
+    def test_no_page_urls_without_total_pages(self) -> None:
+        """Test lists without pagination metadata are not expanded."""
+        client = OParlClient()
+        data = {"data": [], "links": {"next": "https://example.org/papers?page=2"}}
+
+        assert client._get_page_urls(data) is None
+
+    @pytest.mark.asyncio
+    async def test_numbered_pages_fetched_concurrently_in_order(self) -> None:
+        """Test remaining pages are requested concurrently and yielded in order."""
+        import asyncio
+
+        base = "https://example.org/papers"
+        in_flight = 0
+        max_in_flight = 0
+
+        async def mock_fetch(
+            url: str, use_cache: bool = True, skip_wait: bool = False
+        ) -> FetchResult:
+            nonlocal in_flight, max_in_flight
+            page = int(url.split("page=")[1]) if "page=" in url else 1
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            # Later pages answer faster to check ordering
+            await asyncio.sleep(0.01 * (10 - page))
+            in_flight -= 1
+            next_url = f"{base}?page={page + 1}" if page < 6 else None
+            return FetchResult(url=url, data=self._page(page, 6, next_url), status_code=200)
+
+        async with OParlClient(max_concurrent=3) as client:
+            with patch.object(client, "fetch", side_effect=mock_fetch):
+                pages = [page async for page in client.fetch_list(base)]
+
+        assert [p[0]["id"] for p in pages] == [
+            f"https://example.org/paper/{n}" for n in range(1, 7)
+        ]
+        assert max_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_max_pages_limits_concurrent_fetch(self) -> None:
+        """Test max_pages is honoured for page-numbered lists."""
+        base = "https://example.org/papers"
+        fetched: list[str] = []
+
+        async def mock_fetch(
+            url: str, use_cache: bool = True, skip_wait: bool = False
+        ) -> FetchResult:
+            fetched.append(url)
+            page = int(url.split("page=")[1]) if "page=" in url else 1
+            return FetchResult(
+                url=url, data=self._page(page, 10, f"{base}?page={page + 1}"), status_code=200
+            )
+
+        async with OParlClient() as client:
+            with patch.object(client, "fetch", side_effect=mock_fetch):
+                pages = [page async for page in client.fetch_list(base, max_pages=3)]
+
+        assert len(pages) == 3
+        assert len(fetched) == 3
+
+    @pytest.mark.asyncio
+    async def test_cursor_tracks_resume_position(self) -> None:
+        """Test the cursor points behind each yielded page and marks the end."""
+        from src.client.oparl_client import ListCursor
+
+        base = "https://example.org/papers"
+
+        async def mock_fetch(
+            url: str, use_cache: bool = True, skip_wait: bool = False
+        ) -> FetchResult:
+            page = int(url.split("page=")[1]) if "page=" in url else 1
+            next_url = f"{base}?page={page + 1}" if page < 3 else None
+            return FetchResult(url=url, data=self._page(page, 3, next_url), status_code=200)
+
+        cursor = ListCursor()
+        positions = []
+        async with OParlClient() as client:
+            with patch.object(client, "fetch", side_effect=mock_fetch):
+                async for _ in client.fetch_list(base, cursor=cursor):
+                    positions.append(cursor.resume_url)
+
+        assert positions == [f"{base}?page=2", f"{base}?page=3", None]
+        assert cursor.complete
+
+
+class FakeValidatorStorage:
+    """In-memory replacement for the validator methods of DatabaseStorage."""
+
+    def __init__(self, rows: list | None = None) -> None:
+        self.rows = rows or []
+        self.loads: list[str] = []
+        self.flushed: list[dict] = []
+
+    async def get_http_validators(self, url_prefix: str, max_age) -> list:
+        self.loads.append(url_prefix)
+        return [row for row in self.rows if row.url.startswith(url_prefix)]
+
+    async def upsert_http_validators(self, rows: list[dict]) -> None:
+        self.flushed.extend(rows)
+
+
+class TestValidatorStore:
+    """Tests for persistent ETag / Last-Modified validators."""
+
+    @pytest.mark.asyncio
+    async def test_validators_loaded_once_per_host(self) -> None:
+        """Test stored validators are loaded lazily, once per host."""
+        from types import SimpleNamespace
+
+        from src.client.validator_store import ValidatorStore
+
+        storage = FakeValidatorStorage([
+            SimpleNamespace(
+                url="https://example.org/papers?page=2",
+                etag='"abc"',
+                last_modified=None,
+                next_url="https://example.org/papers?page=3",
+            ),
+        ])
+        store = ValidatorStore(storage)  # type: ignore[arg-type]
+
+        await store.ensure_loaded("https://example.org/papers?page=2")
+        await store.ensure_loaded("https://example.org/meetings")
+
+        assert storage.loads == ["https://example.org/"]
+        assert store.etags["https://example.org/papers?page=2"] == '"abc"'
+        assert store.next_urls["https://example.org/papers?page=2"].endswith("page=3")
+
+    @pytest.mark.asyncio
+    async def test_validators_flushed_in_batches(self) -> None:
+        """Test changed validators are written once the batch is full."""
+        from src.client.validator_store import ValidatorStore
+
+        storage = FakeValidatorStorage()
+        store = ValidatorStore(storage, flush_size=2)  # type: ignore[arg-type]
+
+        await store.record("https://example.org/a", '"1"', None, None)
+        assert storage.flushed == []
+
+        await store.record("https://example.org/b", '"2"', None, None)
+        assert [row["url"] for row in storage.flushed] == [
+            "https://example.org/a",
+            "https://example.org/b",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_client_shares_caches_and_flushes_on_exit(self) -> None:
+        """Test the client uses the store dicts and flushes when closed."""
+        from src.client.validator_store import ValidatorStore
+
+        storage = FakeValidatorStorage()
+        store = ValidatorStore(storage, flush_size=100)  # type: ignore[arg-type]
+
+        async with OParlClient(validator_store=store) as client:
+            assert client.etag_cache is store.etags
+            await store.record("https://example.org/a", '"1"', None, None)
+
+        assert len(storage.flushed) == 1
+
+    @pytest.mark.asyncio
+    async def test_unchanged_pages_are_skipped(self) -> None:
+        """Test 304 pages yield nothing and traversal follows the stored next link."""
+        base = "https://example.org/papers"
+
+        async def mock_fetch(
+            url: str, use_cache: bool = True, skip_wait: bool = False
+        ) -> FetchResult:
+            if url == base:
+                return FetchResult(url=url, data=None, status_code=304, from_cache=True)
+            return FetchResult(
+                url=url,
+                data={"data": [{"id": "https://example.org/paper/2"}], "links": {}},
+                status_code=200,
+            )
+
+        async with OParlClient() as client:
+            client.next_link_cache[base] = f"{base}?cursor=2"
+            with patch.object(client, "fetch", side_effect=mock_fetch):
+                pages = [page async for page in client.fetch_list(base, use_cache=True)]
+
+        assert pages == [[{"id": "https://example.org/paper/2"}]]
+        assert client.stats.pages_fetched == 2
+
+    @pytest.mark.asyncio
+    async def test_unknown_next_link_refetches_page(self) -> None:
+        """Test a 304 page without a remembered next link is requested unconditionally."""
+        base = "https://example.org/papers"
+        requests: list[tuple[str, bool]] = []
+
+        async def mock_fetch(
+            url: str, use_cache: bool = True, skip_wait: bool = False
+        ) -> FetchResult:
+            requests.append((url, use_cache))
+            if use_cache:
+                return FetchResult(url=url, data=None, status_code=304, from_cache=True)
+            return FetchResult(
+                url=url,
+                data={"data": [{"id": "https://example.org/paper/1"}], "links": {}},
+                status_code=200,
+            )
+
+        async with OParlClient() as client:
+            with patch.object(client, "fetch", side_effect=mock_fetch):
+                pages = [page async for page in client.fetch_list(base, use_cache=True)]
+
+        assert requests == [(base, True), (base, False)]
+        assert pages == [[{"id": "https://example.org/paper/1"}]]
+
+    @pytest.mark.asyncio
+    async def test_validators_recorded_only_when_committed(self) -> None:
+        """Test fetched validators reach the store only after commit_validators."""
+        import httpx
+
+        from src.client.oparl_client import ListCursor
+        from src.client.validator_store import ValidatorStore
+
+        base = "https://example.org/papers"
+        storage = FakeValidatorStorage()
+        store = ValidatorStore(storage, flush_size=1)  # type: ignore[arg-type]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                headers={"ETag": '"v1"'},
+                json={"data": [{"id": "https://example.org/paper/1"}], "links": {}},
+            )
+
+        cursor = ListCursor()
+        async with OParlClient(validator_store=store) as client:
+            client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async for _ in client.fetch_list(base, stream=False, cursor=cursor):
+                finished = cursor.take_finished()
+                assert client.etag_cache[base] == '"v1"'
+                assert storage.flushed == []
+                await client.commit_validators(finished)
+
+        assert [row["url"] for row in storage.flushed] == [base]
+        assert store.next_urls[base] == ""
+
+
+class TestStreamingLists:
+    """Tests for incremental decoding of list pages."""
+
+    def _body(self, start: int, count: int, next_url: str | None) -> bytes:
+        import json
+
+        return json.dumps({
+            "data": [
+                {"id": f"https://example.org/paper/{n}", "auxiliaryFile": [{"id": f"f{n}"}]}
+                for n in range(start, start + count)
+            ],
+            "links": {"next": next_url} if next_url else {},
+        }).encode()
+
+    def _client_for(
+        self, client: OParlClient, bodies: dict[str, bytes], headers: dict | None = None
+    ) -> None:
+        """Serve the given bodies in small chunks through a mock transport."""
+        import httpx
+
+        async def chunks(body: bytes):
+            for i in range(0, len(body), 64):
+                yield body[i:i + 64]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            body = bodies[str(request.url)]
+            return httpx.Response(200, headers=headers or {}, content=chunks(body))
+
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    def test_decoder_yields_items_incrementally(self) -> None:
+        """Test items are returned as soon as they are complete."""
+        from src.client.json_stream import ListPageDecoder
+
+        body = self._body(1, 3, "https://example.org/papers?page=2")
+        decoder = ListPageDecoder()
+
+        items = decoder.feed(body[:80])
+        assert items == [{"id": "https://example.org/paper/1", "auxiliaryFile": [{"id": "f1"}]}]
+
+        items += decoder.feed(body[80:]) + decoder.close()
+        assert [item["id"] for item in items] == [
+            f"https://example.org/paper/{n}" for n in range(1, 4)
+        ]
+        assert decoder.links == {"next": "https://example.org/papers?page=2"}
+
+    @pytest.mark.asyncio
+    async def test_large_pages_yielded_in_chunks(self) -> None:
+        """Test pages are split into bounded batches and links.next is followed."""
+        base = "https://example.org/papers"
+        bodies = {
+            base: self._body(0, 250, f"{base}?page=2"),
+            f"{base}?page=2": self._body(250, 10, None),
+        }
+
+        async with OParlClient() as client:
+            self._client_for(client, bodies, {"ETag": '"v1"'})
+            with patch("src.client.oparl_client.settings.oparl_stream_chunk_size", 100):
+                pages = [page async for page in client.fetch_list(base, stream=True)]
+
+        assert [len(page) for page in pages] == [100, 100, 50, 10]
+        assert pages[3][-1]["id"] == "https://example.org/paper/259"
+        assert client.stats.pages_fetched == 2
+        assert client.etag_cache[base] == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_truncated_page_stops_without_validators(self) -> None:
+        """Test a truncated body ends the list and doesn't cache its ETag."""
+        base = "https://example.org/papers"
+        bodies = {base: self._body(0, 5, f"{base}?page=2")[:-40]}
+
+        async with OParlClient() as client:
+            self._client_for(client, bodies, {"ETag": '"v1"'})
+            pages = [page async for page in client.fetch_list(base, stream=True)]
+
+        assert sum(len(page) for page in pages) < 5
+        assert base not in client.etag_cache
+        assert client.stats.errors == 1
+
+
+class TestModifiedSinceFilter:
+    """Tests for the server-side modified_since list filter."""
+
+    def _client_for(self, client: OParlClient, supports_filter: bool) -> list[str]:
+        """Serve a list that applies (or ignores) modified_since; returns requested URLs."""
+        import httpx
+
+        requested: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requested.append(str(request.url))
+            filtered = supports_filter and "modified_since" in request.url.params
+            items = [] if filtered else [{"id": "https://example.org/paper/1"}]
+            return httpx.Response(200, json={"data": items, "links": {}})
+
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return requested
+
+    def test_filter_is_added_to_url(self) -> None:
+        """Test modified_since is appended as ISO 8601 query parameter."""
+        url = OParlClient._with_modified_since(
+            "https://example.org/papers?body=1", datetime(2024, 5, 1, 12, 0)
+        )
+
+        assert url == (
+            "https://example.org/papers?body=1"
+            "&modified_since=2024-05-01T12%3A00%3A00%2B00%3A00"
+        )
+
+    @pytest.mark.asyncio
+    async def test_probe_detects_support(self) -> None:
+        """Test a server returning nothing for modified_since=now supports the filter."""
+        async with OParlClient() as client:
+            self._client_for(client, supports_filter=True)
+            assert await client.probe_modified_since("https://example.org/papers") is True
+
+    @pytest.mark.asyncio
+    async def test_probe_detects_ignored_filter(self) -> None:
+        """Test a server returning the same items ignores the filter."""
+        async with OParlClient() as client:
+            self._client_for(client, supports_filter=False)
+            assert await client.probe_modified_since("https://example.org/papers") is False
+
+    @pytest.mark.asyncio
+    async def test_fetch_list_sends_filter(self) -> None:
+        """Test the first list request carries modified_since."""
+        async with OParlClient() as client:
+            requested = self._client_for(client, supports_filter=True)
+            pages = [
+                page async for page in client.fetch_list(
+                    "https://example.org/papers", modified_since=datetime(2024, 5, 1)
+                )
+            ]
+
+        assert pages == []
+        assert "modified_since=2024-05-01" in requested[0]
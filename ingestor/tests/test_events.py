@@ -0,0 +1,178 @@
+"""
+Tests for Redis event emission.
+"""
+
+import json
+import socket
+from typing import Any
+
+import pytest
+
+from src.events import ENTITY_IDS_PER_EVENT, EventEmitter, EventStreamReader, SyncEvent
+
+
+class FakePipeline:
+    """Pipeline recording queued commands."""
+
+    def __init__(self, client: "FakeRedis") -> None:
+        self.client = client
+        self.commands: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        return None
+
+    def __getattr__(self, name: str) -> Any:
+        def queue(*args: Any, **kwargs: Any) -> None:
+            self.commands.append((name, args, kwargs))
+        return queue
+
+    async def execute(self) -> list[Any]:
+        self.client.executed.append(self.commands)
+        return [None] * len(self.commands)
+
+
+class FakeRedis:
+    """Redis client answering XREADGROUP/XAUTOCLAIM with prepared responses."""
+
+    def __init__(self, responses: list[Any] | None = None) -> None:
+        self.executed: list[list[tuple[str, tuple[Any, ...], dict[str, Any]]]] = []
+        self.responses = responses or []
+        self.reads: list[dict[str, str]] = []
+        self.claims: list[str] = []
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    async def xreadgroup(
+        self, group: str, consumer: str, streams: dict[str, str], **kwargs: Any
+    ) -> Any:
+        self.reads.append(dict(streams))
+        return self.responses.pop(0) if self.responses else []
+
+    async def xautoclaim(
+        self, stream: str, group: str, consumer: str, min_idle: int, **kwargs: Any
+    ) -> Any:
+        self.claims.append(kwargs["start_id"])
+        return self.responses.pop(0)
+
+
+def make_emitter(transport: str) -> tuple[EventEmitter, FakeRedis]:
+    emitter = EventEmitter(redis_url="redis://test", transport=transport)
+    client = FakeRedis()
+    emitter.enabled = True
+    emitter._client = client  # type: ignore[assignment]
+    return emitter, client
+
+
+def entry(message_id: str, event: SyncEvent) -> tuple[str, dict[str, str]]:
+    return (message_id, {"event": event.to_json()})
+
+
+class TestEventEmitter:
+    """Tests for both transports of the emitter."""
+
+    @pytest.mark.asyncio
+    async def test_streams_use_trimmed_xadd(self) -> None:
+        """Test the streams transport appends to the stream with MAXLEN ~."""
+        emitter, client = make_emitter("streams")
+
+        await emitter.emit_sync_started(source_url="https://example.org", source_name="Test")
+
+        [[(command, args, kwargs)]] = client.executed
+        assert command == "xadd"
+        assert args[0] == EventEmitter.CHANNEL_SYNC
+        assert json.loads(args[1]["event"])["event_type"] == "sync:started"
+        assert kwargs["approximate"] is True
+
+    @pytest.mark.asyncio
+    async def test_batches_are_one_pipeline(self) -> None:
+        """Test large ID lists are split into events sent in one round-trip."""
+        emitter, client = make_emitter("pubsub")
+        ids = [f"id-{i}" for i in range(ENTITY_IDS_PER_EVENT * 2 + 1)]
+
+        await emitter.emit_entities_changed("paper", ids)
+
+        assert len(client.executed) == 1
+        commands = client.executed[0]
+        assert [command for command, _, _ in commands] == ["publish"] * 3
+        sent = [json.loads(args[1])["entity_ids"] for _, args, _ in commands]
+        assert sum(sent, []) == ids
+
+    @pytest.mark.asyncio
+    async def test_new_entities_are_one_pipeline(self) -> None:
+        """Test the created events of a page are sent in one round-trip."""
+        emitter, client = make_emitter("streams")
+
+        await emitter.emit_new_entities([
+            emitter.new_paper_event(f"uuid-{i}", f"https://example.org/paper/{i}", "V")
+            for i in range(3)
+        ])
+
+        [commands] = client.executed
+        assert [command for command, _, _ in commands] == ["xadd"] * 3
+        assert json.loads(commands[0][1][1]["event"])["event_type"] == "entity:created"
+
+    def test_unknown_transport_is_rejected(self) -> None:
+        """Test a typo in the transport setting fails early."""
+        with pytest.raises(ValueError):
+            EventEmitter(transport="kafka")
+
+
+class TestEventStreamReader:
+    """Tests for reading through a consumer group."""
+
+    @pytest.mark.asyncio
+    async def test_pending_entries_are_read_first(self) -> None:
+        """Test unacknowledged entries are redelivered before new ones."""
+        event = SyncEvent(event_type="entity:batch", entity_type="paper", entity_ids=["a"])
+        stream = EventEmitter.CHANNEL_ENTITIES
+        client = FakeRedis([
+            [[stream, [entry("1-0", event)]]],
+            [[stream, []]],
+            [[stream, [entry("2-0", event)]]],
+        ])
+        reader = EventStreamReader("indexer", consumer="test")
+        reader._client = client  # type: ignore[assignment]
+
+        first = await reader.read()
+        assert await reader.read() == []
+        new = await reader.read()
+
+        assert client.reads == [{stream: "0"}, {stream: "1-0"}, {stream: ">"}]
+        assert [message_id for _, message_id, _ in first + new] == ["1-0", "2-0"]
+        assert first[0][2].entity_ids == ["a"]
+
+    @pytest.mark.asyncio
+    async def test_unusable_entries_are_acknowledged(self) -> None:
+        """Test trimmed or invalid entries don't stay pending."""
+        stream = EventEmitter.CHANNEL_ENTITIES
+        client = FakeRedis([[[stream, [("1-0", None), ("2-0", {"event": "{"})]]]])
+        reader = EventStreamReader("indexer", consumer="test")
+        reader._client = client  # type: ignore[assignment]
+
+        assert await reader.read() == []
+        [[(command, args, _)]] = client.executed
+        assert (command, args) == ("xack", (stream, "indexer", "1-0", "2-0"))
+
+    @pytest.mark.asyncio
+    async def test_claim_stale_claims_the_whole_pending_list(self) -> None:
+        """Test XAUTOCLAIM is repeated until its cursor wraps around."""
+        event = SyncEvent(event_type="entity:batch", entity_type="paper", entity_ids=["a"])
+        client = FakeRedis([
+            ["5-0", [entry("1-0", event)], []],
+            ["0-0", [entry("5-0", event)], []],
+        ])
+        reader = EventStreamReader("indexer", consumer="test")
+        reader._client = client  # type: ignore[assignment]
+
+        claimed = await reader.claim_stale(min_idle_ms=1000)
+
+        assert client.claims == ["0-0", "5-0"]
+        assert [message_id for _, message_id, _ in claimed] == ["1-0", "5-0"]
+
+    def test_default_consumer_is_stable(self) -> None:
+        """Test the default consumer name survives a restart of the process."""
+        assert EventStreamReader("indexer").consumer == socket.gethostname()
@@ -119,6 +119,36 @@ class TestUUIDGeneration:
         assert isinstance(uuid, UUID)
 
 
+class TestContentHash:
+    """Tests for content hashing used for change detection."""
+
+    def test_hash_ignores_key_order(self, processor: OParlProcessor) -> None:
+        """Test the hash is computed over canonicalized JSON."""
+        person_a = processor.process_person({
+            "id": "https://example.org/person/1",
+            "type": "https://schema.oparl.org/1.1/Person",
+            "name": "Max Mustermann",
+        })
+        person_b = processor.process_person({
+            "name": "Max Mustermann",
+            "type": "https://schema.oparl.org/1.1/Person",
+            "id": "https://example.org/person/1",
+        })
+        assert person_a.content_hash == person_b.content_hash
+        assert len(person_a.content_hash) == 64
+
+    def test_hash_changes_with_content(self, processor: OParlProcessor) -> None:
+        """Test a changed field changes the hash."""
+        data = {
+            "id": "https://example.org/person/1",
+            "type": "https://schema.oparl.org/1.1/Person",
+            "name": "Max Mustermann",
+        }
+        before = processor.process_person(data)
+        after = processor.process_person({**data, "name": "Erika Mustermann"})
+        assert before.content_hash != after.content_hash
+
+
 class TestDatetimeParsing:
     """Tests for datetime parsing."""
 
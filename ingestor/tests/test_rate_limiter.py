@@ -0,0 +1,129 @@
+"""
+Tests for the adaptive per-host rate limiter.
+"""
+
+import asyncio
+
+import pytest
+
+from src.rate_limiter import HostLimiter, HostLimiterConfig
+
+
+def make_limiter(**overrides) -> HostLimiter:
+    config = HostLimiterConfig(
+        initial_concurrency=4,
+        max_concurrency=8,
+        initial_rate=10.0,
+        max_rate=20.0,
+        decrease_cooldown=0.0,
+        **overrides,
+    )
+    return HostLimiter("oparl.example.org", config)
+
+
+class TestAIMD:
+    """Tests for additive increase / multiplicative decrease."""
+
+    def test_limit_grows_after_healthy_window(self) -> None:
+        """Test one healthy window of `limit` responses adds one slot."""
+        limiter = make_limiter()
+
+        for _ in range(3):
+            limiter.record_response(200, 0.2)
+        assert limiter.limit == 4
+
+        limiter.record_response(200, 0.2)
+        assert limiter.limit == 5
+        assert limiter.rate == 12.0
+
+    def test_limit_is_capped(self) -> None:
+        """Test growth stops at max_concurrency and max_rate."""
+        limiter = make_limiter()
+
+        for _ in range(200):
+            limiter.record_response(200, 0.2)
+
+        assert limiter.limit == 8
+        assert limiter.rate == 20.0
+
+    @pytest.mark.parametrize("status", [429, 500, 503])
+    def test_overload_halves_limits(self, status: int) -> None:
+        """Test throttling and server errors halve concurrency and rate."""
+        limiter = make_limiter()
+
+        limiter.record_response(status, 0.2)
+
+        assert limiter.limit == 2
+        assert limiter.rate == 5.0
+
+    def test_timeouts_and_slow_responses_back_off(self) -> None:
+        """Test timeouts and responses above the latency threshold decrease."""
+        limiter = make_limiter(latency_threshold=5.0)
+
+        limiter.record_response(200, 6.0)
+        assert limiter.limit == 2
+
+        limiter.record_timeout()
+        assert limiter.limit == 1
+        assert limiter.rate >= limiter.config.min_rate
+
+    def test_burst_of_failures_decreases_once(self) -> None:
+        """Test failures within the cooldown only count once."""
+        limiter = HostLimiter("oparl.example.org", HostLimiterConfig(initial_concurrency=8))
+
+        for _ in range(5):
+            limiter.record_response(503, 0.2)
+
+        assert limiter.limit == 4
+
+
+class TestSlotsAndTokens:
+    """Tests for concurrency slots and the token bucket."""
+
+    @pytest.mark.asyncio
+    async def test_slots_bound_concurrency(self) -> None:
+        """Test no more than `limit` requests run at once."""
+        limiter = make_limiter()
+        in_flight = 0
+        max_in_flight = 0
+
+        async def request() -> None:
+            nonlocal in_flight, max_in_flight
+            async with limiter.slot():
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+
+        await asyncio.gather(*[request() for _ in range(12)])
+
+        assert max_in_flight == 4
+        assert limiter.get_status()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_gives_slot_back(self) -> None:
+        """Test a cancelled waiter doesn't leak a slot."""
+        limiter = make_limiter(min_concurrency=1)
+        limiter.limit = 1
+
+        async with limiter.slot():
+            waiter = asyncio.create_task(limiter._acquire())
+            await asyncio.sleep(0)
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+
+        assert limiter.get_status()["in_flight"] == 0
+        assert limiter.get_status()["waiting"] == 0
+
+    @pytest.mark.asyncio
+    async def test_retry_after_pauses_host(self) -> None:
+        """Test Retry-After of a 429 delays the next token."""
+        limiter = make_limiter()
+        limiter.record_response(429, 0.1, retry_after="0.05")
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await limiter.wait_for_token()
+
+        assert loop.time() - start >= 0.04
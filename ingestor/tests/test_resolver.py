@@ -0,0 +1,104 @@
+"""
+Tests for the external ID resolver.
+"""
+
+from typing import Any
+from uuid import uuid4
+
+import pytest
+
+import src.sync  # noqa: F401  (import order: sync before storage)
+from src.storage.resolver import UUIDResolver
+
+
+class FakeResult:
+    def __init__(self, rows: list[tuple[Any, ...]]) -> None:
+        self._rows = rows
+
+    def all(self) -> list[tuple[Any, ...]]:
+        return self._rows
+
+
+class FakeSession:
+    """Session answering every SELECT with a fixed set of rows."""
+
+    def __init__(self, rows: dict[str, Any]) -> None:
+        self.rows = rows
+        self.queries = 0
+
+    async def __aenter__(self) -> "FakeSession":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        return None
+
+    async def execute(self, stmt: Any) -> FakeResult:
+        self.queries += 1
+        # IN (...) lookups have a list parameter, preloads filter by body_id only
+        wanted = {
+            external_id
+            for key, value in stmt.compile().params.items()
+            if key.startswith("external_id")
+            for external_id in value
+        }
+        if not wanted:
+            return FakeResult(list(self.rows.items()))
+        return FakeResult([(k, v) for k, v in self.rows.items() if k in wanted])
+
+
+@pytest.fixture
+def stored() -> dict[str, Any]:
+    return {f"https://example.org/paper/{i}": uuid4() for i in range(5)}
+
+
+class TestUUIDResolver:
+    """Tests for cached and batched ID resolution."""
+
+    @pytest.mark.asyncio
+    async def test_misses_are_resolved_in_one_query(self, stored) -> None:
+        """Test all unknown IDs of a call are looked up together."""
+        session = FakeSession(stored)
+        resolver = UUIDResolver(lambda: session, max_size=100)
+
+        ids = await resolver.resolve_many("paper", [*stored, "https://example.org/paper/99"])
+
+        assert ids == stored
+        assert session.queries == 1
+        assert resolver.misses == 6
+
+    @pytest.mark.asyncio
+    async def test_preloaded_ids_are_hits(self, stored) -> None:
+        """Test IDs loaded for a body are answered without queries."""
+        session = FakeSession(stored)
+        resolver = UUIDResolver(lambda: session, max_size=100)
+
+        body_id = uuid4()
+        await resolver.preload(body_id, entity_types=("paper",))
+        await resolver.preload(body_id, entity_types=("paper",))
+        assert session.queries == 1
+
+        ids = await resolver.resolve_many("paper", list(stored))
+
+        assert ids == stored
+        assert session.queries == 1
+        assert resolver.hit_rate == 1.0
+
+    def test_cache_is_bounded(self) -> None:
+        """Test the least recently used IDs are evicted."""
+        resolver = UUIDResolver(lambda: None, max_size=2)  # type: ignore[arg-type, return-value]
+        first, second, third = uuid4(), uuid4(), uuid4()
+
+        resolver.remember("meeting", {"a": first, "b": second})
+        assert resolver.get("meeting", "a") == first
+        resolver.remember("meeting", {"c": third})
+
+        assert resolver.get("meeting", "b") is None
+        assert resolver.get("meeting", "a") == first
+        assert resolver.get("meeting", "c") == third
+
+    def test_entity_types_are_separate(self) -> None:
+        """Test the same external ID can map to different types."""
+        resolver = UUIDResolver(lambda: None, max_size=10)  # type: ignore[arg-type, return-value]
+        resolver.remember("meeting", {"x": uuid4()})
+
+        assert resolver.get("paper", "x") is None
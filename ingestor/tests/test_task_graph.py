@@ -0,0 +1,95 @@
+"""
+Tests for the task graph scheduler used by the body sync.
+"""
+
+import asyncio
+
+import pytest
+
+from src.sync.task_graph import (
+    BODY_SYNC_GRAPH,
+    TaskBudget,
+    critical_path_lengths,
+    run_task_graph,
+    topological_order,
+)
+
+
+class TestGraph:
+    """Tests for ordering and validation."""
+
+    def test_body_graph_is_valid(self) -> None:
+        """Test every entity type comes after the types it references."""
+        order = topological_order(BODY_SYNC_GRAPH)
+
+        for name, dependencies in BODY_SYNC_GRAPH.items():
+            assert all(order.index(d) < order.index(name) for d in dependencies)
+
+    def test_cycles_are_rejected(self) -> None:
+        """Test a cyclic graph raises."""
+        with pytest.raises(ValueError, match="cycle"):
+            topological_order({"a": ("b",), "b": ("a",)})
+
+    def test_critical_path(self) -> None:
+        """Test tasks with longer chains of dependents get higher priorities."""
+        lengths = critical_path_lengths({"a": (), "b": ("a",), "c": ("b",), "d": ()})
+
+        assert lengths == {"a": 3, "b": 2, "c": 1, "d": 1}
+
+
+class TestScheduler:
+    """Tests for running task graphs."""
+
+    @pytest.mark.asyncio
+    async def test_tasks_start_when_their_inputs_are_done(self) -> None:
+        """Test an independent task isn't held up by a slow unrelated one."""
+        finished: list[str] = []
+
+        async def run(name: str) -> str:
+            await asyncio.sleep({"person": 0.05}.get(name, 0.0))
+            finished.append(name)
+            return name
+
+        results = await run_task_graph(
+            {"person": (), "membership": ("person",), "meeting": (), "agendaitem": ("meeting",)},
+            run,
+        )
+
+        assert results["agendaitem"] == "agendaitem"
+        assert finished.index("agendaitem") < finished.index("person")
+        assert finished.index("membership") > finished.index("person")
+
+    @pytest.mark.asyncio
+    async def test_failures_are_returned(self) -> None:
+        """Test a failing task doesn't stop its dependents."""
+
+        async def run(name: str) -> int:
+            if name == "a":
+                raise RuntimeError("boom")
+            return 1
+
+        results = await run_task_graph({"a": (), "b": ("a",)}, run)
+
+        assert isinstance(results["a"], RuntimeError)
+        assert results["b"] == 1
+
+    @pytest.mark.asyncio
+    async def test_budget_limits_and_prioritizes(self) -> None:
+        """Test the budget bounds concurrency and serves the critical path first."""
+        budget = TaskBudget(1)
+        started: list[str] = []
+
+        async def run(name: str) -> None:
+            started.append(name)
+            assert budget.running == 1
+            await asyncio.sleep(0)
+
+        graph = {"leaf1": (), "leaf2": (), "root": (), "child": ("root",)}
+        async with budget.slot():
+            # Slot is taken - all tasks have to queue
+            runner = asyncio.create_task(run_task_graph(graph, run, budget))
+            await asyncio.sleep(0.01)
+        await runner
+
+        assert started[0] == "root"
+        assert sorted(started) == sorted(graph)
@@ -0,0 +1,90 @@
+"""
+Tests for the multi-process sync.
+
+Only planning and result merging are tested; they don't start processes.
+"""
+
+# isort: off
+# src.sync first: src.storage.database imports src.sync.processor, and the
+# src.sync package imports the orchestrator, which needs src.storage.database
+from src.client.oparl_client import SyncStats
+from src.sync.orchestrator import SyncResult, body_matches
+from src.sync.workers import SyncShard, assign_shards, merge_results
+from src.storage.database import WriteStats
+# isort: on
+
+
+class TestSharding:
+    """Tests for distributing work over worker processes."""
+
+    def test_heavy_shards_are_balanced(self) -> None:
+        """Test shards are assigned heaviest first to the least loaded worker."""
+        shards = [
+            SyncShard("https://a.example.org", ("b1", "b2", "b3", "b4")),
+            SyncShard("https://b.example.org"),
+            SyncShard("https://c.example.org", ("b5", "b6")),
+            SyncShard("https://d.example.org"),
+            SyncShard("https://e.example.org"),
+        ]
+
+        batches = assign_shards(shards, workers=2)
+
+        loads = sorted(sum(shard.weight for shard in batch) for batch in batches)
+        assert loads == [4, 5]
+
+    def test_no_more_workers_than_shards(self) -> None:
+        """Test idle workers aren't started."""
+        batches = assign_shards([SyncShard("https://a.example.org")], workers=8)
+
+        assert len(batches) == 1
+
+    def test_body_ids_match_exactly(self) -> None:
+        """Test a body shard doesn't match bodies with a similar ID."""
+        body = {"id": "https://example.org/body/10", "name": "Stadt"}
+
+        assert body_matches(body, body_ids=("https://example.org/body/10",))
+        assert not body_matches(body, body_ids=("https://example.org/body/1",))
+        assert not body_matches(body, body_filter="Kreis", body_ids=("https://example.org/body/10",))
+
+
+class TestMergeResults:
+    """Tests for aggregating shard results."""
+
+    def test_shard_results_are_summed(self) -> None:
+        """Test counts, statistics and errors of shards are combined."""
+        first = SyncResult(
+            source_url="https://a.example.org",
+            source_name="A",
+            success=True,
+            bodies_synced=2,
+            meetings_synced=10,
+            duration_seconds=30.0,
+            http_stats=SyncStats(http_requests=5, start_time=100.0),
+            write_stats=WriteStats(written=8, skipped=2),
+        )
+        second = SyncResult(
+            source_url="https://a.example.org",
+            source_name="A",
+            success=False,
+            bodies_synced=1,
+            meetings_synced=4,
+            errors=["timeout"],
+            duration_seconds=45.0,
+            http_stats=SyncStats(http_requests=7, start_time=90.0),
+            write_stats=WriteStats(written=1, skipped=3),
+        )
+
+        merged = merge_results([first, second])
+
+        assert merged.source_name == "A"
+        assert not merged.success
+        assert merged.bodies_synced == 3
+        assert merged.meetings_synced == 14
+        assert merged.errors == ["timeout"]
+        assert merged.duration_seconds == 45.0
+        assert merged.http_stats is not None
+        assert merged.http_stats.http_requests == 12
+        assert merged.http_stats.start_time == 90.0
+        assert merged.write_stats == WriteStats(written=9, skipped=5)
+        # Inputs are left untouched
+        assert first.http_stats.http_requests == 5
@@ -6,6 +6,9 @@ Meeting preparation views for the Work module.
 import json
 from datetime import datetime, timedelta
 
+from django.db.models import Prefetch
+from django.db.models.fields.json import KeyTextTransform, KeyTransform
+from django.db.models.functions import Coalesce
 from django.http import JsonResponse
 from django.shortcuts import get_object_or_404, redirect
 from django.utils import timezone
@@ -24,6 +27,31 @@ from .models import (
 )
 
 
+def committees_prefetch():
+    """Prefetch the committees of meetings (only the columns shown as names)."""
+    return Prefetch(
+        "organizations",
+        queryset=OParlOrganization.objects.only("id", "external_id", "name", "short_name").order_by("name"),
+    )
+
+
+def with_first_organization_ref(queryset):
+    """
+    Annotate first_organization_ref: the first entry of the OParl "organization" field.
+
+    The link table has no order, so this keeps the committee shown for a
+    meeting the first one OParl lists. The value is extracted in SQL, so
+    raw_json itself stays deferred.
+    """
+    organization = KeyTransform("organization", "raw_json")
+    return queryset.annotate(
+        # List of URLs (->> 0) or a single URL (->>)
+        first_organization_ref=Coalesce(
+            KeyTextTransform("0", organization), KeyTextTransform("organization", "raw_json")
+        )
+    )
+
+
 def prefetch_papers_for_agenda_items(agenda_items):
     """
     Pre-fetch papers for a list of agenda items via consultations.
@@ -101,46 +129,21 @@ class MeetingListView(WorkViewMixin, TemplateView):
     permission_required = "meetings.view"
 
     @staticmethod
-    def _meeting_matches_committees(meeting: OParlMeeting, committee_ext_ids: set) -> bool:
-        """Check if meeting belongs to any of the given committees via raw_json."""
-        raw = meeting.raw_json or {}
-        org_field = raw.get("organization")
-        if isinstance(org_field, list):
-            return any(isinstance(value, str) and value in committee_ext_ids for value in org_field)
-        if isinstance(org_field, str):
-            return org_field in committee_ext_ids
-        return False
-
-    @staticmethod
-    def _get_organization_name(meeting: OParlMeeting, org_cache: dict) -> str:
-        """Get committee name from meeting's raw_json organization field."""
-        raw = meeting.raw_json or {}
-        org_url = raw.get("organization")
-
-        # organization can be a URL (string) or a list of URLs
-        if isinstance(org_url, list) and org_url:
-            org_url = org_url[0]  # Use first committee
-
-        if not org_url or not isinstance(org_url, str):
-            return meeting.body.name if meeting.body else "Gremium"
-
-        # Check cache
-        if org_url in org_cache:
-            return org_cache[org_url]
-
-        # Load organization from DB
-        try:
-            org = OParlOrganization.objects.filter(external_id=org_url).first()
-            if org:
-                name = org.name or org.short_name or meeting.body.name
-                org_cache[org_url] = name
+    def _get_committee_name(meeting: OParlMeeting) -> str:
+        """
+        Get committee name from the meeting's prefetched organizations.
+
+        Prefers the first organization listed in OParl (see
+        with_first_organization_ref), then the first one by name.
+        """
+        organizations = list(meeting.organizations.all())
+        first_ref = getattr(meeting, "first_organization_ref", None)
+        organizations.sort(key=lambda org: org.external_id != first_ref)
+        for org in organizations:
+            name = org.name or org.short_name
+            if name:
                 return name
-        except Exception:
-            pass
-
-        # Fallback
-        org_cache[org_url] = meeting.body.name if meeting.body else "Gremium"
-        return org_cache[org_url]
+        return meeting.body.name if meeting.body else "Gremium"
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -164,9 +167,8 @@ class MeetingListView(WorkViewMixin, TemplateView):
         now = timezone.now()
 
         if body and membership:
-            # Get committees assigned to this member (with external_id for matching)
+            # Get committees assigned to this member
             assigned_committees = list(membership.oparl_committees.filter(body=body))
-            assigned_committee_ext_ids = {c.external_id for c in assigned_committees if c.external_id}
 
             # Get all committees for filter dropdown
             all_committees = (
@@ -177,13 +179,15 @@ class MeetingListView(WorkViewMixin, TemplateView):
 
             # Build base queryset - filter by start date to limit results
             qs = (
-                OParlMeeting.objects.filter(
+                with_first_organization_ref(OParlMeeting.objects.all())
+                .filter(
                     body=body,
                     cancelled=False,
                     start__isnull=False,
                 )
                 .prefetch_related(
                     "agenda_items",
+                    committees_prefetch(),
                 )
                 .select_related("body")
             )
@@ -204,26 +208,14 @@ class MeetingListView(WorkViewMixin, TemplateView):
             if search_query:
                 qs = qs.filter(name__icontains=search_query)
 
-            # Convert to list for filtering
-            all_meetings = list(qs)
-
-            # Filter by assigned committees using raw_json (like old code)
-            if view_mode == "my" and assigned_committee_ext_ids:
-                meetings = [m for m in all_meetings if self._meeting_matches_committees(m, assigned_committee_ext_ids)]
+            # Filter by committees via the meeting-organization link table
+            if view_mode == "my" and assigned_committees:
+                qs = qs.filter(organizations__in=assigned_committees).distinct()
             elif committee_filter:
-                # Get the committee's external_id for filtering
-                filter_committee = OParlOrganization.objects.filter(id=committee_filter).first()
-                if filter_committee and filter_committee.external_id:
-                    meetings = [
-                        m for m in all_meetings if self._meeting_matches_committees(m, {filter_committee.external_id})
-                    ]
-                else:
-                    meetings = all_meetings
-            else:
-                meetings = all_meetings
+                qs = qs.filter(organizations__id=committee_filter)
 
             # Limit results
-            meetings = meetings[:100]
+            meetings = list(qs[:100])
 
             # Get preparation status for current user
             prepared_meeting_ids = set(
@@ -232,16 +224,13 @@ class MeetingListView(WorkViewMixin, TemplateView):
                 )
             )
 
-            # Organization name cache
-            org_cache = {}
-
             # Enhance meeting objects with display info
             for meeting in meetings:
                 meeting.user_prepared = meeting.id in prepared_meeting_ids
                 # Use len() on prefetched queryset instead of count() to avoid N+1
                 meeting.agenda_count = len(meeting.agenda_items.all())
-                # Get committee name from raw_json
-                meeting.committee_name = self._get_organization_name(meeting, org_cache)
+                # Get committee name from the prefetched organizations
+                meeting.committee_name = self._get_committee_name(meeting)
 
         context["meetings"] = meetings
         context["assigned_committees"] = assigned_committees
@@ -347,16 +336,17 @@ class MeetingDetailView(WorkViewMixin, TemplateView):
             return context
 
         meeting = get_object_or_404(
-            OParlMeeting.objects.prefetch_related(
+            with_first_organization_ref(OParlMeeting.objects.all()).prefetch_related(
                 "agenda_items",
+                committees_prefetch(),
             ),
             id=meeting_id,
             body=body,
         )
 
         if meeting:
-            # Add committee name from raw_json
-            meeting.committee_name = MeetingListView._get_organization_name(meeting, {})
+            # Add committee name from the prefetched organizations
+            meeting.committee_name = MeetingListView._get_committee_name(meeting)
 
             # Sort agenda items by number
             agenda_items = sorted(meeting.agenda_items.all(), key=lambda x: (x.number or "999"))
@@ -404,16 +394,16 @@ class MeetingPrepareView(WorkViewMixin, TemplateView):
             return context
 
         meeting = get_object_or_404(
-            OParlMeeting.objects.prefetch_related(
-                "organizations",
+            with_first_organization_ref(OParlMeeting.objects.all()).prefetch_related(
+                committees_prefetch(),
                 "agenda_items",
             ),
             id=meeting_id,
             body=body,
         )
 
-        # Add committee name from raw_json
-        meeting.committee_name = MeetingListView._get_organization_name(meeting, {})
+        # Add committee name from the prefetched organizations
+        meeting.committee_name = MeetingListView._get_committee_name(meeting)
         context["meeting"] = meeting
 
         if meeting and membership:
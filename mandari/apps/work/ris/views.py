@@ -36,43 +36,18 @@ class RISOverviewView(WorkViewMixin, TemplateView):
         context["body"] = body
 
         # Import here to avoid circular imports
-        from insight_core.models import (
-            OParlMeeting,
-            OParlOrganization,
-            OParlPaper,
-            OParlPerson,
-        )
-
-        # Statistics
-        today = timezone.now().date()
-
-        # Papers (Vorgänge)
-        papers_total = OParlPaper.objects.filter(body=body).count()
-        papers_this_year = OParlPaper.objects.filter(body=body, date__year=today.year).count()
-
-        # Meetings (Sitzungen)
-        meetings_total = OParlMeeting.objects.filter(body=body).count()
-        meetings_upcoming = OParlMeeting.objects.filter(body=body, start__gt=timezone.now(), cancelled=False).count()
-
-        # Organizations (Gremien)
-        organizations_total = OParlOrganization.objects.filter(body=body).count()
-        organizations_active = (
-            OParlOrganization.objects.filter(body=body)
-            .filter(Q(end_date__isnull=True) | Q(end_date__gte=today))
-            .count()
-        )
-
-        # Persons (Personen)
-        persons_total = OParlPerson.objects.filter(body=body).count()
+        from insight_core.models import BodyStatistics, OParlMeeting, OParlPaper
 
+        # Statistics (precomputed by the ingestor after each sync)
+        statistics = BodyStatistics.for_body(body)
         context["stats"] = {
-            "papers_total": papers_total,
-            "papers_this_year": papers_this_year,
-            "meetings_total": meetings_total,
-            "meetings_upcoming": meetings_upcoming,
-            "organizations_total": organizations_total,
-            "organizations_active": organizations_active,
-            "persons_total": persons_total,
+            "papers_total": statistics.papers_total,
+            "papers_this_year": statistics.papers_this_year,
+            "meetings_total": statistics.meetings_total,
+            "meetings_upcoming": statistics.meetings_upcoming,
+            "organizations_total": statistics.organizations_total,
+            "organizations_active": statistics.organizations_active,
+            "persons_total": statistics.persons_total,
         }
 
         # Recent papers
@@ -181,6 +156,7 @@ class RISPaperDetailView(WorkViewMixin, TemplateView):
             context["files_from_raw_json"] = False
         else:
             # Fallback: Extract files from raw_json if database relationship is empty
+            # (raw_json is deferred by default and only loaded on this path)
             raw_files = []
             raw_json = paper.raw_json or {}
 
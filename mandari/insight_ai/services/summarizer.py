@@ -187,7 +187,7 @@ class SummaryService:
         files_to_extract = []
 
         # First pass: collect existing text and identify files needing extraction
-        for file in paper.files.all():
+        for file in paper.files.with_deferred("text_content"):
             if file.text_content and file.text_content.strip():
                 file_name = file.name or file.file_name or "Dokument"
                 texts.append(f"### {file_name}\n{file.text_content.strip()}")
@@ -267,7 +267,7 @@ class SummaryService:
         """
         texts = []
 
-        for file in paper.files.all():
+        for file in paper.files.with_deferred("text_content"):
             if file.text_content and file.text_content.strip():
                 file_name = file.name or file.file_name or "Dokument"
                 texts.append(f"### {file_name}\n{file.text_content.strip()}")
@@ -7,8 +7,7 @@ Zeigt Statistiken und Übersichten für das Mandari-Projekt.
 import json
 from datetime import timedelta
 
-from django.db.models import Count
-from django.db.models.functions import TruncMonth
+from django.db.models import F
 from django.utils import timezone
 
 
@@ -21,35 +20,32 @@ def dashboard_callback(request, context):
     """
     from insight_content.models import BlogPost, Release
     from insight_core.models import (
-        OParlAgendaItem,
+        BodyStatistics,
         OParlBody,
-        OParlFile,
         OParlMeeting,
-        OParlMembership,
-        OParlOrganization,
         OParlPaper,
-        OParlPerson,
         OParlSource,
+        monthly_series,
     )
 
     # Zeitraum für "kürzlich"
     recent_date = timezone.now() - timedelta(days=7)
-    twelve_months_ago = timezone.now() - timedelta(days=365)
 
-    # OParl Statistiken
+    # OParl Statistiken (vom Ingestor pro Kommune vorberechnet)
+    totals = BodyStatistics.totals()
     context["stats"] = {
         "sources": OParlSource.objects.count(),
         "sources_active": OParlSource.objects.filter(is_active=True).count(),
         "bodies": OParlBody.objects.count(),
-        "organizations": OParlOrganization.objects.count(),
-        "persons": OParlPerson.objects.count(),
-        "meetings": OParlMeeting.objects.count(),
-        "meetings_upcoming": OParlMeeting.objects.filter(start__gte=timezone.now()).count(),
-        "papers": OParlPaper.objects.count(),
+        "organizations": totals["organizations_total"],
+        "persons": totals["persons_total"],
+        "meetings": totals["meetings_total"],
+        "meetings_upcoming": totals["meetings_upcoming"],
+        "papers": totals["papers_total"],
         "papers_recent": OParlPaper.objects.filter(created_at__gte=recent_date).count(),
-        "agenda_items": OParlAgendaItem.objects.count(),
-        "files": OParlFile.objects.count(),
-        "memberships": OParlMembership.objects.count(),
+        "agenda_items": totals["agenda_items_total"],
+        "files": totals["files_total"],
+        "memberships": totals["memberships_total"],
     }
 
     # Content Statistiken
@@ -96,44 +92,21 @@ def dashboard_callback(request, context):
         "Dez",
     ]
 
-    # Papers per month
-    papers_monthly = list(
-        OParlPaper.objects.filter(date__gte=twelve_months_ago, date__isnull=False)
-        .annotate(month=TruncMonth("date"))
-        .values("month")
-        .annotate(count=Count("id"))
-        .order_by("month")
-    )
-
-    # Meetings per month
-    meetings_monthly = list(
-        OParlMeeting.objects.filter(start__gte=twelve_months_ago)
-        .annotate(month=TruncMonth("start"))
-        .values("month")
-        .annotate(count=Count("id"))
-        .order_by("month")
-    )
+    # Papers and meetings per month
+    monthly = monthly_series(totals["monthly"])
 
-    # Build chart data
-    chart_months = []
-    chart_papers = []
-    chart_meetings = []
-
-    # Create month lookup
-    meetings_by_month = {m["month"]: m["count"] for m in meetings_monthly}
-
-    for item in papers_monthly:
-        if item["month"]:
-            chart_months.append(month_names[item["month"].month - 1])
-            chart_papers.append(item["count"])
-            chart_meetings.append(meetings_by_month.get(item["month"], 0))
+    chart_months = [month_names[item["month"].month - 1] for item in monthly]
+    chart_papers = [item["papers"] for item in monthly]
+    chart_meetings = [item["meetings"] for item in monthly]
 
     context["chart_months"] = json.dumps(chart_months)
     context["chart_papers"] = json.dumps(chart_papers)
     context["chart_meetings"] = json.dumps(chart_meetings)
 
     # Papers by body (for doughnut chart)
-    papers_by_body = list(OParlPaper.objects.values("body__name").annotate(count=Count("id")).order_by("-count")[:10])
+    papers_by_body = list(
+        BodyStatistics.objects.annotate(count=F("papers_total")).values("body__name", "count").order_by("-count")[:10]
+    )
 
     context["papers_by_body_labels"] = json.dumps([p["body__name"] or "Unbekannt" for p in papers_by_body])
     context["papers_by_body_data"] = json.dumps([p["count"] for p in papers_by_body])
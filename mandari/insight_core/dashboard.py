@@ -5,10 +5,7 @@ Admin Dashboard für Mandari Insight.
 Zeigt Statistiken und Charts für OParl-Daten.
 """
 
-from datetime import timedelta
-
-from django.db.models import Count
-from django.db.models.functions import TruncMonth
+from django.db.models import F
 from django.utils import timezone
 
 
@@ -61,75 +58,39 @@ def get_sync_status_data():
 
 
 def get_entity_counts():
-    """Get counts for all OParl entity types."""
-    from insight_core.models import (
-        OParlAgendaItem,
-        OParlBody,
-        OParlConsultation,
-        OParlFile,
-        OParlLocation,
-        OParlMeeting,
-        OParlMembership,
-        OParlOrganization,
-        OParlPaper,
-        OParlPerson,
-        OParlSource,
-    )
+    """Get counts for all OParl entity types (precomputed per body)."""
+    from insight_core.models import BodyStatistics, OParlBody, OParlSource
 
+    totals = BodyStatistics.totals()
     return {
         "sources": OParlSource.objects.filter(is_active=True).count(),
         "bodies": OParlBody.objects.count(),
-        "organizations": OParlOrganization.objects.count(),
-        "persons": OParlPerson.objects.count(),
-        "meetings": OParlMeeting.objects.count(),
-        "papers": OParlPaper.objects.count(),
-        "agenda_items": OParlAgendaItem.objects.count(),
-        "files": OParlFile.objects.count(),
-        "memberships": OParlMembership.objects.count(),
-        "locations": OParlLocation.objects.count(),
-        "consultations": OParlConsultation.objects.count(),
+        "organizations": totals["organizations_total"],
+        "persons": totals["persons_total"],
+        "meetings": totals["meetings_total"],
+        "papers": totals["papers_total"],
+        "agenda_items": totals["agenda_items_total"],
+        "files": totals["files_total"],
+        "memberships": totals["memberships_total"],
+        "locations": totals["locations_total"],
+        "consultations": totals["consultations_total"],
     }
 
 
-def get_papers_per_month():
-    """Get paper counts per month for the last 12 months."""
-    from insight_core.models import OParlPaper
-
-    twelve_months_ago = timezone.now() - timedelta(days=365)
-
-    papers = (
-        OParlPaper.objects.filter(date__gte=twelve_months_ago)
-        .annotate(month=TruncMonth("date"))
-        .values("month")
-        .annotate(count=Count("id"))
-        .order_by("month")
-    )
-
-    return list(papers)
-
-
-def get_meetings_per_month():
-    """Get meeting counts per month for the last 12 months."""
-    from insight_core.models import OParlMeeting
-
-    twelve_months_ago = timezone.now() - timedelta(days=365)
+def get_monthly_counts():
+    """Get paper and meeting counts per month for the last 12 months."""
+    from insight_core.models import BodyStatistics, monthly_series
 
-    meetings = (
-        OParlMeeting.objects.filter(start__gte=twelve_months_ago)
-        .annotate(month=TruncMonth("start"))
-        .values("month")
-        .annotate(count=Count("id"))
-        .order_by("month")
-    )
-
-    return list(meetings)
+    return monthly_series(BodyStatistics.totals()["monthly"])
 
 
 def get_papers_by_body():
     """Get paper counts per body."""
-    from insight_core.models import OParlPaper
+    from insight_core.models import BodyStatistics
 
-    papers = OParlPaper.objects.values("body__name").annotate(count=Count("id")).order_by("-count")[:10]
+    papers = (
+        BodyStatistics.objects.annotate(count=F("papers_total")).values("body__name", "count").order_by("-count")[:10]
+    )
 
     return list(papers)
 
@@ -161,9 +122,8 @@ def dashboard_callback(request, context):
     # Entity counts for stat cards
     counts = get_entity_counts()
 
-    # Papers per month for chart
-    papers_monthly = get_papers_per_month()
-    meetings_monthly = get_meetings_per_month()
+    # Papers and meetings per month for chart
+    monthly = get_monthly_counts()
 
     # Sync status
     sync_status = get_sync_status_data()
@@ -171,11 +131,6 @@ def dashboard_callback(request, context):
     # Papers by body for pie chart
     papers_by_body = get_papers_by_body()
 
-    # Format data for Chart.js
-    months = []
-    paper_counts = []
-    meeting_counts = []
-
     # German month names
     month_names = [
         "Jan",
@@ -192,17 +147,9 @@ def dashboard_callback(request, context):
         "Dez",
     ]
 
-    for item in papers_monthly:
-        if item["month"]:
-            months.append(month_names[item["month"].month - 1])
-            paper_counts.append(item["count"])
-
-    for item in meetings_monthly:
-        meeting_counts.append(item["count"])
-
-    # Pad meeting_counts to match paper_counts length
-    while len(meeting_counts) < len(paper_counts):
-        meeting_counts.append(0)
+    months = [month_names[item["month"].month - 1] for item in monthly]
+    paper_counts = [item["papers"] for item in monthly]
+    meeting_counts = [item["meetings"] for item in monthly]
 
     context.update(
         {
@@ -1,8 +1,33 @@
-"""Management command to link meetings with their organizations based on raw_json data."""
+"""
+Management command to link meetings with their organizations based on raw_json data.
 
-from django.core.management.base import BaseCommand
+Rebuilds the meeting-organization link table set-based in PostgreSQL:
 
-from insight_core.models import OParlMeeting, OParlOrganization
+- extract: organization URLs from raw_json->'organization' (list or single
+  string) via jsonb_array_elements_text, joined on oparl_organizations.external_id,
+  into a temporary table
+- delete: link rows no longer backed by raw_json, in chunks
+- insert: missing link rows, in chunks
+
+The ingestor keeps the links current while syncing; this command is for
+backfilling and repairing existing data.
+
+Usage:
+    python manage.py link_meeting_orgs
+    python manage.py link_meeting_orgs --body https://oparl.example.org/body/1
+    python manage.py link_meeting_orgs --dry-run
+"""
+
+import time
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from insight_core.models import OParlBody, OParlMeeting, OParlOrganization
+
+# Temporary table holding the links derived from raw_json
+WANTED_TABLE = "link_meeting_orgs_wanted"
 
 
 class Command(BaseCommand):
@@ -14,62 +39,165 @@ class Command(BaseCommand):
             action="store_true",
             help="Don't actually make changes, just show what would be done",
         )
+        parser.add_argument(
+            "--body",
+            type=str,
+            help="Only meetings of this body (UUID or OParl ID)",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=10000,
+            help="Link rows deleted/inserted per statement (default: 10000)",
+        )
 
     def handle(self, *args, **options):
         dry_run = options["dry_run"]
-
-        # Build a lookup of organization external_id -> OParlOrganization
-        org_lookup = {}
-        for org in OParlOrganization.objects.all():
-            org_lookup[org.external_id] = org
-
-        self.stdout.write(f"Found {len(org_lookup)} organizations")
-
-        meetings_updated = 0
-        links_created = 0
-
-        # Process all meetings
-        meetings = OParlMeeting.objects.all()
-        total = meetings.count()
-
-        self.stdout.write(f"Processing {total} meetings...")
-
-        for i, meeting in enumerate(meetings.iterator()):
-            if i % 100 == 0:
-                self.stdout.write(f"  Progress: {i}/{total}")
-
-            # Get organization references from raw_json
-            raw = meeting.raw_json or {}
-            org_refs = raw.get("organization", [])
-
-            if not org_refs:
-                continue
-
-            # Ensure it's a list
-            if isinstance(org_refs, str):
-                org_refs = [org_refs]
-
-            # Find matching organizations
-            orgs_to_link = []
-            for org_ref in org_refs:
-                if org_ref in org_lookup:
-                    orgs_to_link.append(org_lookup[org_ref])
-
-            if orgs_to_link:
-                if not dry_run:
-                    # Clear existing and add new
-                    meeting.organizations.set(orgs_to_link)
-
-                meetings_updated += 1
-                links_created += len(orgs_to_link)
-
+        chunk_size = max(1, options["chunk_size"])
+        body = self._get_body(options["body"]) if options["body"] else None
+
+        field = OParlMeeting._meta.get_field("organizations")
+        self.through = field.remote_field.through._meta.db_table
+        self.meeting_column = field.m2m_column_name()
+        self.org_column = field.m2m_reverse_name()
+        self.body_filter = "AND m.body_id = %s" if body else ""
+        self.body_params = [body.id] if body else []
+
+        if body:
+            self.stdout.write(f"Linking meetings of {body.get_display_name()}")
+
+        start = time.monotonic()
+        with connection.cursor() as cursor:
+            try:
+                wanted = self._phase("extract", self._extract, cursor)
+                self.stdout.write(f"  {wanted} organization links found in raw_json")
+
+                if dry_run:
+                    stale, missing = self._phase("compare", self._compare, cursor)
+                else:
+                    stale = self._phase("delete", self._delete_stale, cursor, chunk_size)
+                    missing = self._phase("insert", self._insert_missing, cursor, chunk_size)
+            finally:
+                cursor.execute(f"DROP TABLE IF EXISTS {WANTED_TABLE}")
+
+        duration = time.monotonic() - start
         if dry_run:
             self.stdout.write(
                 self.style.WARNING(
-                    f"DRY RUN: Would update {meetings_updated} meetings with {links_created} organization links"
+                    f"DRY RUN: Would delete {stale} stale and create {missing} organization links ({duration:.1f}s)"
                 )
             )
         else:
             self.stdout.write(
-                self.style.SUCCESS(f"Updated {meetings_updated} meetings with {links_created} organization links")
+                self.style.SUCCESS(f"Deleted {stale} stale and created {missing} organization links ({duration:.1f}s)")
+            )
+
+    def _get_body(self, value: str) -> OParlBody:
+        """Find the body by UUID or OParl ID."""
+        try:
+            lookup = {"id": uuid.UUID(value)}
+        except ValueError:
+            lookup = {"external_id": value}
+        try:
+            return OParlBody.objects.get(**lookup)
+        except OParlBody.DoesNotExist:
+            raise CommandError(f"Body not found: {value}")
+
+    def _phase(self, name: str, func, *args):
+        """Run one phase and report its duration."""
+        start = time.monotonic()
+        result = func(*args)
+        self.stdout.write(f"  {name}: {time.monotonic() - start:.2f}s")
+        return result
+
+    # =========================================================================
+    # Phases
+    # =========================================================================
+
+    def _extract(self, cursor) -> int:
+        """Collect the links referenced in raw_json into the temporary table."""
+        cursor.execute(f"DROP TABLE IF EXISTS {WANTED_TABLE}")
+        cursor.execute(
+            f"""
+            CREATE TEMPORARY TABLE {WANTED_TABLE} AS
+            SELECT DISTINCT m.id AS meeting_id, o.id AS organization_id
+            FROM {OParlMeeting._meta.db_table} m
+            CROSS JOIN LATERAL jsonb_array_elements_text(
+                CASE jsonb_typeof(m.raw_json -> 'organization')
+                    WHEN 'array' THEN m.raw_json -> 'organization'
+                    WHEN 'string' THEN jsonb_build_array(m.raw_json -> 'organization')
+                    ELSE '[]'::jsonb
+                END
+            ) AS ref(url)
+            JOIN {OParlOrganization._meta.db_table} o ON o.external_id = ref.url
+            WHERE m.raw_json IS NOT NULL {self.body_filter}
+            """,
+            self.body_params,
+        )
+        wanted = cursor.rowcount
+        cursor.execute(f"CREATE UNIQUE INDEX ON {WANTED_TABLE} (meeting_id, organization_id)")
+        cursor.execute(f"ANALYZE {WANTED_TABLE}")
+        return wanted
+
+    def _stale_links_sql(self) -> str:
+        """Link rows of the selected meetings that raw_json no longer references."""
+        return f"""
+            SELECT t.id
+            FROM {self.through} t
+            JOIN {OParlMeeting._meta.db_table} m ON m.id = t.{self.meeting_column}
+            WHERE NOT EXISTS (
+                SELECT 1 FROM {WANTED_TABLE} w
+                WHERE w.meeting_id = t.{self.meeting_column}
+                  AND w.organization_id = t.{self.org_column}
+            ) {self.body_filter}
+        """
+
+    def _missing_links_sql(self) -> str:
+        """Links referenced in raw_json without a link row."""
+        return f"""
+            SELECT w.meeting_id, w.organization_id
+            FROM {WANTED_TABLE} w
+            WHERE NOT EXISTS (
+                SELECT 1 FROM {self.through} t
+                WHERE t.{self.meeting_column} = w.meeting_id
+                  AND t.{self.org_column} = w.organization_id
+            )
+        """
+
+    def _compare(self, cursor) -> tuple[int, int]:
+        """Count stale and missing link rows without changing them."""
+        cursor.execute(f"SELECT COUNT(*) FROM ({self._stale_links_sql()}) stale", self.body_params)
+        stale = cursor.fetchone()[0]
+        cursor.execute(f"SELECT COUNT(*) FROM ({self._missing_links_sql()}) missing")
+        missing = cursor.fetchone()[0]
+        return stale, missing
+
+    def _delete_stale(self, cursor, chunk_size: int) -> int:
+        """Delete stale link rows, one chunk per statement."""
+        deleted = 0
+        while True:
+            cursor.execute(
+                f"DELETE FROM {self.through} WHERE id IN ({self._stale_links_sql()} LIMIT %s)",
+                [*self.body_params, chunk_size],
+            )
+            deleted += cursor.rowcount
+            if cursor.rowcount < chunk_size:
+                return deleted
+
+    def _insert_missing(self, cursor, chunk_size: int) -> int:
+        """Insert missing link rows, one chunk per statement."""
+        inserted = 0
+        while True:
+            cursor.execute(
+                f"""
+                INSERT INTO {self.through} ({self.meeting_column}, {self.org_column})
+                {self._missing_links_sql()}
+                LIMIT %s
+                ON CONFLICT ({self.meeting_column}, {self.org_column}) DO NOTHING
+                """,
+                [chunk_size],
             )
+            inserted += cursor.rowcount
+            # Rows linked concurrently (e.g. by the ingestor) are skipped and shorten a chunk
+            if not cursor.rowcount:
+                return inserted
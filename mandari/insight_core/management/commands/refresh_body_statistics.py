@@ -0,0 +1,72 @@
+"""
+Management command to recompute the precomputed per-body statistics.
+
+The ingestor refreshes a body's row (oparl_body_statistics) after every
+sync. Requests never recompute it; time-dependent values (upcoming
+meetings, papers of the current year) age until the next sync. Run this
+command periodically (e.g. cron, every few hours) to refresh rows that are
+missing or older than BodyStatistics.MAX_AGE.
+
+Usage:
+    python manage.py refresh_body_statistics
+    python manage.py refresh_body_statistics --all
+    python manage.py refresh_body_statistics --body https://oparl.example.org/body/1
+"""
+
+import time
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Q
+from django.utils import timezone
+
+from insight_core.models import BodyStatistics, OParlBody
+
+
+class Command(BaseCommand):
+    help = "Recompute missing or stale per-body statistics (oparl_body_statistics)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Refresh every body, not only missing or stale rows",
+        )
+        parser.add_argument(
+            "--body",
+            type=str,
+            help="Only this body (UUID or OParl ID)",
+        )
+
+    def handle(self, *args, **options):
+        bodies = OParlBody.objects.all()
+        if options["body"]:
+            bodies = bodies.filter(pk=self._get_body(options["body"]).pk)
+        elif not options["all"]:
+            now = timezone.now()
+            bodies = bodies.filter(
+                Q(statistics__isnull=True)
+                | Q(statistics__computed_at__lt=now - BodyStatistics.MAX_AGE)
+                | ~Q(statistics__year=now.year)
+            )
+
+        start = time.monotonic()
+        refreshed = 0
+        for body in bodies.order_by("name"):
+            BodyStatistics.refresh(body)
+            refreshed += 1
+
+        self.stdout.write(
+            self.style.SUCCESS(f"{refreshed} body statistics refreshed in {time.monotonic() - start:.1f}s")
+        )
+
+    def _get_body(self, value):
+        """Find a body by UUID or OParl external ID."""
+        try:
+            lookup = {"pk": uuid.UUID(value)}
+        except ValueError:
+            lookup = {"external_id": value}
+        try:
+            return OParlBody.objects.get(**lookup)
+        except OParlBody.DoesNotExist:
+            raise CommandError(f"Body not found: {value}")
@@ -0,0 +1,128 @@
+"""
+Migration: Content Hash for Change Detection
+
+Adds:
+- content_hash on all OParl entity tables. The ingestor stores a SHA-256 of
+  the canonicalized raw_json and skips upserts of unchanged objects.
+"""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("insight_core", "0011_text_extraction_and_seo"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="oparlbody",
+            name="content_hash",
+            field=models.CharField(
+                blank=True,
+                help_text="SHA-256 der kanonisierten OParl-Daten (Änderungserkennung beim Sync)",
+                max_length=64,
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="oparlorganization",
+            name="content_hash",
+            field=models.CharField(
+                blank=True,
+                help_text="SHA-256 der kanonisierten OParl-Daten (Änderungserkennung beim Sync)",
+                max_length=64,
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="oparlperson",
+            name="content_hash",
+            field=models.CharField(
+                blank=True,
+                help_text="SHA-256 der kanonisierten OParl-Daten (Änderungserkennung beim Sync)",
+                max_length=64,
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="oparlmeeting",
+            name="content_hash",
+            field=models.CharField(
+                blank=True,
+                help_text="SHA-256 der kanonisierten OParl-Daten (Änderungserkennung beim Sync)",
+                max_length=64,
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="oparlpaper",
+            name="content_hash",
+            field=models.CharField(
+                blank=True,
+                help_text="SHA-256 der kanonisierten OParl-Daten (Änderungserkennung beim Sync)",
+                max_length=64,
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="oparlagendaitem",
+            name="content_hash",
+            field=models.CharField(
+                blank=True,
+                help_text="SHA-256 der kanonisierten OParl-Daten (Änderungserkennung beim Sync)",
+                max_length=64,
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="oparlfile",
+            name="content_hash",
+            field=models.CharField(
+                blank=True,
+                help_text="SHA-256 der kanonisierten OParl-Daten (Änderungserkennung beim Sync)",
+                max_length=64,
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="oparlmembership",
+            name="content_hash",
+            field=models.CharField(
+                blank=True,
+                help_text="SHA-256 der kanonisierten OParl-Daten (Änderungserkennung beim Sync)",
+                max_length=64,
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="oparllocation",
+            name="content_hash",
+            field=models.CharField(
+                blank=True,
+                help_text="SHA-256 der kanonisierten OParl-Daten (Änderungserkennung beim Sync)",
+                max_length=64,
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="oparlconsultation",
+            name="content_hash",
+            field=models.CharField(
+                blank=True,
+                help_text="SHA-256 der kanonisierten OParl-Daten (Änderungserkennung beim Sync)",
+                max_length=64,
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="oparllegislativeterm",
+            name="content_hash",
+            field=models.CharField(
+                blank=True,
+                help_text="SHA-256 der kanonisierten OParl-Daten (Änderungserkennung beim Sync)",
+                max_length=64,
+                null=True,
+            ),
+        ),
+    ]
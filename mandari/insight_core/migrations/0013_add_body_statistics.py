@@ -0,0 +1,56 @@
+"""
+Migration: Body Statistics
+
+Adds:
+- BodyStatistics (oparl_body_statistics): precomputed counters per body,
+  refreshed by the ingestor after each body sync and read by the portal,
+  RIS overview and admin dashboards instead of COUNT(*) queries.
+"""
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("insight_core", "0012_add_content_hash"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BodyStatistics",
+            fields=[
+                (
+                    "body",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="statistics",
+                        serialize=False,
+                        to="insight_core.oparlbody",
+                    ),
+                ),
+                ("papers_total", models.IntegerField(default=0)),
+                ("papers_this_year", models.IntegerField(default=0)),
+                ("meetings_total", models.IntegerField(default=0)),
+                ("meetings_upcoming", models.IntegerField(default=0)),
+                ("organizations_total", models.IntegerField(default=0)),
+                ("organizations_active", models.IntegerField(default=0)),
+                ("persons_total", models.IntegerField(default=0)),
+                ("files_total", models.IntegerField(default=0)),
+                ("files_with_text", models.IntegerField(default=0)),
+                ("agenda_items_total", models.IntegerField(default=0)),
+                ("memberships_total", models.IntegerField(default=0)),
+                ("locations_total", models.IntegerField(default=0)),
+                ("consultations_total", models.IntegerField(default=0)),
+                ("monthly", models.JSONField(blank=True, default=dict)),
+                ("year", models.IntegerField()),
+                ("computed_at", models.DateTimeField()),
+            ],
+            options={
+                "verbose_name": "Kommunen-Statistik",
+                "verbose_name_plural": "Kommunen-Statistiken",
+                "db_table": "oparl_body_statistics",
+            },
+        ),
+    ]
@@ -5,9 +5,60 @@ Migriert von SQLAlchemy zu Django ORM.
 """
 
 import uuid
+from datetime import UTC, date, datetime, timedelta
 
 from django.core.validators import FileExtensionValidator
 from django.db import models
+from django.db.models.constants import LOOKUP_SEP
+from django.utils import timezone
+
+# =============================================================================
+# Manager mit zurückgestellten Rohdaten
+# =============================================================================
+
+
+def deferred_fields_of(model) -> tuple[str, ...]:
+    """Felder eines OParl-Modells, die standardmäßig nicht geladen werden."""
+    return getattr(model, "DEFERRED_FIELDS", ("raw_json",))
+
+
+class OParlQuerySet(models.QuerySet):
+    """
+    QuerySet der OParl-Modelle.
+
+    Große Felder (raw_json, bei Dateien zusätzlich text_content) werden
+    über OParlManager standardmäßig zurückgestellt. Sie werden nur geladen,
+    wenn sie mit with_deferred() oder only() ausdrücklich angefordert werden.
+    """
+
+    def with_deferred(self, *fields):
+        """
+        Lädt standardmäßig zurückgestellte Felder mit.
+
+        Args:
+            fields: Feldnamen (ohne Angabe: alle zurückgestellten Felder)
+        """
+        fields = set(fields or deferred_fields_of(self.model))
+        existing, defer = self.query.deferred_loading
+        if not defer:
+            # only() ist aktiv: Felder zur Liste der geladenen Felder ergänzen
+            return super().only(*existing, *fields)
+        remaining = existing - fields
+        queryset = self.defer(None)
+        return queryset.defer(*remaining) if remaining else queryset
+
+    def only(self, *fields):
+        # Django entfernt zurückgestellte Felder aus only() - explizit genannte sollen geladen werden
+        requested = {field.split(LOOKUP_SEP, 1)[0] for field in fields} & set(deferred_fields_of(self.model))
+        queryset = self.with_deferred(*requested) if requested else self
+        return super(OParlQuerySet, queryset).only(*fields)
+
+
+class OParlManager(models.Manager.from_queryset(OParlQuerySet)):
+    """Manager, der raw_json (und DEFERRED_FIELDS des Modells) nicht mitlädt."""
+
+    def get_queryset(self):
+        return super().get_queryset().defer(*deferred_fields_of(self.model))
 
 
 class OParlSource(models.Model):
@@ -33,6 +84,8 @@ class OParlSource(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = OParlManager()
+
     class Meta:
         db_table = "oparl_sources"
         verbose_name = "OParl-Quelle"
@@ -123,11 +176,19 @@ class OParlBody(models.Model):
 
     # Rohe OParl-Daten
     raw_json = models.JSONField(default=dict, blank=True)
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        null=True,
+        help_text="SHA-256 der kanonisierten OParl-Daten (Änderungserkennung beim Sync)",
+    )
 
     # Zeitstempel
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = OParlManager()
+
     class Meta:
         db_table = "oparl_bodies"
         verbose_name = "OParl Kommune"
@@ -168,11 +229,19 @@ class OParlOrganization(models.Model):
 
     # Rohe OParl-Daten
     raw_json = models.JSONField(default=dict, blank=True)
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        null=True,
+        help_text="SHA-256 der kanonisierten OParl-Daten (Änderungserkennung beim Sync)",
+    )
 
     # Zeitstempel
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = OParlManager()
+
     class Meta:
         db_table = "oparl_organizations"
         verbose_name = "Gremium"
@@ -216,11 +285,19 @@ class OParlPerson(models.Model):
 
     # Rohe OParl-Daten
     raw_json = models.JSONField(default=dict, blank=True)
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        null=True,
+        help_text="SHA-256 der kanonisierten OParl-Daten (Änderungserkennung beim Sync)",
+    )
 
     # Zeitstempel
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = OParlManager()
+
     class Meta:
         db_table = "oparl_persons"
         verbose_name = "Person"
@@ -278,11 +355,19 @@ class OParlMeeting(models.Model):
 
     # Rohe OParl-Daten
     raw_json = models.JSONField(default=dict, blank=True)
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        null=True,
+        help_text="SHA-256 der kanonisierten OParl-Daten (Änderungserkennung beim Sync)",
+    )
 
     # Zeitstempel
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = OParlManager()
+
     class Meta:
         db_table = "oparl_meetings"
         verbose_name = "Sitzung"
@@ -328,6 +413,12 @@ class OParlPaper(models.Model):
 
     # Rohe OParl-Daten
     raw_json = models.JSONField(default=dict, blank=True)
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        null=True,
+        help_text="SHA-256 der kanonisierten OParl-Daten (Änderungserkennung beim Sync)",
+    )
 
     # KI-generierte Felder
     summary = models.TextField(blank=True, null=True)
@@ -337,6 +428,8 @@ class OParlPaper(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = OParlManager()
+
     class Meta:
         db_table = "oparl_papers"
         verbose_name = "Vorgang"
@@ -369,11 +462,19 @@ class OParlAgendaItem(models.Model):
 
     # Rohe OParl-Daten
     raw_json = models.JSONField(default=dict, blank=True)
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        null=True,
+        help_text="SHA-256 der kanonisierten OParl-Daten (Änderungserkennung beim Sync)",
+    )
 
     # Zeitstempel
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = OParlManager()
+
     class Meta:
         db_table = "oparl_agenda_items"
         verbose_name = "Tagesordnungspunkt"
@@ -474,11 +575,21 @@ class OParlFile(models.Model):
 
     # Rohe OParl-Daten
     raw_json = models.JSONField(default=dict, blank=True)
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        null=True,
+        help_text="SHA-256 der kanonisierten OParl-Daten (Änderungserkennung beim Sync)",
+    )
 
     # Zeitstempel
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Rohdaten und extrahierter Text nur auf Anfrage laden (siehe OParlManager)
+    DEFERRED_FIELDS = ("raw_json", "text_content")
+    objects = OParlManager()
+
     class Meta:
         db_table = "oparl_files"
         verbose_name = "Datei"
@@ -519,11 +630,19 @@ class OParlMembership(models.Model):
 
     # Rohe OParl-Daten
     raw_json = models.JSONField(default=dict, blank=True)
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        null=True,
+        help_text="SHA-256 der kanonisierten OParl-Daten (Änderungserkennung beim Sync)",
+    )
 
     # Zeitstempel
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = OParlManager()
+
     class Meta:
         db_table = "oparl_memberships"
         verbose_name = "Mitgliedschaft"
@@ -566,11 +685,19 @@ class OParlLocation(models.Model):
 
     # Rohe OParl-Daten
     raw_json = models.JSONField(default=dict, blank=True)
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        null=True,
+        help_text="SHA-256 der kanonisierten OParl-Daten (Änderungserkennung beim Sync)",
+    )
 
     # Zeitstempel
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = OParlManager()
+
     class Meta:
         db_table = "oparl_locations"
         verbose_name = "Ort"
@@ -602,11 +729,19 @@ class OParlConsultation(models.Model):
 
     # Rohe OParl-Daten
     raw_json = models.JSONField(default=dict, blank=True)
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        null=True,
+        help_text="SHA-256 der kanonisierten OParl-Daten (Änderungserkennung beim Sync)",
+    )
 
     # Zeitstempel
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = OParlManager()
+
     class Meta:
         db_table = "oparl_consultations"
         verbose_name = "Beratung"
@@ -635,11 +770,19 @@ class OParlLegislativeTerm(models.Model):
 
     # Rohe OParl-Daten
     raw_json = models.JSONField(default=dict, blank=True)
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        null=True,
+        help_text="SHA-256 der kanonisierten OParl-Daten (Änderungserkennung beim Sync)",
+    )
 
     # Zeitstempel
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = OParlManager()
+
     class Meta:
         db_table = "oparl_legislative_terms"
         verbose_name = "Wahlperiode"
@@ -670,6 +813,206 @@ class OParlLegislativeTerm(models.Model):
         return False
 
 
+# =============================================================================
+# Statistiken pro Kommune (vom Ingestor vorberechnet)
+# =============================================================================
+
+
+class BodyStatistics(models.Model):
+    """
+    Vorberechnete Kennzahlen einer Kommune.
+
+    Der Ingestor berechnet die Zeile nach jedem Sync der Kommune neu
+    (storage.refresh_body_statistics), Startseiten und Dashboards lesen
+    sie statt die oparl_*-Tabellen bei jedem Aufruf zu zählen. Lesende
+    Requests rechnen nie selbst: fehlende Zeilen zählen als 0, veraltete
+    (älter als MAX_AGE) erneuert der Command refresh_body_statistics.
+
+    papers_this_year zählt Vorgänge mit Datum im laufenden Kalenderjahr
+    (UTC), hier wie im Ingestor.
+    """
+
+    # Zähler-Felder (für Summen über alle Kommunen)
+    COUNTER_FIELDS = (
+        "papers_total",
+        "papers_this_year",
+        "meetings_total",
+        "meetings_upcoming",
+        "organizations_total",
+        "organizations_active",
+        "persons_total",
+        "files_total",
+        "files_with_text",
+        "agenda_items_total",
+        "memberships_total",
+        "locations_total",
+        "consultations_total",
+    )
+
+    # Zeitabhängige Werte (anstehende Sitzungen) veralten ohne Sync
+    MAX_AGE = timedelta(hours=6)
+
+    body = models.OneToOneField(OParlBody, on_delete=models.CASCADE, primary_key=True, related_name="statistics")
+
+    papers_total = models.IntegerField(default=0)
+    papers_this_year = models.IntegerField(default=0)
+    meetings_total = models.IntegerField(default=0)
+    meetings_upcoming = models.IntegerField(default=0)
+    organizations_total = models.IntegerField(default=0)
+    organizations_active = models.IntegerField(default=0)
+    persons_total = models.IntegerField(default=0)
+    files_total = models.IntegerField(default=0)
+    files_with_text = models.IntegerField(default=0)
+    agenda_items_total = models.IntegerField(default=0)
+    memberships_total = models.IntegerField(default=0)
+    locations_total = models.IntegerField(default=0)
+    consultations_total = models.IntegerField(default=0)
+
+    # {"papers": {"2026-01": 12, ...}, "meetings": {...}} für die letzten 12 Monate
+    monthly = models.JSONField(default=dict, blank=True)
+
+    # Jahr von papers_this_year
+    year = models.IntegerField()
+    computed_at = models.DateTimeField()
+
+    class Meta:
+        db_table = "oparl_body_statistics"
+        verbose_name = "Kommunen-Statistik"
+        verbose_name_plural = "Kommunen-Statistiken"
+
+    def __str__(self):
+        return f"Statistik {self.body_id}"
+
+    @property
+    def is_stale(self):
+        """Prüft ob die Werte neu berechnet werden sollten."""
+        now = timezone.now()
+        return self.year != now.year or self.computed_at < now - self.MAX_AGE
+
+    @classmethod
+    def for_body(cls, body):
+        """Gibt die Statistik einer Kommune zurück (ohne Zeile: alle Werte 0)."""
+        try:
+            # Nutzt select_related("statistics"), falls geladen
+            return body.statistics
+        except cls.DoesNotExist:
+            now = timezone.now()
+            return cls(body=body, year=now.year, computed_at=now)
+
+    @classmethod
+    def totals(cls):
+        """
+        Summen über alle Kommunen.
+
+        Returns:
+            Dict mit den COUNTER_FIELDS und monthly (zusammengeführte Monatsreihen)
+        """
+        totals = {field: 0 for field in cls.COUNTER_FIELDS}
+        monthly: dict[str, dict[str, int]] = {"papers": {}, "meetings": {}}
+        for row in cls.objects.values(*cls.COUNTER_FIELDS, "monthly"):
+            for field in cls.COUNTER_FIELDS:
+                totals[field] += row[field]
+            for series, months in (row["monthly"] or {}).items():
+                for month, count in months.items():
+                    monthly.setdefault(series, {})
+                    monthly[series][month] = monthly[series].get(month, 0) + count
+        totals["monthly"] = monthly
+        return totals
+
+    @classmethod
+    def refresh(cls, body):
+        """
+        Berechnet die Statistik einer Kommune mit dem ORM neu.
+
+        Für den Command refresh_body_statistics (Kommunen, die der Ingestor
+        nicht oder lange nicht aktualisiert hat) - dieselben Werte wie
+        storage.refresh_body_statistics.
+        """
+        from django.db.models import Count, Q
+        from django.db.models.functions import TruncMonth
+
+        now = timezone.now()
+        today = now.date()
+        year_start = datetime(now.year, 1, 1, tzinfo=UTC)
+        papers = OParlPaper.objects.filter(body=body).aggregate(
+            total=Count("id"),
+            this_year=Count("id", filter=Q(date__gte=year_start, date__lt=year_start.replace(year=now.year + 1))),
+        )
+        meetings = OParlMeeting.objects.filter(body=body).aggregate(
+            total=Count("id"), upcoming=Count("id", filter=Q(start__gt=now) & ~Q(cancelled=True))
+        )
+        organizations = OParlOrganization.objects.filter(body=body).aggregate(
+            total=Count("id"),
+            active=Count("id", filter=Q(end_date__isnull=True) | Q(end_date__gte=today)),
+        )
+        files = OParlFile.objects.filter(body=body).aggregate(
+            total=Count("id"),
+            with_text=Count("id", filter=Q(text_content__isnull=False) & ~Q(text_content="")),
+        )
+
+        months_start = today.replace(year=today.year - 1, day=1)
+        monthly = {}
+        for series, model, field in (("papers", OParlPaper, "date"), ("meetings", OParlMeeting, "start")):
+            rows = (
+                model.objects.filter(body=body, **{f"{field}__gte": months_start, f"{field}__lte": now})
+                .annotate(month=TruncMonth(field))
+                .values("month")
+                .annotate(count=Count("id"))
+                .order_by()
+            )
+            monthly[series] = {row["month"].strftime("%Y-%m"): row["count"] for row in rows if row["month"]}
+
+        statistics, _ = cls.objects.update_or_create(
+            body=body,
+            defaults={
+                "papers_total": papers["total"],
+                "papers_this_year": papers["this_year"],
+                "meetings_total": meetings["total"],
+                "meetings_upcoming": meetings["upcoming"],
+                "organizations_total": organizations["total"],
+                "organizations_active": organizations["active"],
+                "persons_total": OParlPerson.objects.filter(body=body).count(),
+                "files_total": files["total"],
+                "files_with_text": files["with_text"],
+                "agenda_items_total": OParlAgendaItem.objects.filter(meeting__body=body).count(),
+                "memberships_total": OParlMembership.objects.filter(body=body).count(),
+                "locations_total": OParlLocation.objects.filter(body=body).count(),
+                "consultations_total": OParlConsultation.objects.filter(body=body).count(),
+                "monthly": monthly,
+                "year": now.year,
+                "computed_at": now,
+            },
+        )
+        return statistics
+
+    def monthly_series(self, months: int = 12):
+        """Lückenlose Monatsreihen dieser Kommune."""
+        return monthly_series(self.monthly, months)
+
+
+def monthly_series(monthly: dict, months: int = 12) -> list[dict]:
+    """
+    Lückenlose Monatsreihen aus BodyStatistics.monthly.
+
+    Returns:
+        Liste von {"month": date, "papers": int, "meetings": int}, älteste zuerst
+    """
+    monthly = monthly or {}
+    today = timezone.now().date()
+    series = []
+    for offset in range(months - 1, -1, -1):
+        year, month = divmod(today.year * 12 + today.month - 1 - offset, 12)
+        key = f"{year:04d}-{month + 1:02d}"
+        series.append(
+            {
+                "month": date(year, month + 1, 1),
+                "papers": monthly.get("papers", {}).get(key, 0),
+                "meetings": monthly.get("meetings", {}).get(key, 0),
+            }
+        )
+    return series
+
+
 # =============================================================================
 # Location Mapping (für Koordinaten-Zuordnung)
 # =============================================================================
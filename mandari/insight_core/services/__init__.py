@@ -10,14 +10,18 @@ from .document_extraction import (
     download_and_extract,
     extract_text_from_file,
 )
+from .search_cache import SearchResultCache, search_cache
+from .search_indexing import INDEX_SPECS, index_entities, iter_document_batches, load_documents
 from .search_service import (
     INDEX_FILES,
     INDEX_MEETINGS,
     INDEX_ORGANIZATIONS,
     INDEX_PAPERS,
     INDEX_PERSONS,
+    INDEX_SUGGESTIONS,
     MeilisearchService,
     format_search_result,
+    format_suggestion,
     get_search_service,
 )
 
@@ -31,9 +35,19 @@ __all__ = [
     "MeilisearchService",
     "get_search_service",
     "format_search_result",
+    "format_suggestion",
     "INDEX_MEETINGS",
     "INDEX_PAPERS",
     "INDEX_PERSONS",
     "INDEX_ORGANIZATIONS",
     "INDEX_FILES",
+    "INDEX_SUGGESTIONS",
+    # Search result cache
+    "SearchResultCache",
+    "search_cache",
+    # Bulk indexing
+    "INDEX_SPECS",
+    "index_entities",
+    "iter_document_batches",
+    "load_documents",
 ]
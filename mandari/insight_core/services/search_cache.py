@@ -0,0 +1,203 @@
+"""
+Ergebnis-Cache für die Meilisearch-Suche.
+
+Die HTMX-Suche schickt bei jedem Tastendruck eine Anfrage, und viele
+Bürger:innen einer Kommune suchen nach denselben Begriffen. Ergebnisse
+werden daher kurz im Django-Cache (Redis in Produktion) gehalten.
+
+- Schlüssel: normalisierte Suchanfrage, body_id, Index-Auswahl, Seite
+- Kurze TTL (SEARCH_CACHE_TTL, Standard 60 Sekunden)
+- Unvollständige Ergebnisse (ein Index nicht erreichbar) werden nicht gecacht
+- Invalidierung pro Kommune über Generationszähler: indexiert der Indexer
+  Dokumente einer Kommune, zählt deren Generation hoch und alte Einträge
+  werden nicht mehr gefunden (und laufen per TTL aus)
+- Treffer/Fehlschläge werden im Cache gezählt (über alle Worker hinweg)
+
+Verwendung:
+    from insight_core.services.search_cache import search_cache
+
+    result = search_cache.get_or_search(
+        lambda: service.search_all(query, body_id, page, page_size, index_names, use_cache=False),
+        query, body_id, index_names, page, page_size,
+    )
+    search_cache.invalidate_bodies(["<body-uuid>"])
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "search"
+
+# Generation aller Einträge (reindex_search, Löschungen)
+SCOPE_GLOBAL = "global"
+
+# Generation der Suchen ohne Kommunen-Filter: ändert sich mit jeder Kommune
+SCOPE_ANY_BODY = "any"
+
+
+def normalize_query(query: str) -> str:
+    """Normalisiert eine Suchanfrage (Groß-/Kleinschreibung, Leerzeichen)."""
+    return " ".join(query.lower().split())
+
+
+class SearchResultCache:
+    """Cache für search_all-Ergebnisse mit Invalidierung pro Kommune."""
+
+    def __init__(self, ttl: int | None = None):
+        """
+        Initialisiert den Cache.
+
+        Args:
+            ttl: Lebensdauer der Einträge in Sekunden (Standard: SEARCH_CACHE_TTL, 0 = aus)
+        """
+        self.ttl = ttl if ttl is not None else getattr(settings, "SEARCH_CACHE_TTL", 60)
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    # =========================================================================
+    # Lookup
+    # =========================================================================
+
+    def get_or_search(
+        self,
+        search: Callable[[], dict[str, Any]],
+        query: str,
+        body_id: str | None,
+        index_names: Iterable[str],
+        page: int,
+        page_size: int,
+    ) -> dict[str, Any]:
+        """
+        Gibt das gecachte Ergebnis zurück oder führt die Suche aus.
+
+        Args:
+            search: Führt die Suche aus (bei Cache-Fehlschlag)
+            query, body_id, index_names, page, page_size: Parameter der Suche
+
+        Returns:
+            Ergebnis wie MeilisearchService.search_all; Ergebnisse mit
+            incomplete=True werden nicht gecacht
+        """
+        if not self.enabled:
+            return search()
+
+        try:
+            key = self._key(query, body_id, index_names, page, page_size)
+            cached = cache.get(key)
+        except Exception as e:
+            logger.warning(f"Such-Cache nicht verfügbar: {e}")
+            return search()
+
+        if cached is not None:
+            self._count("hits")
+            return cached
+
+        self._count("misses")
+        result = search()
+        if result.get("incomplete"):
+            # Teilergebnis während eines Meilisearch-Ausfalls nicht für die ganze TTL festhalten
+            return result
+        try:
+            cache.set(key, result, self.ttl)
+        except Exception as e:
+            logger.warning(f"Such-Cache konnte nicht geschrieben werden: {e}")
+        return result
+
+    def _key(
+        self,
+        query: str,
+        body_id: str | None,
+        index_names: Iterable[str],
+        page: int,
+        page_size: int,
+    ) -> str:
+        """Cache-Schlüssel inkl. der aktuellen Generationen."""
+        scope = str(body_id) if body_id else SCOPE_ANY_BODY
+        generations = cache.get_many([self._generation_key(SCOPE_GLOBAL), self._generation_key(scope)])
+        params = json.dumps(
+            [normalize_query(query), scope, sorted(index_names), page, page_size],
+            ensure_ascii=False,
+        )
+        digest = hashlib.sha256(params.encode()).hexdigest()[:32]
+        return (
+            f"{KEY_PREFIX}:result:"
+            f"{generations.get(self._generation_key(SCOPE_GLOBAL), 0)}."
+            f"{generations.get(self._generation_key(scope), 0)}:{digest}"
+        )
+
+    # =========================================================================
+    # Invalidierung
+    # =========================================================================
+
+    def invalidate_bodies(self, body_ids: Iterable[str | None]) -> None:
+        """Verwirft die Ergebnisse der Kommunen (und aller Suchen ohne Filter)."""
+        scopes = {str(body_id) for body_id in body_ids if body_id}
+        if not scopes:
+            return
+        for scope in (*scopes, SCOPE_ANY_BODY):
+            self._bump(scope)
+
+    def invalidate_all(self) -> None:
+        """Verwirft alle gecachten Ergebnisse."""
+        self._bump(SCOPE_GLOBAL)
+
+    def _generation_key(self, scope: str) -> str:
+        return f"{KEY_PREFIX}:generation:{scope}"
+
+    def _bump(self, scope: str) -> None:
+        key = self._generation_key(scope)
+        try:
+            try:
+                cache.incr(key)
+            except ValueError:
+                # Noch keine Generation gespeichert
+                cache.set(key, 1, None)
+        except Exception as e:
+            logger.warning(f"Such-Cache konnte nicht invalidiert werden: {e}")
+
+    # =========================================================================
+    # Statistiken
+    # =========================================================================
+
+    def _count(self, name: str) -> None:
+        key = f"{KEY_PREFIX}:stats:{name}"
+        try:
+            try:
+                cache.incr(key)
+            except ValueError:
+                cache.set(key, 1, None)
+        except Exception:
+            pass  # Statistik ist nicht kritisch
+
+    def get_stats(self) -> dict[str, Any]:
+        """Gibt Treffer, Fehlschläge und Trefferquote zurück."""
+        try:
+            counts = cache.get_many([f"{KEY_PREFIX}:stats:hits", f"{KEY_PREFIX}:stats:misses"])
+        except Exception as e:
+            return {"error": str(e)}
+        hits = counts.get(f"{KEY_PREFIX}:stats:hits", 0)
+        misses = counts.get(f"{KEY_PREFIX}:stats:misses", 0)
+        total = hits + misses
+        return {
+            "enabled": self.enabled,
+            "ttl": self.ttl,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / total, 3) if total else 0.0,
+        }
+
+
+# Gemeinsame Instanz
+search_cache = SearchResultCache()
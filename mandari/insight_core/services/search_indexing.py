@@ -0,0 +1,264 @@
+"""
+Bulk-Indexierung von OParl-Entitäten in Meilisearch.
+
+Lädt eine Menge von Entitäten eines Typs mit wenigen Queries
+(select_related/prefetch_related statt Lazy-Loading pro Objekt) und
+schreibt sie mit einem add_documents-Aufruf pro Index und Batch.
+
+Die Dokumente werden mit denselben Konvertern erzeugt wie bei der
+Signal-basierten Indexierung (insight_core.signals), damit alle Wege
+identische Dokumente liefern.
+
+Verwendung:
+    from insight_core.services.search_indexing import index_entities
+
+    index_entities("paper", ["<uuid>", "https://oparl.example.org/paper/1"])
+"""
+
+from __future__ import annotations
+
+import logging
+import uuid
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+from django.db import models
+from django.db.models import Prefetch
+
+from ..models import OParlFile, OParlMeeting, OParlOrganization, OParlPaper, OParlPerson
+from ..signals import (
+    _file_to_doc,
+    _get_meilisearch_client,
+    _meeting_to_doc,
+    _organization_to_doc,
+    _paper_to_doc,
+    _person_to_doc,
+)
+from .search_cache import search_cache
+from .search_service import (
+    INDEX_FILES,
+    INDEX_MEETINGS,
+    INDEX_ORGANIZATIONS,
+    INDEX_PAPERS,
+    INDEX_PERSONS,
+    INDEX_SUGGESTIONS,
+    SUGGESTION_ATTRIBUTES,
+)
+
+logger = logging.getLogger(__name__)
+
+# IDs pro IN (...)-Query
+LOOKUP_CHUNK_SIZE = 1000
+
+# Dokumente pro add_documents-Aufruf
+DOCUMENT_BATCH_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class IndexSpec:
+    """Beschreibt, wie ein Entitätstyp geladen und indexiert wird."""
+
+    model: type[models.Model]
+    index_name: str
+    to_doc: Callable[[Any], dict[str, Any]]
+    select_related: tuple[str, ...] = ()
+    prefetch_related: tuple[str | Prefetch, ...] = ()
+    # Spalten, die der Konverter liest (leer = alle)
+    fields: tuple[str, ...] = ()
+
+    def queryset(self) -> models.QuerySet:
+        """QuerySet mit allen Relationen und Spalten, die der Konverter braucht."""
+        queryset = self.model.objects.all()
+        if self.fields:
+            queryset = queryset.only(*self.fields)
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+        if self.prefetch_related:
+            queryset = queryset.prefetch_related(*self.prefetch_related)
+        if self.model is OParlFile:
+            # Dateien werden nur mit extrahiertem Text indexiert (wie index_file)
+            queryset = queryset.exclude(text_content__isnull=True).exclude(text_content="")
+        return queryset
+
+
+# Entitätstyp (wie in den Ingestor-Events) -> Index-Konfiguration
+INDEX_SPECS: dict[str, IndexSpec] = {
+    "paper": IndexSpec(
+        OParlPaper,
+        INDEX_PAPERS,
+        _paper_to_doc,
+        fields=("id", "body_id", "name", "reference", "paper_type", "date", "oparl_created", "oparl_modified"),
+    ),
+    "meeting": IndexSpec(
+        OParlMeeting,
+        INDEX_MEETINGS,
+        _meeting_to_doc,
+        prefetch_related=(Prefetch("organizations", queryset=OParlOrganization.objects.only("id", "name")),),
+        fields=("id", "body_id", "name", "location_name", "start", "end", "cancelled", "oparl_modified"),
+    ),
+    "person": IndexSpec(
+        OParlPerson,
+        INDEX_PERSONS,
+        _person_to_doc,
+        fields=("id", "body_id", "name", "given_name", "family_name", "title", "oparl_modified"),
+    ),
+    "organization": IndexSpec(
+        OParlOrganization,
+        INDEX_ORGANIZATIONS,
+        _organization_to_doc,
+        fields=(
+            "id",
+            "body_id",
+            "name",
+            "short_name",
+            "organization_type",
+            "classification",
+            "oparl_modified",
+        ),
+    ),
+    "file": IndexSpec(
+        OParlFile,
+        INDEX_FILES,
+        _file_to_doc,
+        select_related=("paper",),
+        fields=(
+            "id",
+            "body_id",
+            "name",
+            "file_name",
+            "mime_type",
+            "text_content",
+            "paper_id",
+            "meeting_id",
+            "oparl_modified",
+            "paper__name",
+            "paper__reference",
+        ),
+    ),
+}
+
+
+# Entitätstypen im Vorschlags-Index (Autocomplete)
+SUGGESTION_TYPES = ("paper", "meeting", "person", "organization")
+
+
+def to_suggestion(doc: dict[str, Any]) -> dict[str, Any]:
+    """Reduziert ein Dokument auf einen Eintrag des Vorschlags-Index."""
+    suggestion = {
+        # IDs der Typen können sich nicht überschneiden, Präfix nur zur Eindeutigkeit im Index
+        "id": f"{doc['type']}-{doc['id']}",
+        "body_id": doc.get("body_id"),
+    }
+    for attribute in SUGGESTION_ATTRIBUTES:
+        if attribute == "entity_id":
+            suggestion["entity_id"] = doc["id"]
+        elif doc.get(attribute):
+            suggestion[attribute] = doc[attribute]
+    return suggestion
+
+
+def _split_ids(ids: Iterable[str]) -> tuple[list[str], list[str]]:
+    """Trennt interne UUIDs von OParl-IDs (URLs)."""
+    uuids: list[str] = []
+    external_ids: list[str] = []
+    for entity_id in dict.fromkeys(ids):
+        try:
+            uuids.append(str(uuid.UUID(entity_id)))
+        except (ValueError, TypeError, AttributeError):
+            external_ids.append(entity_id)
+    return uuids, external_ids
+
+
+def load_documents(entity_type: str, ids: Iterable[str]) -> list[dict[str, Any]]:
+    """
+    Lädt Entitäten und konvertiert sie zu Meilisearch-Dokumenten.
+
+    Args:
+        entity_type: Typ wie in INDEX_SPECS (paper, meeting, person, organization, file)
+        ids: Interne UUIDs und/oder OParl-IDs, gemischt möglich
+
+    Returns:
+        Dokumente der gefundenen Entitäten (nicht existierende IDs werden ignoriert)
+    """
+    spec = INDEX_SPECS[entity_type]
+    uuids, external_ids = _split_ids(ids)
+
+    documents: list[dict[str, Any]] = []
+    for field, values in (("id__in", uuids), ("external_id__in", external_ids)):
+        for start in range(0, len(values), LOOKUP_CHUNK_SIZE):
+            chunk = values[start : start + LOOKUP_CHUNK_SIZE]
+            for obj in spec.queryset().filter(**{field: chunk}):
+                documents.append(spec.to_doc(obj))
+    return documents
+
+
+def iter_document_batches(
+    entity_type: str,
+    queryset: models.QuerySet | None = None,
+    batch_size: int = DOCUMENT_BATCH_SIZE,
+) -> Iterator[list[dict[str, Any]]]:
+    """
+    Streamt Dokumente eines Typs in Batches.
+
+    Liest die Zeilen mit iterator() (serverseitiger Cursor unter PostgreSQL),
+    es liegt also nie die ganze Tabelle im Speicher.
+
+    Args:
+        entity_type: Typ wie in INDEX_SPECS
+        queryset: Gefiltertes spec.queryset() (Standard: alle Entitäten)
+        batch_size: Dokumente pro Batch
+    """
+    spec = INDEX_SPECS[entity_type]
+    if queryset is None:
+        queryset = spec.queryset()
+
+    batch: list[dict[str, Any]] = []
+    # Ohne Sortierung: Meta.ordering würde die ganze Tabelle sortieren
+    for obj in queryset.order_by().iterator(chunk_size=batch_size):
+        batch.append(spec.to_doc(obj))
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def index_entities(entity_type: str, ids: Iterable[str], client=None) -> int:
+    """
+    Indexiert Entitäten eines Typs gebündelt in Meilisearch.
+
+    Args:
+        entity_type: Typ wie in INDEX_SPECS
+        ids: Interne UUIDs und/oder OParl-IDs
+        client: Meilisearch-Client (Standard: aus den Settings)
+
+    Returns:
+        Anzahl der an Meilisearch übergebenen Dokumente
+
+    Raises:
+        Exception: Fehler von Meilisearch werden weitergereicht, damit der
+            Aufrufer die IDs erneut versuchen kann
+    """
+    documents = load_documents(entity_type, ids)
+    if not documents:
+        return 0
+
+    client = client or _get_meilisearch_client()
+    if not client:
+        return 0
+
+    index = client.index(INDEX_SPECS[entity_type].index_name)
+    for start in range(0, len(documents), DOCUMENT_BATCH_SIZE):
+        index.add_documents(documents[start : start + DOCUMENT_BATCH_SIZE], primary_key="id")
+
+    if entity_type in SUGGESTION_TYPES:
+        suggestions = [to_suggestion(doc) for doc in documents]
+        suggestion_index = client.index(INDEX_SUGGESTIONS)
+        for start in range(0, len(suggestions), DOCUMENT_BATCH_SIZE):
+            suggestion_index.add_documents(suggestions[start : start + DOCUMENT_BATCH_SIZE], primary_key="id")
+
+    # Gecachte Suchergebnisse der betroffenen Kommunen verwerfen
+    search_cache.invalidate_bodies({doc.get("body_id") for doc in documents})
+    logger.debug(f"{len(documents)} Dokumente indexiert: {INDEX_SPECS[entity_type].index_name}")
+    return len(documents)
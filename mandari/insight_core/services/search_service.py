@@ -11,6 +11,8 @@ import meilisearch
 from django.conf import settings
 from meilisearch.errors import MeilisearchApiError
 
+from .search_cache import search_cache
+
 logger = logging.getLogger(__name__)
 
 # Index names (müssen mit apps/api/src/search/service.py übereinstimmen)
@@ -22,6 +24,21 @@ INDEX_FILES = "files"
 
 ALL_INDEXES = [INDEX_MEETINGS, INDEX_PAPERS, INDEX_PERSONS, INDEX_ORGANIZATIONS, INDEX_FILES]
 
+# Kleiner Index für Suchvorschläge beim Tippen (nur Titel und Aktenzeichen)
+INDEX_SUGGESTIONS = "suggestions"
+
+# Felder eines Vorschlags, die an den Client gehen
+SUGGESTION_ATTRIBUTES = [
+    "entity_id",
+    "type",
+    "name",
+    "reference",
+    "short_name",
+    "paper_type",
+    "organization_type",
+    "start",
+]
+
 
 class MeilisearchService:
     """Service für Meilisearch-Integration in Django."""
@@ -32,6 +49,9 @@ class MeilisearchService:
             settings.MEILISEARCH_URL,
             settings.MEILISEARCH_KEY,
         )
+        # Fähigkeiten des Servers (None = noch nicht bekannt)
+        self._federation_supported: bool | None = None
+        self._multi_search_supported: bool | None = None
 
     def is_healthy(self) -> bool:
         """Prüft ob Meilisearch verfügbar ist."""
@@ -49,81 +69,222 @@ class MeilisearchService:
         page: int = 1,
         page_size: int = 20,
         index_names: list[str] | None = None,
+        use_cache: bool = True,
     ) -> dict[str, Any]:
         """
         Multi-Index-Suche über alle Entitäten.
 
+        Alle Indexe werden mit einem Request abgefragt: bevorzugt als
+        föderierte Suche (Meilisearch >= 1.10, ein gemeinsames Ranking mit
+        globalem offset/limit), sonst per multi_search mit Merge nach
+        Ranking-Score. Server ohne multi_search werden nacheinander
+        abgefragt.
+
         Args:
             query: Suchbegriff
             body_id: Filter nach Kommune (UUID als String)
             page: Seitennummer (1-indiziert)
             page_size: Ergebnisse pro Seite
             index_names: Zu durchsuchende Indexe (Standard: alle)
+            use_cache: Ergebnis aus dem Such-Cache verwenden (siehe search_cache)
 
         Returns:
-            Dict mit results, total, page, page_size, pages
+            Dict mit results, total, page, page_size, pages und incomplete
+            (mindestens ein Index hat nicht geantwortet; wird nicht gecacht)
         """
         if index_names is None:
             index_names = ALL_INDEXES
 
-        all_results: list[dict[str, Any]] = []
-        total_hits = 0
+        page = max(page, 1)
+        if use_cache:
+            return search_cache.get_or_search(
+                lambda: self.search_all(query, body_id, page, page_size, index_names, use_cache=False),
+                query,
+                body_id,
+                index_names,
+                page,
+                page_size,
+            )
+
+        offset = (page - 1) * page_size
 
         # Filter aufbauen
         filter_str = None
         if body_id:
             filter_str = f"body_id = '{body_id}'"
 
-        # Jeden Index durchsuchen
-        for index_name in index_names:
-            try:
-                index = self.client.index(index_name)
-                search_params: dict[str, Any] = {
-                    "limit": page_size * 2,  # Mehr laden für Merge
-                    "offset": 0,
-                    "showRankingScore": True,
-                    # Highlighting für bessere Suchergebnisse
-                    "attributesToHighlight": ["name", "text_content", "reference"],
-                    "highlightPreTag": '<mark class="bg-yellow-200 dark:bg-yellow-800">',
-                    "highlightPostTag": "</mark>",
-                    "attributesToCrop": ["text_content"],
-                    "cropLength": 200,
-                }
-                if filter_str:
-                    search_params["filter"] = filter_str
+        result = None
+        if self._federation_supported is not False:
+            result = self._federated_search(query, index_names, filter_str, offset, page_size)
+        if result is None and self._multi_search_supported is not False:
+            result = self._multi_search(query, index_names, filter_str, offset, page_size)
+        complete = True
+        if result is None:
+            *result, complete = self._sequential_search(query, index_names, filter_str, offset, page_size)
+
+        hits, total_hits = result
+        return {
+            "results": hits,
+            "total": total_hits,
+            "page": page,
+            "page_size": page_size,
+            "pages": (total_hits + page_size - 1) // page_size if total_hits > 0 else 0,
+            "incomplete": not complete,
+        }
 
-                result = index.search(query, search_params)
+    def _search_params(self, filter_str: str | None) -> dict[str, Any]:
+        """Gemeinsame Suchparameter der Multi-Index-Suche (ohne Pagination)."""
+        search_params: dict[str, Any] = {
+            "showRankingScore": True,
+            # Highlighting für bessere Suchergebnisse
+            "attributesToHighlight": ["name", "text_content", "reference"],
+            "highlightPreTag": '<mark class="bg-yellow-200 dark:bg-yellow-800">',
+            "highlightPostTag": "</mark>",
+            "attributesToCrop": ["text_content"],
+            "cropLength": 200,
+        }
+        if filter_str:
+            search_params["filter"] = filter_str
+        return search_params
 
-                # Typ zu jedem Treffer hinzufügen
-                for hit in result.get("hits", []):
-                    # Singularform für Type (meetings -> meeting)
-                    hit["_index"] = index_name
-                    if "type" not in hit:
-                        hit["type"] = index_name.rstrip("s")
-                    all_results.append(hit)
+    def _queries(
+        self,
+        query: str,
+        index_names: list[str],
+        filter_str: str | None,
+        **pagination: int,
+    ) -> list[dict[str, Any]]:
+        """Eine multi_search-Query pro Index."""
+        return [
+            {"indexUid": index_name, "q": query, **self._search_params(filter_str), **pagination}
+            for index_name in index_names
+        ]
+
+    @staticmethod
+    def _is_unsupported(error: MeilisearchApiError) -> bool:
+        """Prüft ob der Server die Anfrageform nicht kennt (statt z.B. eines ungültigen Filters)."""
+        return getattr(error, "status_code", None) == 404 or getattr(error, "code", None) == "bad_request"
+
+    def _federated_search(
+        self,
+        query: str,
+        index_names: list[str],
+        filter_str: str | None,
+        offset: int,
+        limit: int,
+    ) -> tuple[list[dict[str, Any]], int] | None:
+        """Föderierte Suche: ein Ranking über alle Indexe, Pagination durch den Server."""
+        try:
+            result = self.client.multi_search(
+                self._queries(query, index_names, filter_str),
+                federation={"offset": offset, "limit": limit},
+            )
+        except TypeError:
+            # Python-Client ohne federation-Parameter
+            self._federation_supported = False
+            return None
+        except MeilisearchApiError as e:
+            if self._is_unsupported(e):
+                logger.info("Meilisearch unterstützt keine föderierte Suche, nutze multi_search")
+                self._federation_supported = False
+            else:
+                logger.warning(f"Föderierte Suche fehlgeschlagen: {e}")
+            return None
+        except Exception as e:
+            logger.warning(f"Föderierte Suche fehlgeschlagen: {e}")
+            return None
 
-                total_hits += result.get("estimatedTotalHits", 0)
+        self._federation_supported = True
+        hits = result.get("hits", [])
+        for hit in hits:
+            self._annotate_hit(hit, hit.get("_federation", {}).get("indexUid", ""))
+        return hits, result.get("estimatedTotalHits", result.get("totalHits", 0))
 
+    def _multi_search(
+        self,
+        query: str,
+        index_names: list[str],
+        filter_str: str | None,
+        offset: int,
+        limit: int,
+    ) -> tuple[list[dict[str, Any]], int] | None:
+        """Alle Indexe in einem Request, Merge nach Ranking-Score."""
+        try:
+            # Jeder Index liefert seine besten offset + limit Treffer, damit
+            # die globale Seite nach dem Merge vollständig ist
+            result = self.client.multi_search(
+                self._queries(query, index_names, filter_str, offset=0, limit=offset + limit)
+            )
+        except MeilisearchApiError as e:
+            if self._is_unsupported(e):
+                logger.info("Meilisearch unterstützt kein multi_search, suche sequentiell")
+                self._multi_search_supported = False
+            else:
+                logger.warning(f"multi_search fehlgeschlagen: {e}")
+            return None
+        except Exception as e:
+            logger.warning(f"multi_search fehlgeschlagen: {e}")
+            return None
+
+        self._multi_search_supported = True
+        results_by_index = {
+            index_result.get("indexUid", index_name): index_result
+            for index_name, index_result in zip(index_names, result.get("results", []))
+        }
+        return self._merge(results_by_index, offset, limit)
+
+    def _sequential_search(
+        self,
+        query: str,
+        index_names: list[str],
+        filter_str: str | None,
+        offset: int,
+        limit: int,
+    ) -> tuple[list[dict[str, Any]], int, bool]:
+        """
+        Fallback für ältere Server: ein Request pro Index.
+
+        Fehlgeschlagene Indexe fehlen im Ergebnis; der dritte Wert ist False,
+        wenn das passiert ist.
+        """
+        results_by_index: dict[str, dict[str, Any]] = {}
+        for index_name in index_names:
+            try:
+                search_params = {**self._search_params(filter_str), "offset": 0, "limit": offset + limit}
+                results_by_index[index_name] = self.client.index(index_name).search(query, search_params)
             except MeilisearchApiError as e:
                 logger.warning(f"Suche in Index '{index_name}' fehlgeschlagen: {e}")
             except Exception as e:
                 logger.error(f"Unerwarteter Fehler bei Index '{index_name}': {e}")
+        hits, total_hits = self._merge(results_by_index, offset, limit)
+        return hits, total_hits, len(results_by_index) == len(index_names)
+
+    def _merge(
+        self,
+        results_by_index: dict[str, dict[str, Any]],
+        offset: int,
+        limit: int,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """Führt die Treffer mehrerer Indexe nach Relevanz zusammen und paginiert global."""
+        all_results: list[dict[str, Any]] = []
+        total_hits = 0
+        for index_name, result in results_by_index.items():
+            for hit in result.get("hits", []):
+                self._annotate_hit(hit, index_name)
+                all_results.append(hit)
+            total_hits += result.get("estimatedTotalHits", 0)
 
         # Nach Relevanz sortieren
         all_results.sort(key=lambda x: x.get("_rankingScore", 0), reverse=True)
+        return all_results[offset : offset + limit], total_hits
 
-        # Paginieren
-        start = (page - 1) * page_size
-        end = start + page_size
-        paginated = all_results[start:end]
-
-        return {
-            "results": paginated,
-            "total": total_hits,
-            "page": page,
-            "page_size": page_size,
-            "pages": (total_hits + page_size - 1) // page_size if total_hits > 0 else 0,
-        }
+    @staticmethod
+    def _annotate_hit(hit: dict[str, Any], index_name: str) -> None:
+        """Ergänzt Index und Typ eines Treffers."""
+        hit["_index"] = index_name
+        if "type" not in hit:
+            # Singularform für Type (meetings -> meeting)
+            hit["type"] = index_name.rstrip("s")
 
     def search_papers(
         self,
@@ -340,6 +501,44 @@ class MeilisearchService:
                 "error": str(e),
             }
 
+    def suggest(
+        self,
+        query: str,
+        body_id: str | None = None,
+        limit: int = 8,
+    ) -> list[dict[str, Any]]:
+        """
+        Suchvorschläge beim Tippen aus dem Vorschlags-Index.
+
+        Ohne Highlighting und Cropping, nur die für die Anzeige nötigen
+        Felder - für Antwortzeiten im einstelligen Millisekundenbereich.
+
+        Args:
+            query: Bisher eingegebener Suchbegriff
+            body_id: Filter nach Kommune
+            limit: Maximale Anzahl Vorschläge
+
+        Returns:
+            Liste von Treffern (entity_id, type, name, ...)
+        """
+
+        def search() -> dict[str, Any]:
+            search_params: dict[str, Any] = {
+                "limit": limit,
+                "attributesToRetrieve": SUGGESTION_ATTRIBUTES,
+            }
+            if body_id:
+                search_params["filter"] = f"body_id = '{body_id}'"
+            result = self.client.index(INDEX_SUGGESTIONS).search(query, search_params)
+            return {"results": result.get("hits", [])}
+
+        # Fehler nicht cachen: leere Vorschläge nur für diese Anfrage
+        try:
+            return search_cache.get_or_search(search, query, body_id, [INDEX_SUGGESTIONS], 1, limit)["results"]
+        except Exception as e:
+            logger.warning(f"Suchvorschläge fehlgeschlagen: {e}")
+            return []
+
     def get_stats(self) -> dict[str, Any]:
         """Gibt Statistiken für alle Indexe zurück."""
         stats = {}
@@ -353,6 +552,7 @@ class MeilisearchService:
                 }
             except Exception as e:
                 stats[index_name] = {"error": str(e)}
+        stats["result_cache"] = search_cache.get_stats()
         return stats
 
 
@@ -450,3 +650,14 @@ def format_search_result(hit: dict[str, Any]) -> dict[str, Any]:
         "subtitle": None,
         "url": "#",
     }
+
+
+def format_suggestion(hit: dict[str, Any]) -> dict[str, Any]:
+    """
+    Formatiert einen Treffer aus dem Vorschlags-Index für die Anzeige.
+
+    Returns:
+        Dict mit type, title, subtitle, url (wie format_search_result)
+    """
+    # Vorschläge tragen die ID der Entität in entity_id
+    return format_search_result({**hit, "id": hit.get("entity_id")})
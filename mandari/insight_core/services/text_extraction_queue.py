@@ -104,7 +104,7 @@ class TextExtractionQueue:
             True wenn Extraktion sinnvoll
         """
         # Bereits extrahiert?
-        if file.text_content and file.text_extraction_status == "completed":
+        if file.text_extraction_status == "completed" and file.text_content:
             return False
 
         # MIME-Type unterstützt?
@@ -223,10 +223,14 @@ class TextExtractionQueue:
         Returns:
             Liste mit Ergebnissen
         """
-        # Ausstehende Dateien laden
-        qs = OParlFile.objects.filter(
-            text_extraction_status="pending",
-        ).exclude(Q(download_url__isnull=True) & Q(access_url__isnull=True))
+        # Ausstehende Dateien laden (mit text_content, das index_file beim Speichern liest)
+        qs = (
+            OParlFile.objects.with_deferred("text_content")
+            .filter(
+                text_extraction_status="pending",
+            )
+            .exclude(Q(download_url__isnull=True) & Q(access_url__isnull=True))
+        )
 
         if body_id:
             qs = qs.filter(body_id=body_id)
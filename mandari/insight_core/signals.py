@@ -2,14 +2,25 @@
 Django Signals für automatische Meilisearch-Indexierung.
 
 Aktualisiert die Suchindizes automatisch bei Änderungen an OParl-Modellen.
+
+Die Signals indexieren nicht sofort: sie merken sich die IDs geänderter
+Entitäten, und nach dem Commit der Transaktion wird ein einziger
+Hintergrund-Task (tasks.update_search_index) eingereiht - je Savepoint-Ebene
+mit Änderungen einer; nach einem Rollback keiner. Dieser lädt alle
+Zeilen gebündelt (select_related/prefetch_related) und schickt ein Update
+pro Index. Für Skripte ohne umschließende Transaktion bündelt
+bulk_indexing() die Änderungen eines ganzen Blocks.
 """
 
 from __future__ import annotations
 
 import logging
+import threading
+from contextlib import contextmanager
 from typing import Any
 
 from django.conf import settings
+from django.db import transaction
 from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
@@ -131,38 +142,149 @@ def _file_to_doc(file: OParlFile) -> dict[str, Any]:
     }
 
 
-def _index_document(index_name: str, doc_id: str, document: dict[str, Any]):
-    """Indexiert ein Dokument in Meilisearch."""
-    if not is_auto_indexing_enabled():
-        return
+# =============================================================================
+# Index-Puffer
+# =============================================================================
+
+
+class _IndexChanges:
+    """
+    Geänderte und gelöschte IDs pro Entitätstyp.
+
+    Aufrufbar als on_commit-Callback: reiht die Änderungen als ein
+    Hintergrund-Task ein.
+    """
+
+    def __init__(self):
+        self.upserts: dict[str, set[str]] = {}
+        self.deletes: dict[str, set[str]] = {}
+
+    def __bool__(self) -> bool:
+        return any(self.upserts.values()) or any(self.deletes.values())
+
+    def add(self, entity_type: str, doc_id: str, deleted: bool = False):
+        """Merkt eine Änderung vor; die letzte Änderung einer ID gilt."""
+        add_to, remove_from = (self.deletes, self.upserts) if deleted else (self.upserts, self.deletes)
+        add_to.setdefault(entity_type, set()).add(doc_id)
+        remove_from.get(entity_type, set()).discard(doc_id)
+
+    def update(self, other: _IndexChanges):
+        """Übernimmt die (späteren) Änderungen eines anderen Puffers."""
+        for entity_type, ids in other.upserts.items():
+            for doc_id in ids:
+                self.add(entity_type, doc_id)
+        for entity_type, ids in other.deletes.items():
+            for doc_id in ids:
+                self.add(entity_type, doc_id, deleted=True)
+
+    def __call__(self):
+        upserts = {entity_type: sorted(ids) for entity_type, ids in self.upserts.items() if ids}
+        deletes = {entity_type: sorted(ids) for entity_type, ids in self.deletes.items() if ids}
+        self.upserts, self.deletes = {}, {}
+        if not upserts and not deletes:
+            return
+
+        from .tasks import update_search_index
+
+        try:
+            update_search_index.enqueue(upserts=upserts, deletes=deletes)
+        except Exception as e:
+            logger.warning(f"Index-Task konnte nicht eingereiht werden, führe direkt aus: {e}")
+            try:
+                update_search_index.call(upserts=upserts, deletes=deletes)
+            except Exception as e:
+                logger.warning(f"Indexierung fehlgeschlagen: {e}")
+
+
+class _IndexBuffer(threading.local):
+    """Offene Änderungen je Thread: pro Savepoint-Ebene der Transaktion und in bulk_indexing()."""
+
+    def __init__(self):
+        self.pending: dict[tuple[str, ...], _IndexChanges] = {}
+        self.bulk: _IndexChanges | None = None
+        self.depth = 0
 
-    client = _get_meilisearch_client()
-    if not client:
+
+_buffer = _IndexBuffer()
+
+
+def _is_registered(connection, changes: _IndexChanges) -> bool:
+    """
+    Prüft ob der Puffer noch als on_commit-Callback der Transaktion aussteht.
+
+    Liest connection.run_on_commit, eine interne Liste von Django (Einträge
+    (savepoint_ids, func, robust), geprüft mit Django 6.0, siehe Pin in
+    pyproject.toml). Nur so ist erkennbar, dass eine Transaktion
+    zurückgerollt und der Callback verworfen wurde. Fehlt die Liste, gilt
+    kein Puffer als registriert: jede Änderung bekommt dann einen eigenen
+    Callback - korrekt, nur ohne Bündelung.
+    """
+    return any(hook[1] is changes for hook in getattr(connection, "run_on_commit", ()))
+
+
+def _schedule(changes: _IndexChanges):
+    """
+    Übergibt Änderungen an den Puffer der laufenden Transaktion.
+
+    Pro Transaktion (bzw. Savepoint-Ebene) wird ein einziger Puffer als
+    on_commit-Callback registriert. Bei einem Rollback verwirft Django den
+    Callback und damit die gepufferten IDs - ein zurückgerolltes Löschen
+    entfernt keine Dokumente aus dem Index. Ohne Transaktion wird sofort
+    eingereiht.
+    """
+    connection = transaction.get_connection()
+    if not connection.in_atomic_block:
+        changes()
         return
 
-    try:
-        index = client.index(index_name)
-        index.add_documents([document], primary_key="id")
-        logger.debug(f"Dokument indexiert: {index_name}/{doc_id}")
-    except Exception as e:
-        logger.warning(f"Indexierung fehlgeschlagen für {index_name}/{doc_id}: {e}")
+    key = tuple(connection.savepoint_ids)
+    pending = _buffer.pending.get(key)
+    if pending is None or not _is_registered(connection, pending):
+        # Puffer committeter oder zurückgerollter Transaktionen verwerfen
+        _buffer.pending = {
+            sids: buffered for sids, buffered in _buffer.pending.items() if _is_registered(connection, buffered)
+        }
+        pending = _buffer.pending[key] = _IndexChanges()
+        transaction.on_commit(pending, robust=True)
+    pending.update(changes)
 
 
-def _delete_document(index_name: str, doc_id: str):
-    """Löscht ein Dokument aus Meilisearch."""
+def _mark_dirty(entity_type: str, doc_id: str, deleted: bool = False):
+    """Merkt eine Entität für die Indexierung nach dem Commit vor."""
     if not is_auto_indexing_enabled():
         return
 
-    client = _get_meilisearch_client()
-    if not client:
+    if _buffer.bulk is not None:
+        _buffer.bulk.add(entity_type, doc_id, deleted)
         return
 
+    changes = _IndexChanges()
+    changes.add(entity_type, doc_id, deleted)
+    _schedule(changes)
+
+
+@contextmanager
+def bulk_indexing():
+    """
+    Bündelt die Indexierung aller Änderungen innerhalb des Blocks.
+
+    Für Skripte, die viele Objekte ohne umschließende Transaktion speichern:
+
+        with bulk_indexing():
+            for paper in papers:
+                paper.save()
+    """
+    if not _buffer.depth:
+        _buffer.bulk = _IndexChanges()
+    _buffer.depth += 1
     try:
-        index = client.index(index_name)
-        index.delete_document(doc_id)
-        logger.debug(f"Dokument gelöscht: {index_name}/{doc_id}")
-    except Exception as e:
-        logger.warning(f"Löschung fehlgeschlagen für {index_name}/{doc_id}: {e}")
+        yield
+    finally:
+        _buffer.depth -= 1
+        if not _buffer.depth:
+            bulk, _buffer.bulk = _buffer.bulk, None
+            if bulk:
+                _schedule(bulk)
 
 
 # =============================================================================
@@ -173,53 +295,49 @@ def _delete_document(index_name: str, doc_id: str):
 @receiver(post_save, sender=OParlPaper)
 def index_paper(sender, instance, **kwargs):
     """Indexiert einen Vorgang nach dem Speichern."""
-    doc = _paper_to_doc(instance)
-    _index_document("papers", str(instance.id), doc)
+    _mark_dirty("paper", str(instance.id))
 
 
 @receiver(post_delete, sender=OParlPaper)
 def delete_paper(sender, instance, **kwargs):
     """Löscht einen Vorgang aus dem Index."""
-    _delete_document("papers", str(instance.id))
+    _mark_dirty("paper", str(instance.id), deleted=True)
 
 
 @receiver(post_save, sender=OParlMeeting)
 def index_meeting(sender, instance, **kwargs):
     """Indexiert eine Sitzung nach dem Speichern."""
-    doc = _meeting_to_doc(instance)
-    _index_document("meetings", str(instance.id), doc)
+    _mark_dirty("meeting", str(instance.id))
 
 
 @receiver(post_delete, sender=OParlMeeting)
 def delete_meeting(sender, instance, **kwargs):
     """Löscht eine Sitzung aus dem Index."""
-    _delete_document("meetings", str(instance.id))
+    _mark_dirty("meeting", str(instance.id), deleted=True)
 
 
 @receiver(post_save, sender=OParlPerson)
 def index_person(sender, instance, **kwargs):
     """Indexiert eine Person nach dem Speichern."""
-    doc = _person_to_doc(instance)
-    _index_document("persons", str(instance.id), doc)
+    _mark_dirty("person", str(instance.id))
 
 
 @receiver(post_delete, sender=OParlPerson)
 def delete_person(sender, instance, **kwargs):
     """Löscht eine Person aus dem Index."""
-    _delete_document("persons", str(instance.id))
+    _mark_dirty("person", str(instance.id), deleted=True)
 
 
 @receiver(post_save, sender=OParlOrganization)
 def index_organization(sender, instance, **kwargs):
     """Indexiert ein Gremium nach dem Speichern."""
-    doc = _organization_to_doc(instance)
-    _index_document("organizations", str(instance.id), doc)
+    _mark_dirty("organization", str(instance.id))
 
 
 @receiver(post_delete, sender=OParlOrganization)
 def delete_organization(sender, instance, **kwargs):
     """Löscht ein Gremium aus dem Index."""
-    _delete_document("organizations", str(instance.id))
+    _mark_dirty("organization", str(instance.id), deleted=True)
 
 
 @receiver(post_save, sender=OParlFile)
@@ -227,17 +345,18 @@ def index_file(sender, instance, **kwargs):
     """
     Indexiert eine Datei nach dem Speichern.
 
-    Nur wenn text_content vorhanden ist.
+    Nur wenn text_content vorhanden ist. Ist text_content nicht geladen
+    (OParlManager stellt es zurück), wird es nicht per Query nachgeladen:
+    update_search_index indexiert ohnehin nur Dateien mit Text.
     """
     # Nur indexieren wenn Text vorhanden
-    if not instance.text_content:
+    if "text_content" not in instance.get_deferred_fields() and not instance.text_content:
         return
 
-    doc = _file_to_doc(instance)
-    _index_document("files", str(instance.id), doc)
+    _mark_dirty("file", str(instance.id))
 
 
 @receiver(post_delete, sender=OParlFile)
 def delete_file(sender, instance, **kwargs):
     """Löscht eine Datei aus dem Index."""
-    _delete_document("files", str(instance.id))
+    _mark_dirty("file", str(instance.id), deleted=True)
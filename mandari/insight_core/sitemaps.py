@@ -2,9 +2,10 @@
 Sitemap-Generierung für Mandari Insight.
 
 Hierarchische Sitemap-Struktur:
-/sitemap.xml                           (Index)
-├── /sitemap-pages.xml                 (Statische Seiten)
-└── /sitemap-insight-<body-slug>.xml   (Pro Kommune)
+/sitemap.xml                                   (Index)
+├── /sitemap-pages.xml                         (Statische Seiten)
+└── /sitemap-insight-<body-slug>.xml           (Pro Kommune, Datei 1)
+    /sitemap-insight-<body-slug>-seite-<n>.xml (Pro Kommune, Datei n)
     ├── Vorgänge (Papers)
     ├── Termine (Meetings)
     ├── Gremien (Organizations)
@@ -13,10 +14,20 @@ Hierarchische Sitemap-Struktur:
 
 from __future__ import annotations
 
+import math
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from functools import cached_property
+
 from django.contrib.sitemaps import Sitemap
+from django.core.cache import cache
+from django.db import models
+from django.db.models import Max
 from django.urls import reverse
 
 from .models import (
+    BodyStatistics,
     OParlBody,
     OParlMeeting,
     OParlOrganization,
@@ -86,156 +97,169 @@ class BodyListSitemap(Sitemap):
         return body.updated_at
 
 
-class BaseMunicipalSitemap(Sitemap):
-    """Basisklasse für kommunenspezifische Sitemaps."""
-
-    changefreq = "monthly"
-    priority = 0.5
-    protocol = "https"
-    limit = 50000  # Google-Limit pro Sitemap
-
-    def __init__(self, body_slug: str):
-        """
-        Initialisiert die Sitemap für eine Kommune.
-
-        Args:
-            body_slug: Slug der Kommune
-        """
-        self.body_slug = body_slug
-        self._body = None
-        super().__init__()
-
-    @property
-    def body(self) -> OParlBody | None:
-        """Lazy-Loading der Kommune."""
-        if self._body is None:
-            try:
-                self._body = OParlBody.objects.get(slug=self.body_slug)
-            except OParlBody.DoesNotExist:
-                return None
-        return self._body
-
-
-class PaperSitemap(BaseMunicipalSitemap):
-    """Sitemap für Vorgänge einer Kommune."""
+# =============================================================================
+# Kommunen-Sitemaps (gestreamt)
+# =============================================================================
 
-    changefreq = "monthly"
-    priority = 0.6
+# Maximale URLs pro Sitemap-Datei (Limit des Sitemap-Protokolls)
+SITEMAP_URL_LIMIT = 50000
 
-    def items(self):
-        """Gibt alle Papers der Kommune zurück."""
-        if not self.body:
-            return []
-        return OParlPaper.objects.filter(body=self.body).order_by("-date", "-oparl_created")[: self.limit]
-
-    def location(self, paper):
-        """Gibt die URL für einen Vorgang zurück."""
-        return f"/insight/vorgaenge/{paper.id}/"
-
-    def lastmod(self, paper):
-        """Gibt das letzte Änderungsdatum zurück."""
-        return paper.oparl_modified or paper.updated_at
-
-
-class MeetingSitemap(BaseMunicipalSitemap):
-    """Sitemap für Sitzungen einer Kommune."""
+# URLs pro Datei laut BodyStatistics. Der Rest bis SITEMAP_URL_LIMIT nimmt
+# Zeilen auf, die seit der letzten Statistik-Aktualisierung hinzukamen
+SITEMAP_URLS_PER_PAGE = 45000
 
-    changefreq = "weekly"
-    priority = 0.7
-
-    def items(self):
-        """Gibt alle Meetings der Kommune zurück."""
-        if not self.body:
-            return []
-        return OParlMeeting.objects.filter(body=self.body).order_by("-start")[: self.limit]
+# Zeilen pro Datenbank-Fetch beim Streamen
+SITEMAP_CHUNK_SIZE = 2000
 
-    def location(self, meeting):
-        """Gibt die URL für eine Sitzung zurück."""
-        return f"/insight/termine/{meeting.id}/"
-
-    def lastmod(self, meeting):
-        """Gibt das letzte Änderungsdatum zurück."""
-        return meeting.oparl_modified or meeting.updated_at
+# Gültigkeit der gecachten Änderungszeit einer Kommune (Sekunden)
+LASTMOD_CACHE_TTL = 24 * 60 * 60
 
 
-class OrganizationSitemap(BaseMunicipalSitemap):
-    """Sitemap für Gremien einer Kommune."""
+@dataclass(frozen=True)
+class SitemapSection:
+    """Eine Entitätsart in den Kommunen-Sitemaps."""
 
-    changefreq = "monthly"
-    priority = 0.5
+    model: type[models.Model]
+    path: str
+    changefreq: str
+    priority: float
+    # Feld in BodyStatistics mit der Anzahl der Entitäten
+    count_field: str
 
-    def items(self):
-        """Gibt alle Organizations der Kommune zurück."""
-        if not self.body:
-            return []
-        return OParlOrganization.objects.filter(body=self.body).order_by("name")[: self.limit]
 
-    def location(self, org):
-        """Gibt die URL für ein Gremium zurück."""
-        return f"/insight/gremien/{org.id}/"
-
-    def lastmod(self, org):
-        """Gibt das letzte Änderungsdatum zurück."""
-        return org.oparl_modified or org.updated_at
-
-
-class PersonSitemap(BaseMunicipalSitemap):
-    """Sitemap für Personen einer Kommune."""
-
-    changefreq = "monthly"
-    priority = 0.4
-
-    def items(self):
-        """Gibt alle Persons der Kommune zurück."""
-        if not self.body:
-            return []
-        return OParlPerson.objects.filter(body=self.body).order_by("family_name", "given_name")[: self.limit]
+SITEMAP_SECTIONS = (
+    SitemapSection(OParlPaper, "/insight/vorgaenge/", "monthly", 0.6, "papers_total"),
+    SitemapSection(OParlMeeting, "/insight/termine/", "weekly", 0.7, "meetings_total"),
+    SitemapSection(OParlOrganization, "/insight/gremien/", "monthly", 0.5, "organizations_total"),
+    SitemapSection(OParlPerson, "/insight/personen/", "monthly", 0.4, "persons_total"),
+)
 
-    def location(self, person):
-        """Gibt die URL für eine Person zurück."""
-        return f"/insight/personen/{person.id}/"
 
-    def lastmod(self, person):
-        """Gibt das letzte Änderungsdatum zurück."""
-        return person.oparl_modified or person.updated_at
+def format_lastmod(value: datetime) -> str:
+    """Formatiert einen Zeitpunkt für <lastmod> (UTC)."""
+    return value.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%S+00:00")
 
 
-def get_all_sitemaps() -> dict[str, Sitemap]:
+class BodySitemap:
     """
-    Gibt alle Sitemaps für die Django Sitemap-Registry zurück.
-
-    Returns:
-        Dict mit Sitemap-Name → Sitemap-Instanz
+    Sitemap-Dateien einer Kommune.
+
+    Alle Vorgänge, Sitzungen, Gremien und Personen werden hintereinander
+    auf nummerierte Dateien mit je SITEMAP_URLS_PER_PAGE URLs verteilt.
+    Die Aufteilung folgt den Zählern aus BodyStatistics; die Datei mit dem
+    Ende eines Abschnitts enthält dessen Zeilen bis zum tatsächlichen Ende
+    der Tabelle (höchstens SITEMAP_URL_LIMIT URLs pro Datei), damit seit der
+    letzten Aktualisierung neue Zeilen nicht fehlen. Ohne BodyStatistics-Zeile
+    werden die Entitäten gezählt. Die Zeilen werden als (id, oparl_modified,
+    updated_at) per serverseitigem Cursor gelesen und als XML gestreamt.
     """
-    sitemaps = {
-        "static": StaticPagesSitemap,
-        "bodies": BodyListSitemap,
-    }
 
-    # Dynamisch Sitemaps für jede Kommune hinzufügen
-    for body in OParlBody.objects.filter(slug__isnull=False):
-        slug = body.slug
-        sitemaps[f"papers-{slug}"] = PaperSitemap(slug)
-        sitemaps[f"meetings-{slug}"] = MeetingSitemap(slug)
-        sitemaps[f"organizations-{slug}"] = OrganizationSitemap(slug)
-        sitemaps[f"persons-{slug}"] = PersonSitemap(slug)
+    def __init__(self, body: OParlBody, site_url: str):
+        """
+        Initialisiert die Sitemap.
 
-    return sitemaps
+        Args:
+            body: Kommune
+            site_url: Basis-URL der Website (ohne abschließenden Slash)
+        """
+        self.body = body
+        self.site_url = site_url
+        self.statistics = BodyStatistics.for_body(body)
 
+    @property
+    def has_statistics(self) -> bool:
+        """Ob für die Kommune eine BodyStatistics-Zeile gespeichert ist."""
+        # for_body() liefert sonst eine ungespeicherte Instanz (pk ist body_id)
+        return not self.statistics._state.adding
+
+    @cached_property
+    def counts(self) -> list[int]:
+        """Anzahl der Entitäten pro Abschnitt (aus BodyStatistics, sonst gezählt)."""
+        if not self.has_statistics:
+            return [section.model.objects.filter(body=self.body).count() for section in SITEMAP_SECTIONS]
+        return [getattr(self.statistics, section.count_field) for section in SITEMAP_SECTIONS]
 
-def get_body_sitemap(body_slug: str) -> dict[str, Sitemap]:
-    """
-    Gibt alle Sitemaps für eine Kommune zurück.
+    @property
+    def page_count(self) -> int:
+        """Anzahl der Sitemap-Dateien (mindestens eine)."""
+        return max(1, math.ceil(sum(self.counts) / SITEMAP_URLS_PER_PAGE))
 
-    Args:
-        body_slug: Slug der Kommune
+    @cached_property
+    def lastmod(self) -> datetime:
+        """
+        Letzte Änderung einer Entität der Kommune.
 
-    Returns:
-        Dict mit Sitemap-Name → Sitemap-Instanz
-    """
-    return {
-        "papers": PaperSitemap(body_slug),
-        "meetings": MeetingSitemap(body_slug),
-        "organizations": OrganizationSitemap(body_slug),
-        "persons": PersonSitemap(body_slug),
-    }
+        Wird pro Statistik-Stand gecacht: nach jedem Sync berechnet der
+        Ingestor die Statistik neu und damit auch diesen Wert. Ohne
+        Statistik gilt der Wert bis LASTMOD_CACHE_TTL.
+        """
+        version = self.statistics.computed_at.timestamp() if self.has_statistics else "none"
+        key = f"sitemap:lastmod:{self.body.id}:{version}"
+        lastmod = cache.get(key)
+        if lastmod is None:
+            values = [
+                section.model.objects.filter(body=self.body).aggregate(lastmod=Max("updated_at"))["lastmod"]
+                for section in SITEMAP_SECTIONS
+            ]
+            lastmod = max([value for value in values if value], default=self.body.updated_at)
+            cache.set(key, lastmod, LASTMOD_CACHE_TTL)
+        return lastmod
+
+    def etag(self, page: int) -> str:
+        """ETag einer Sitemap-Datei (ändert sich mit jeder Änderung der Kommune)."""
+        return f'"{self.body.id}-{page}-{int(self.lastmod.timestamp())}-{sum(self.counts)}"'
+
+    def stream(self, page: int) -> Iterator[str]:
+        """
+        Erzeugt das XML einer Sitemap-Datei stückweise.
+
+        Args:
+            page: Nummer der Datei (ab 1)
+        """
+        yield '<?xml version="1.0" encoding="UTF-8"?>\n'
+        yield '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+
+        # Position der Datei in der Gesamtliste aller URLs der Kommune
+        start = (page - 1) * SITEMAP_URLS_PER_PAGE
+        stop = start + SITEMAP_URLS_PER_PAGE
+        offset = 0
+        # Bisher geschriebene URLs dieser Datei (offene Abschnitte können mehr
+        # Zeilen liefern als gezählt)
+        written = 0
+        for section, count in zip(SITEMAP_SECTIONS, self.counts):
+            end = offset + count
+            # Die Datei mit dem Abschnittsende liest bis zum Tabellenende (Zähler evtl. veraltet),
+            # aber nie über SITEMAP_URL_LIMIT URLs pro Datei hinaus
+            open_end = page == max(1, math.ceil(end / SITEMAP_URLS_PER_PAGE))
+            section_start = max(start - offset, 0)
+            section_stop = section_start + SITEMAP_URL_LIMIT - written
+            if not open_end:
+                section_stop = min(section_stop, stop - offset, count)
+            offset = end
+            if section_start >= section_stop:
+                continue
+
+            rows = (
+                section.model.objects.filter(body=self.body)
+                .order_by("id")
+                .values_list("id", "oparl_modified", "updated_at")[section_start:section_stop]
+            )
+            parts = []
+            for entity_id, oparl_modified, updated_at in rows.iterator(chunk_size=SITEMAP_CHUNK_SIZE):
+                written += 1
+                lastmod = oparl_modified or updated_at
+                parts.append(
+                    f"  <url>\n"
+                    f"    <loc>{self.site_url}{section.path}{entity_id}/</loc>\n"
+                    + (f"    <lastmod>{format_lastmod(lastmod)}</lastmod>\n" if lastmod else "")
+                    + f"    <changefreq>{section.changefreq}</changefreq>\n"
+                    f"    <priority>{section.priority}</priority>\n"
+                    f"  </url>\n"
+                )
+                if len(parts) >= SITEMAP_CHUNK_SIZE:
+                    yield "".join(parts)
+                    parts = []
+            if parts:
+                yield "".join(parts)
+
+        yield "</urlset>\n"
@@ -0,0 +1,67 @@
+"""
+Django 6.0 Background Tasks für Insight Core.
+
+- update_search_index: Überträgt gesammelte Änderungen an OParl-Modellen
+  gebündelt nach Meilisearch (eingereiht von insight_core.signals)
+"""
+
+import logging
+from typing import Any
+
+from django.tasks import task
+
+logger = logging.getLogger(__name__)
+
+
+@task
+def update_search_index(
+    upserts: dict[str, list[str]],
+    deletes: dict[str, list[str]] | None = None,
+) -> dict[str, Any]:
+    """
+    Indexiert bzw. entfernt Entitäten gebündelt in Meilisearch.
+
+    Args:
+        upserts: Entitätstyp -> UUIDs gespeicherter Entitäten
+        deletes: Entitätstyp -> UUIDs gelöschter Entitäten
+
+    Returns:
+        Dict mit indexierten und gelöschten Dokumenten pro Entitätstyp
+    """
+    from .services.search_cache import search_cache
+    from .services.search_indexing import INDEX_SPECS, SUGGESTION_TYPES, index_entities
+    from .services.search_service import INDEX_SUGGESTIONS
+    from .signals import _get_meilisearch_client
+
+    client = _get_meilisearch_client()
+    if not client:
+        return {"indexed": {}, "deleted": {}}
+
+    indexed: dict[str, int] = {}
+    for entity_type, ids in upserts.items():
+        try:
+            indexed[entity_type] = index_entities(entity_type, ids, client=client)
+        except Exception as e:
+            logger.warning(f"Indexierung von {len(ids)} {entity_type} fehlgeschlagen: {e}")
+
+    deleted: dict[str, int] = {}
+    for entity_type, ids in (deletes or {}).items():
+        spec = INDEX_SPECS[entity_type]
+        # Nach einem Rollback existieren "gelöschte" Zeilen noch - nicht entfernen
+        existing = {str(pk) for pk in spec.model.objects.filter(id__in=ids).values_list("id", flat=True)}
+        doc_ids = [doc_id for doc_id in ids if doc_id not in existing]
+        if not doc_ids:
+            continue
+        try:
+            client.index(spec.index_name).delete_documents(doc_ids)
+            if entity_type in SUGGESTION_TYPES:
+                client.index(INDEX_SUGGESTIONS).delete_documents([f"{entity_type}-{doc_id}" for doc_id in doc_ids])
+            deleted[entity_type] = len(doc_ids)
+        except Exception as e:
+            logger.warning(f"Löschung von {len(doc_ids)} {entity_type} fehlgeschlagen: {e}")
+
+    if deleted:
+        # Kommune gelöschter Entitäten ist nicht mehr bekannt
+        search_cache.invalidate_all()
+
+    return {"indexed": indexed, "deleted": deleted}
@@ -49,6 +49,7 @@ insight_patterns = [
     # Suche
     path("suche/", views.SearchView.as_view(), name="search"),
     path("suche/partials/results/", views.search_results, name="search_results"),
+    path("suche/partials/suggestions/", views.search_suggestions, name="search_suggestions"),
     # Karte
     path("karte/", views.MapView.as_view(), name="map"),
     path("karte/partials/markers/", views.map_markers, name="map_markers"),
@@ -71,6 +72,11 @@ urlpatterns = [
     path("robots.txt", views.robots_txt, name="robots_txt"),
     path("sitemap.xml", views.sitemap_index, name="sitemap_index"),
     path("sitemap-pages.xml", views.static_sitemap, name="static_sitemap"),
+    path(
+        "sitemap-insight-<slug:body_slug>-seite-<int:page>.xml",
+        views.body_sitemap,
+        name="body_sitemap_page",
+    ),
     path("sitemap-insight-<slug:body_slug>.xml", views.body_sitemap, name="body_sitemap"),
     # Landingpage (Marketing)
     path("", views.HomeView.as_view(), name="home"),
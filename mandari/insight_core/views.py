@@ -17,6 +17,7 @@ from django.views.decorators.http import require_GET, require_POST
 from django.views.generic import DetailView, ListView, TemplateView
 
 from .models import (
+    BodyStatistics,
     OParlAgendaItem,
     OParlBody,
     OParlMeeting,
@@ -67,12 +68,13 @@ class HomeView(TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
 
-        # Globale Statistiken für die Landingpage
+        # Globale Statistiken für die Landingpage (vorberechnet)
+        totals = BodyStatistics.totals()
         context["stats"] = {
             "bodies": OParlBody.objects.count(),
-            "organizations": OParlOrganization.objects.count(),
-            "persons": OParlPerson.objects.count(),
-            "papers": OParlPaper.objects.count(),
+            "organizations": totals["organizations_total"],
+            "persons": totals["persons_total"],
+            "papers": totals["papers_total"],
         }
 
         # Verfügbare Kommunen für die Landingpage
@@ -104,24 +106,26 @@ class PortalHomeView(TemplateView):
         context["all_bodies_mode"] = all_bodies_mode
 
         if all_bodies_mode:
-            # Alle Kommunen Übersicht
+            # Alle Kommunen Übersicht (vorberechnet)
+            totals = BodyStatistics.totals()
             context["stats"] = {
                 "bodies": OParlBody.objects.count(),
-                "organizations": OParlOrganization.objects.count(),
-                "persons": OParlPerson.objects.count(),
-                "meetings": OParlMeeting.objects.count(),
-                "papers": OParlPaper.objects.count(),
+                "organizations": totals["organizations_total"],
+                "persons": totals["persons_total"],
+                "meetings": totals["meetings_total"],
+                "papers": totals["papers_total"],
             }
             context["upcoming_meetings"] = None
             context["recent_papers"] = None
 
         elif body:
-            # Statistiken für die aktive Kommune
+            # Statistiken für die aktive Kommune (vorberechnet)
+            statistics = BodyStatistics.for_body(body)
             context["stats"] = {
-                "organizations": OParlOrganization.objects.filter(body=body).count(),
-                "persons": OParlPerson.objects.filter(body=body).count(),
-                "meetings": OParlMeeting.objects.filter(body=body).count(),
-                "papers": OParlPaper.objects.filter(body=body).count(),
+                "organizations": statistics.organizations_total,
+                "persons": statistics.persons_total,
+                "meetings": statistics.meetings_total,
+                "papers": statistics.papers_total,
             }
 
             # Nächste Sitzungen
@@ -425,8 +429,8 @@ class PaperDetailView(DetailView):
         context = super().get_context_data(**kwargs)
         paper = self.object
 
-        # Alle Dateien
-        files = paper.files.all()
+        # Alle Dateien (mit extrahiertem Text, der sonst zurückgestellt ist)
+        files = paper.files.with_deferred("text_content")
         context["files"] = files
 
         # Dateien mit extrahiertem Text für Rohtext-Tab
@@ -916,6 +920,33 @@ def search_results(request):
         )
 
 
+@require_GET
+def search_suggestions(request):
+    """
+    HTMX Endpoint für Suchvorschläge beim Tippen.
+
+    Nutzt den kleinen Vorschlags-Index (nur Titel und Aktenzeichen von
+    Vorgängen, Sitzungen, Personen und Gremien) statt der Volltextsuche.
+    """
+    query = request.GET.get("q", "").strip()
+    if len(query) < 2:
+        return render(request, "partials/search_suggestions.html", {"suggestions": [], "query": query})
+
+    from .services.search_service import format_suggestion, get_search_service
+
+    body = get_active_body(request)
+    hits = get_search_service().suggest(query, body_id=str(body.id) if body else None)
+
+    return render(
+        request,
+        "partials/search_suggestions.html",
+        {
+            "suggestions": [format_suggestion(hit) for hit in hits],
+            "query": query,
+        },
+    )
+
+
 # =============================================================================
 # Karte
 # =============================================================================
@@ -1690,15 +1721,22 @@ def sitemap_index(request):
         {"loc": f"{site_url}/sitemap-pages.xml", "lastmod": now},
     ]
 
-    # Kommune-spezifische Sitemaps
-    for body in OParlBody.objects.filter(slug__isnull=False):
-        lastmod = body.updated_at.strftime("%Y-%m-%dT%H:%M:%S+00:00") if body.updated_at else now
-        sitemaps.append(
-            {
-                "loc": f"{site_url}/sitemap-insight-{body.slug}.xml",
-                "lastmod": lastmod,
-            }
-        )
+    # Kommune-spezifische Sitemaps (eine Datei pro 50.000 URLs); Kommunen
+    # ohne Statistik sind noch nicht synchronisiert und werden übersprungen
+    from .sitemaps import BodySitemap, format_lastmod
+
+    bodies = OParlBody.objects.filter(slug__isnull=False, statistics__isnull=False).select_related("statistics")
+    for body in bodies:
+        body_sitemap = BodySitemap(body, site_url)
+        lastmod = format_lastmod(body_sitemap.lastmod) if body_sitemap.lastmod else now
+        for page in range(1, body_sitemap.page_count + 1):
+            suffix = f"-seite-{page}" if page > 1 else ""
+            sitemaps.append(
+                {
+                    "loc": f"{site_url}/sitemap-insight-{body.slug}{suffix}.xml",
+                    "lastmod": lastmod,
+                }
+            )
 
     # XML generieren
     xml_parts = ['<?xml version="1.0" encoding="UTF-8"?>']
@@ -1747,69 +1785,42 @@ def static_sitemap(request):
 
 
 @require_GET
-def body_sitemap(request, body_slug):
+def body_sitemap(request, body_slug, page=1):
     """
-    Generiert die Sitemap für eine Kommune.
+    Generiert eine Sitemap-Datei für eine Kommune.
 
-    Enthält alle Vorgänge, Sitzungen, Gremien und Personen.
+    Enthält Vorgänge, Sitzungen, Gremien und Personen, aufgeteilt auf
+    Dateien mit je 50.000 URLs. Das XML wird gestreamt; ETag und
+    Last-Modified erlauben Crawlern bedingte Anfragen (304).
     """
     from django.conf import settings
-    from django.http import Http404
+    from django.http import Http404, StreamingHttpResponse
+    from django.utils.cache import get_conditional_response
+    from django.utils.http import http_date
+
+    from .sitemaps import BodySitemap
 
     site_url = getattr(settings, "SITE_URL", "https://mandari.de")
 
     try:
-        body = OParlBody.objects.get(slug=body_slug)
+        body = OParlBody.objects.select_related("statistics").get(slug=body_slug)
     except OParlBody.DoesNotExist:
         raise Http404("Kommune nicht gefunden")
 
-    # XML generieren
-    xml_parts = ['<?xml version="1.0" encoding="UTF-8"?>']
-    xml_parts.append('<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">')
-
-    def add_url(loc, lastmod=None, changefreq="monthly", priority=0.5):
-        xml_parts.append("  <url>")
-        xml_parts.append(f"    <loc>{site_url}{loc}</loc>")
-        if lastmod:
-            xml_parts.append(f"    <lastmod>{lastmod.strftime('%Y-%m-%dT%H:%M:%S+00:00')}</lastmod>")
-        xml_parts.append(f"    <changefreq>{changefreq}</changefreq>")
-        xml_parts.append(f"    <priority>{priority}</priority>")
-        xml_parts.append("  </url>")
+    sitemap = BodySitemap(body, site_url)
+    if page < 1 or page > sitemap.page_count:
+        raise Http404("Sitemap-Seite nicht gefunden")
 
-    # Vorgänge (max 10000 pro Sitemap für Performance)
-    for paper in OParlPaper.objects.filter(body=body).order_by("-date")[:10000]:
-        add_url(
-            f"/insight/vorgaenge/{paper.id}/",
-            paper.oparl_modified or paper.updated_at,
-            "monthly",
-            0.6,
-        )
+    etag = sitemap.etag(page)
+    last_modified = int(sitemap.lastmod.timestamp()) if sitemap.lastmod else None
 
-    # Sitzungen
-    for meeting in OParlMeeting.objects.filter(body=body).order_by("-start")[:10000]:
-        add_url(
-            f"/insight/termine/{meeting.id}/",
-            meeting.oparl_modified or meeting.updated_at,
-            "weekly",
-            0.7,
-        )
-
-    # Gremien
-    for org in OParlOrganization.objects.filter(body=body).order_by("name")[:5000]:
-        add_url(f"/insight/gremien/{org.id}/", org.oparl_modified or org.updated_at, "monthly", 0.5)
-
-    # Personen
-    for person in OParlPerson.objects.filter(body=body).order_by("family_name")[:5000]:
-        add_url(
-            f"/insight/personen/{person.id}/",
-            person.oparl_modified or person.updated_at,
-            "monthly",
-            0.4,
-        )
-
-    xml_parts.append("</urlset>")
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = StreamingHttpResponse(sitemap.stream(page), content_type="application/xml; charset=utf-8")
 
-    response = HttpResponse("\n".join(xml_parts), content_type="application/xml; charset=utf-8")
+    response["ETag"] = etag
+    if last_modified:
+        response["Last-Modified"] = http_date(last_modified)
 
     # Cache für 24 Stunden
     response["Cache-Control"] = "public, max-age=86400"
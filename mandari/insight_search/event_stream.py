@@ -0,0 +1,112 @@
+"""
+Lesen der Redis-Streams des Ingestors über eine Consumer Group.
+
+Synchrones Gegenstück zu EventStreamReader des Ingestors (ingestor/src/events.py),
+das als eigenes Paket nicht von Django importiert werden kann. Ein Eintrag
+bleibt ausstehend (Pending-Liste der Gruppe), bis er bestätigt ist: ein
+Consumer, der unter demselben Namen neu startet, liest zuerst seine
+unbestätigten Einträge erneut, und Einträge abgestürzter Consumer lassen
+sich mit claim_stale() übernehmen.
+
+Verwendung:
+    reader = EventStreamReader(client, "mandari:entities", "search-indexer", "indexer-1")
+    reader.ensure_group()
+    reader.claim_stale(min_idle_ms=60_000)
+    while True:
+        entries = reader.read(block_ms=1000)
+        for message_id, data in entries:
+            ...  # data: JSON-Event, None bei getrimmten Einträgen
+        reader.ack([message_id for message_id, _ in entries])
+"""
+
+# Feld eines Stream-Eintrags mit dem JSON-Event (ingestor: events.STREAM_FIELD)
+STREAM_FIELD = "event"
+
+
+class EventStreamReader:
+    """Liest einen Stream über eine Consumer Group (XREADGROUP, XAUTOCLAIM, XACK)."""
+
+    def __init__(self, client, stream: str, group: str, consumer: str, count: int = 1000):
+        """
+        Initialisiert den Reader.
+
+        Args:
+            client: redis.Redis mit decode_responses=True
+            stream: Stream-Key (z.B. mandari:entities)
+            group: Consumer Group (eine pro Art von Dienst)
+            consumer: Name dieser Instanz, über Neustarts stabil
+            count: Maximale Einträge pro Aufruf
+        """
+        self.client = client
+        self.stream = stream
+        self.group = group
+        self.consumer = consumer
+        self.count = count
+        # Position in den eigenen unbestätigten Einträgen; None, sobald sie
+        # gelesen sind und nur noch neue Einträge (">") abgefragt werden
+        self._pending_from: str | None = "0"
+
+    def ensure_group(self):
+        """Legt Stream und Consumer Group an, falls nötig (neue Gruppen lesen ab Anfang)."""
+        import redis
+
+        try:
+            self.client.xgroup_create(self.stream, self.group, id="0", mkstream=True)
+        except redis.ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    def read(self, block_ms: int) -> list[tuple[str, str | None]]:
+        """
+        Liest die nächsten Einträge dieses Consumers.
+
+        Zuerst werden die eigenen unbestätigten Einträge geliefert, danach neue.
+
+        Args:
+            block_ms: Wartezeit auf neue Einträge in Millisekunden
+
+        Returns:
+            Liste von (message_id, JSON-Event oder None bei getrimmten Einträgen)
+        """
+        if self._pending_from is not None:
+            response = self.client.xreadgroup(
+                self.group, self.consumer, {self.stream: self._pending_from}, count=self.count
+            )
+            entries = response[0][1] if response else []
+            # Leere Antwort: alle unbestätigten Einträge gelesen
+            self._pending_from = entries[-1][0] if entries else None
+        else:
+            response = self.client.xreadgroup(
+                self.group, self.consumer, {self.stream: ">"}, count=self.count, block=block_ms
+            )
+            entries = response[0][1] if response else []
+        return [(message_id, (values or {}).get(STREAM_FIELD)) for message_id, values in entries]
+
+    def claim_stale(self, min_idle_ms: int) -> int:
+        """
+        Übernimmt Einträge, die andere Consumer gelesen, aber nicht bestätigt haben.
+
+        Die Einträge landen in der eigenen Pending-Liste und werden mit den
+        eigenen unbestätigten Einträgen gelesen (read() startet danach neu).
+
+        Returns:
+            Anzahl übernommener Einträge
+        """
+        claimed = 0
+        start_id = "0-0"
+        while True:
+            # [nächste Start-ID, Einträge, (gelöschte IDs - Redis 7)]
+            response = self.client.xautoclaim(
+                self.stream, self.group, self.consumer, min_idle_ms, start_id=start_id, count=self.count
+            )
+            start_id, entries = response[0], response[1]
+            claimed += len(entries)
+            if start_id == "0-0":
+                break
+        self._pending_from = "0"
+        return claimed
+
+    def ack(self, message_ids: list[str]):
+        """Bestätigt verarbeitete Einträge."""
+        if message_ids:
+            self.client.xack(self.stream, self.group, *message_ids)
@@ -0,0 +1,277 @@
+"""
+Django Management Command: index_events
+
+Inkrementelle Suchindexierung für Daten des Ingestors.
+
+Der Ingestor schreibt per SQLAlchemy direkt in die Datenbank, daher feuern
+die post_save-Signals aus insight_core.signals für synchronisierte Daten
+nicht. Dieser Command abonniert stattdessen den Redis-Kanal
+mandari:entities, sammelt die IDs geänderter Entitäten und indexiert sie
+gebündelt in Meilisearch - neue RIS-Daten sind so nach wenigen Sekunden
+auffindbar, ohne kompletten Reindex.
+
+Indexiert wird, sobald --batch-size IDs gesammelt sind oder die ältesten
+gesammelten IDs --flush-interval Sekunden alt sind. Schlägt die
+Indexierung fehl (z.B. Meilisearch nicht erreichbar), bleiben die IDs
+gepuffert und werden beim nächsten Flush erneut versucht.
+
+Mit --streams (Ingestor mit EVENTS_TRANSPORT=streams) wird statt Pub/Sub
+der gleichnamige Redis-Stream über eine Consumer Group gelesen
+(insight_search.event_stream.EventStreamReader). Events
+werden erst nach erfolgreicher Indexierung bestätigt (XACK): nach einem
+Neustart holt der Indexer verpasste Events nach, und mehrere Instanzen
+mit verschiedenen --consumer-Namen teilen sich die Arbeit. Beim Start
+übernimmt der Indexer (XAUTOCLAIM) unbestätigte Einträge, die seit
+--claim-idle Sekunden bei einem anderen Consumer liegen - etwa bei einer
+abgestürzten Instanz, deren Name sich geändert hat.
+
+Verwendung:
+    python manage.py index_events
+    python manage.py index_events --flush-interval 5 --batch-size 2000
+    python manage.py index_events --streams --consumer indexer-1
+"""
+
+import json
+import logging
+import signal
+import socket
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+
+from insight_core.services.search_indexing import INDEX_SPECS, index_entities
+from insight_search.event_stream import EventStreamReader
+
+logger = logging.getLogger(__name__)
+
+# Kanal, auf dem der Ingestor Entity-Events veröffentlicht (EventEmitter.CHANNEL_ENTITIES)
+CHANNEL_ENTITIES = "mandari:entities"
+
+# Event-Typen mit IDs geänderter Entitäten. Der Ingestor meldet jede
+# geschriebene Zeile per entity:batch (emit_entities_changed); entity:created
+# für neue Sitzungen/Vorlagen dient Benachrichtigungen und würde doppelt indexieren.
+ENTITY_EVENT_TYPES = {"entity:batch"}
+
+# Wartezeit vor erneutem Verbindungsaufbau zu Redis (Sekunden)
+RECONNECT_DELAY = 5
+
+
+class Command(BaseCommand):
+    help = "Indexiert vom Ingestor geänderte Entitäten laufend in Meilisearch (Redis-Events)"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._running = True
+        self._pending: dict[str, set[str]] = defaultdict(set)
+        self._pending_since: float | None = None
+        self._unacked: list[str] = []
+        self._indexed = 0
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--flush-interval",
+            type=float,
+            default=2.0,
+            help="Maximales Alter gesammelter IDs in Sekunden (default: 2)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Indexieren, sobald so viele IDs gesammelt sind (default: 1000)",
+        )
+        parser.add_argument(
+            "--channel",
+            type=str,
+            default=CHANNEL_ENTITIES,
+            help=f"Redis-Kanal bzw. -Stream der Entity-Events (default: {CHANNEL_ENTITIES})",
+        )
+        parser.add_argument(
+            "--streams",
+            action="store_true",
+            help="Redis-Stream über eine Consumer Group lesen statt Pub/Sub",
+        )
+        parser.add_argument(
+            "--group",
+            type=str,
+            default="search-indexer",
+            help="Consumer Group (nur mit --streams, default: search-indexer)",
+        )
+        parser.add_argument(
+            "--consumer",
+            type=str,
+            default=socket.gethostname(),
+            help="Name dieser Instanz in der Consumer Group, über Neustarts stabil (default: Hostname)",
+        )
+        parser.add_argument(
+            "--claim-idle",
+            type=float,
+            default=60.0,
+            help="Unbestätigte Einträge anderer Consumer übernehmen, die so viele Sekunden liegen (default: 60)",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            import redis
+        except ImportError:
+            raise CommandError("redis nicht installiert. Bitte 'pip install redis' ausführen.")
+
+        # Signal Handler für graceful shutdown
+        signal.signal(signal.SIGINT, self._signal_handler)
+        signal.signal(signal.SIGTERM, self._signal_handler)
+
+        client = redis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
+        source = (
+            f"Stream {options['channel']} (Gruppe {options['group']}, Consumer {options['consumer']})"
+            if options["streams"]
+            else f"Kanal {options['channel']}"
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Suchindexierung gestartet: {source}, "
+                f"Flush nach {options['flush_interval']}s oder {options['batch_size']} IDs"
+            )
+        )
+
+        while self._running:
+            try:
+                if options["streams"]:
+                    self._consume_stream(client, options)
+                else:
+                    self._listen(client, options)
+            except redis.ConnectionError as e:
+                self.stdout.write(self.style.ERROR(f"Redis-Verbindung verloren: {e}"))
+                self._sleep(RECONNECT_DELAY)
+
+        # Restliche IDs vor dem Beenden indexieren
+        self._flush()
+        self.stdout.write(self.style.SUCCESS(f"Suchindexierung beendet ({self._indexed} Dokumente indexiert)."))
+
+    def _signal_handler(self, signum, frame):
+        """Graceful shutdown bei SIGINT/SIGTERM."""
+        self.stdout.write("\n" + self.style.WARNING("Shutdown Signal empfangen..."))
+        self._running = False
+
+    def _sleep(self, seconds: float):
+        """Wartet in kleinen Schritten für responsives Shutdown."""
+        deadline = time.monotonic() + seconds
+        while self._running and time.monotonic() < deadline:
+            time.sleep(min(1.0, deadline - time.monotonic()))
+
+    # =========================================================================
+    # Pub/Sub
+    # =========================================================================
+
+    def _listen(self, client, options):
+        """Empfängt Events und indexiert gesammelte IDs, bis der Command beendet wird."""
+        pubsub = client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(options["channel"])
+        try:
+            while self._running:
+                # Kurzer Timeout, damit fällige Flushes auch ohne neue Events laufen
+                message = pubsub.get_message(timeout=min(1.0, options["flush_interval"]))
+                if message and message.get("type") == "message":
+                    self._collect(message["data"])
+
+                if self._flush_due(options):
+                    self._flush()
+        finally:
+            pubsub.close()
+
+    def _collect(self, data: str):
+        """Übernimmt die IDs eines Events in den Puffer."""
+        try:
+            event = json.loads(data)
+        except (TypeError, ValueError):
+            logger.warning(f"Ungültiges Event ignoriert: {data!r:.200}")
+            return
+
+        entity_type = event.get("entity_type")
+        if event.get("event_type") not in ENTITY_EVENT_TYPES or entity_type not in INDEX_SPECS:
+            return
+
+        # Batch-Events tragen UUIDs (emit_entities_changed) bzw. OParl-IDs
+        ids = [entity_id for entity_id in event.get("entity_ids") or [] if entity_id]
+        if not ids:
+            return
+
+        if self._pending_since is None:
+            self._pending_since = time.monotonic()
+        self._pending[entity_type].update(ids)
+
+    def _flush_due(self, options) -> bool:
+        """Prüft ob die gesammelten IDs indexiert werden sollen."""
+        if self._pending_since is None:
+            return False
+        pending = sum(len(ids) for ids in self._pending.values())
+        age = time.monotonic() - self._pending_since
+        return pending >= options["batch_size"] or age >= options["flush_interval"]
+
+    # =========================================================================
+    # Streams
+    # =========================================================================
+
+    def _consume_stream(self, client, options):
+        """
+        Liest den Stream über die Consumer Group, bis der Command beendet wird.
+
+        Zuerst werden liegengebliebene Einträge anderer Consumer übernommen
+        und eigene, noch nicht bestätigte Einträge gelesen (z.B. nach einem
+        Absturz), danach neue Einträge.
+        """
+        reader = EventStreamReader(
+            client, options["channel"], options["group"], options["consumer"], count=options["batch_size"]
+        )
+        reader.ensure_group()
+
+        claimed = reader.claim_stale(int(options["claim_idle"] * 1000))
+        if claimed:
+            self.stdout.write(f"{claimed} unbestätigte Einträge anderer Consumer übernommen")
+
+        # Nach einem Verbindungsabbruch werden unbestätigte Einträge erneut geliefert
+        self._unacked = []
+        while self._running:
+            for message_id, data in reader.read(block_ms=int(min(1.0, options["flush_interval"]) * 1000)):
+                # Getrimmte Einträge haben keine Werte mehr
+                if data is not None:
+                    self._collect(data)
+                self._unacked.append(message_id)
+
+            if self._flush_due(options) or (self._unacked and not self._pending):
+                self._flush()
+                self._ack(reader)
+
+        self._flush()
+        self._ack(reader)
+
+    def _ack(self, reader: EventStreamReader):
+        """Bestätigt gelesene Einträge, sobald ihre IDs vollständig indexiert sind."""
+        if self._unacked and not self._pending:
+            reader.ack(self._unacked)
+            self._unacked = []
+
+    # =========================================================================
+    # Indexierung
+    # =========================================================================
+
+    def _flush(self):
+        """Indexiert alle gesammelten IDs, ein Bulk-Load pro Entitätstyp."""
+        # Langlaufender Prozess: abgelaufene DB-Verbindungen vorher verwerfen
+        close_old_connections()
+        for entity_type in list(self._pending):
+            ids = self._pending[entity_type]
+            try:
+                count = index_entities(entity_type, ids)
+            except Exception as e:
+                # IDs bleiben im Puffer und werden beim nächsten Flush erneut versucht
+                self.stdout.write(self.style.ERROR(f"Indexierung {entity_type} fehlgeschlagen: {e}"))
+                continue
+
+            del self._pending[entity_type]
+            self._indexed += count
+            logger.info(f"{count} {entity_type} indexiert ({len(ids)} IDs)")
+
+        self._pending_since = time.monotonic() if self._pending else None
@@ -0,0 +1,237 @@
+"""
+Django Management Command: reindex_search
+
+Baut die Meilisearch-Indizes (papers, meetings, persons, organizations,
+files und den Vorschlags-Index suggestions) aus PostgreSQL neu auf.
+
+- Liest die Zeilen gestreamt (serverseitiger Cursor, nur benötigte Spalten)
+- Erzeugt die Dokumente mit den Konvertern aus insight_core.signals
+- Schickt Batches per add_documents, mehrere Indizes parallel
+- Wartet am Ende auf alle Meilisearch-Tasks und meldet Fehler
+
+Mit --swap wird in einen temporären Index geschrieben, der erst nach
+erfolgreichem Aufbau mit dem Live-Index getauscht wird (swap_indexes) -
+die Suche bleibt währenddessen vollständig verfügbar.
+
+Verwendung:
+    python manage.py reindex_search
+    python manage.py reindex_search --index papers --index files
+    python manage.py reindex_search --body https://oparl.example.org/body/1
+    python manage.py reindex_search --since 2026-01-01
+    python manage.py reindex_search --swap
+"""
+
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from insight_core.models import OParlBody
+from insight_core.services.search_cache import search_cache
+from insight_core.services.search_indexing import (
+    INDEX_SPECS,
+    SUGGESTION_TYPES,
+    iter_document_batches,
+    to_suggestion,
+)
+from insight_core.services.search_service import INDEX_SUGGESTIONS
+
+# Index-Name -> Entitätstypen, aus denen er aufgebaut wird
+INDEX_ENTITY_TYPES = {spec.index_name: (entity_type,) for entity_type, spec in INDEX_SPECS.items()}
+INDEX_ENTITY_TYPES[INDEX_SUGGESTIONS] = SUGGESTION_TYPES
+
+# Suffix der temporären Indizes im Swap-Modus
+SWAP_SUFFIX = "_reindex"
+
+# Maximale Wartezeit auf einen Meilisearch-Task (Millisekunden)
+TASK_TIMEOUT_MS = 30 * 60 * 1000
+
+
+class Command(BaseCommand):
+    help = "Baut die Meilisearch-Indizes aus der Datenbank neu auf"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--index",
+            action="append",
+            choices=sorted(INDEX_ENTITY_TYPES),
+            help="Nur diesen Index neu aufbauen (mehrfach möglich, default: alle)",
+        )
+        parser.add_argument(
+            "--body",
+            type=str,
+            help="Nur Entitäten dieser Kommune (UUID oder OParl-ID)",
+        )
+        parser.add_argument(
+            "--since",
+            type=str,
+            help="Nur seit diesem Zeitpunkt geänderte Entitäten (ISO-Datum oder -Zeitpunkt)",
+        )
+        parser.add_argument(
+            "--swap",
+            action="store_true",
+            help="In temporären Index schreiben und danach mit dem Live-Index tauschen",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Dokumente pro add_documents-Aufruf (default: 5000)",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=len(INDEX_ENTITY_TYPES),
+            help=f"Parallel aufgebaute Indizes (default: {len(INDEX_ENTITY_TYPES)})",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            import meilisearch
+        except ImportError:
+            raise CommandError("meilisearch nicht installiert. Bitte 'pip install meilisearch' ausführen.")
+
+        if options["swap"] and (options["body"] or options["since"]):
+            raise CommandError("--swap baut vollständige Indizes auf und ist nicht mit --body/--since kombinierbar")
+
+        body = self._get_body(options["body"]) if options["body"] else None
+        since = self._parse_since(options["since"]) if options["since"] else None
+        index_names = options["index"] or list(INDEX_ENTITY_TYPES)
+
+        url = getattr(settings, "MEILISEARCH_URL", "http://localhost:7700")
+        key = getattr(settings, "MEILISEARCH_KEY", "")
+        client = meilisearch.Client(url, key)
+        try:
+            client.health()
+        except Exception as e:
+            raise CommandError(f"Meilisearch Verbindungsfehler: {e}")
+
+        scope = []
+        if body:
+            scope.append(f"Kommune {body.get_display_name()}")
+        if since:
+            scope.append(f"geändert seit {since:%Y-%m-%d %H:%M}")
+        self.stdout.write(f"Reindexiere {', '.join(index_names)}" + (f" ({', '.join(scope)})" if scope else ""))
+
+        start = time.monotonic()
+        results = {}
+        with ThreadPoolExecutor(max_workers=max(1, options["workers"])) as executor:
+            futures = {
+                executor.submit(self._reindex, client, index_name, body, since, options): index_name
+                for index_name in index_names
+            }
+            for future in as_completed(futures):
+                index_name = futures[future]
+                try:
+                    results[index_name] = future.result()
+                    self.stdout.write(
+                        self.style.SUCCESS(f"  {index_name}: {results[index_name]:,} Dokumente indexiert")
+                    )
+                except Exception as e:
+                    self.stdout.write(self.style.ERROR(f"  {index_name}: fehlgeschlagen - {e}"))
+
+        # Gecachte Suchergebnisse verwerfen
+        if body:
+            search_cache.invalidate_bodies([str(body.id)])
+        else:
+            search_cache.invalidate_all()
+
+        failed = sorted(set(index_names) - set(results))
+        duration = time.monotonic() - start
+        if failed:
+            raise CommandError(f"Reindex fehlgeschlagen für: {', '.join(failed)} ({duration:.1f}s)")
+        self.stdout.write(self.style.SUCCESS(f"\n{sum(results.values()):,} Dokumente in {duration:.1f}s indexiert"))
+
+    def _get_body(self, value: str) -> OParlBody:
+        """Findet die Kommune per UUID oder OParl-ID."""
+        try:
+            lookup = {"id": uuid.UUID(value)}
+        except ValueError:
+            lookup = {"external_id": value}
+        try:
+            return OParlBody.objects.get(**lookup)
+        except OParlBody.DoesNotExist:
+            raise CommandError(f"Kommune nicht gefunden: {value}")
+
+    def _parse_since(self, value: str):
+        """Parst --since als Datum oder Zeitpunkt (ohne Zeitzone: lokale Zeit)."""
+        since = parse_datetime(value)
+        if since is None:
+            date = parse_date(value)
+            if date is None:
+                raise CommandError(f"Ungültiges Datum für --since: {value}")
+            since = datetime.combine(date, datetime.min.time())
+        if timezone.is_naive(since):
+            since = timezone.make_aware(since)
+        return since
+
+    # =========================================================================
+    # Reindex (läuft in einem Worker-Thread pro Index)
+    # =========================================================================
+
+    def _reindex(self, client, index_name: str, body, since, options) -> int:
+        """Baut einen Index auf und gibt die Anzahl der Dokumente zurück."""
+        target = f"{index_name}{SWAP_SUFFIX}" if options["swap"] else index_name
+        try:
+            if options["swap"]:
+                self._prepare_swap_index(client, index_name, target)
+
+            # Batches werden eingereiht, ohne auf die Verarbeitung zu warten
+            index = client.index(target)
+            task_uids = []
+            count = 0
+            for entity_type in INDEX_ENTITY_TYPES[index_name]:
+                queryset = INDEX_SPECS[entity_type].queryset()
+                if body:
+                    queryset = queryset.filter(body=body)
+                if since:
+                    queryset = queryset.filter(updated_at__gte=since)
+
+                for batch in iter_document_batches(entity_type, queryset, batch_size=options["batch_size"]):
+                    if index_name == INDEX_SUGGESTIONS:
+                        batch = [to_suggestion(doc) for doc in batch]
+                    task_uids.append(index.add_documents(batch, primary_key="id").task_uid)
+                    count += len(batch)
+
+            for task_uid in task_uids:
+                self._wait(client, task_uid)
+
+            if options["swap"]:
+                self._wait(client, client.swap_indexes([{"indexes": [index_name, target]}]).task_uid)
+                # Nach dem Tausch enthält der temporäre Index die alten Dokumente
+                self._wait(client, client.index(target).delete().task_uid)
+            return count
+        finally:
+            # Jeder Thread hat eine eigene DB-Verbindung
+            connection.close()
+
+    def _prepare_swap_index(self, client, index_name: str, target: str):
+        """Legt den temporären Index leer und mit den Einstellungen des Live-Index an."""
+        try:
+            self._wait(client, client.index(target).delete().task_uid)
+        except Exception:
+            pass  # Kein Rest eines abgebrochenen Laufs
+
+        # swap_indexes braucht zwei existierende Indizes
+        try:
+            index_settings = client.index(index_name).get_settings()
+        except Exception:
+            self._wait(client, client.create_index(index_name, {"primaryKey": "id"}).task_uid)
+            index_settings = None
+
+        self._wait(client, client.create_index(target, {"primaryKey": "id"}).task_uid)
+        if index_settings:
+            # Einstellungen vor den Dokumenten setzen, sonst indexiert Meilisearch zweimal
+            self._wait(client, client.index(target).update_settings(index_settings).task_uid)
+
+    def _wait(self, client, task_uid: int):
+        """Wartet auf einen Meilisearch-Task und wirft bei Fehlschlag."""
+        task = client.wait_for_task(task_uid, timeout_in_ms=TASK_TIMEOUT_MS, interval_in_ms=200)
+        if task.status != "succeeded":
+            raise RuntimeError(f"Meilisearch-Task {task_uid} {task.status}: {task.error}")
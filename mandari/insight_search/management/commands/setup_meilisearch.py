@@ -211,6 +211,28 @@ class Command(BaseCommand):
                     "body_id",
                 ],
             },
+            # Vorschläge beim Tippen: nur kurze Felder, Präfixsuche über Titel/Aktenzeichen
+            "suggestions": {
+                "searchableAttributes": [
+                    "reference",
+                    "name",
+                    "short_name",
+                ],
+                "filterableAttributes": [
+                    "body_id",
+                    "type",
+                ],
+                "displayedAttributes": [
+                    "entity_id",
+                    "type",
+                    "name",
+                    "reference",
+                    "short_name",
+                    "paper_type",
+                    "organization_type",
+                    "start",
+                ],
+            },
         }
 
     def _reset_index(self, client, index_name):
@@ -261,6 +261,8 @@ MEILISEARCH_AUTO_INDEX = os.environ.get("MEILISEARCH_AUTO_INDEX", "True").lower(
     "1",
     "yes",
 )
+# Lebensdauer gecachter Suchergebnisse in Sekunden (0 = Cache aus)
+SEARCH_CACHE_TTL = int(os.environ.get("SEARCH_CACHE_TTL", "60"))
 
 # Groq API (für KI-Features)
 GROQ_API_KEY = os.environ.get("GROQ_API_KEY", "")